@@ -0,0 +1,446 @@
+"""
+Offline bulk ingestion of a resume archive.
+
+Walks a directory, extracts text on a process pool and parses it with a
+bounded number of concurrent LLM calls, using the same two-stage pipeline
+as the API. Results are appended to a JSONL file of ``ResumeResponse``
+objects or saved to the configured storage backend, in small batches.
+Every finished file is then recorded in a checkpoint file, so an
+interrupted run started again with the same arguments skips what is done.
+Checkpoint lines also record the JSONL file's size after their batch, and a
+resumed run cuts the file back to it, dropping results written after the
+last checkpoint (those files are parsed again). Document IDs are derived
+from the file's path relative to the archive root, so a batch written twice
+after a crash replaces itself in storage.
+
+Usage:
+    python -m app.ingest archive/ --output data/ingest/resumes.jsonl --workers 4 --concurrency 16
+    python -m app.ingest archive/ --storage
+    python -m app.ingest archive/ --dry-run --limit 1000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, TextIO
+from app.models import ResumeResponse
+from app.services.pipeline import ExtractionPipeline
+from app.storage import create_storage
+from app.utils.logger import logger
+
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".doc"}
+# Namespace of the path-derived document IDs
+INGEST_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "resume-parser/ingest")
+
+
+def find_documents(root: str) -> List[str]:
+    """
+    List the resume files under a directory.
+
+    Args:
+        root: Archive directory
+
+    Returns:
+        Paths relative to ``root`` in a stable (sorted) order
+    """
+    found = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                path = os.path.join(directory, name)
+                found.append(os.path.relpath(path, root))
+    return found
+
+
+def document_id_for(relative_path: str) -> str:
+    """Returns the stable document ID of an archive file."""
+    return str(uuid.uuid5(INGEST_NAMESPACE, relative_path.replace(os.sep, "/")))
+
+
+def read_checkpoint(path: str) -> Dict[str, str]:
+    """
+    Load the finished files of earlier runs.
+
+    A partly written last line (from a crash) is ignored.
+
+    Args:
+        path: Checkpoint file (JSON lines with "path" and "status")
+
+    Returns:
+        Status ("done" or "failed") per relative path
+    """
+    finished: Dict[str, str] = {}
+    for record in _checkpoint_records(path):
+        if "path" in record:
+            finished[record["path"]] = record["status"]
+    return finished
+
+
+def checkpointed_output_bytes(path: str, output: str) -> Optional[int]:
+    """
+    Find the size a JSONL output file had at its last checkpoint.
+
+    Args:
+        path: Checkpoint file
+        output: Output file the size must have been recorded for
+
+    Returns:
+        Size in bytes, or None if the checkpoint has none for ``output``
+    """
+    size = None
+    for record in _checkpoint_records(path):
+        if record.get("output") == output:
+            size = record["output_bytes"]
+    return size
+
+
+def _checkpoint_records(path: str) -> Iterator[Dict]:
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def truncate_output(output: str, size: int) -> None:
+    """Drop results appended to ``output`` after it was ``size`` bytes long."""
+    if os.path.exists(output) and os.path.getsize(output) > size:
+        logger.warning(
+            f"Dropping {os.path.getsize(output) - size} bytes of {output} "
+            f"written after the last checkpoint"
+        )
+        os.truncate(output, size)
+
+
+class Progress:
+    """Counts finished files and logs throughput and the time remaining."""
+
+    def __init__(self, total: int, interval: float):
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.failed = 0
+        self.characters = 0
+        self.start = time.perf_counter()
+        self._last_report = self.start
+
+    def record(self, failed: bool, characters: int = 0) -> None:
+        self.failed += failed
+        self.done += not failed
+        self.characters += characters
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def summary(self) -> Dict[str, float]:
+        elapsed = time.perf_counter() - self.start
+        finished = self.done + self.failed
+        rate = finished / elapsed if elapsed else 0.0
+        return {
+            "finished": finished,
+            "total": self.total,
+            "succeeded": self.done,
+            "failed": self.failed,
+            "elapsed_seconds": round(elapsed, 1),
+            "files_per_second": round(rate, 2),
+            "eta_seconds": (round((self.total - finished) / rate) if rate else None),
+            "characters": self.characters,
+        }
+
+    def report(self) -> None:
+        stats = self.summary()
+        eta = stats["eta_seconds"]
+        remaining = (
+            time.strftime("%H:%M:%S", time.gmtime(eta)) if eta is not None else "?"
+        )
+        logger.info(
+            f"Ingested {stats['finished']}/{stats['total']} files "
+            f"({stats['failed']} failed), {stats['files_per_second']} files/s, "
+            f"ETA {remaining}"
+        )
+
+
+class ResultWriter:
+    """
+    Buffers results and writes them, then their checkpoint lines, in batches.
+
+    Checkpoint lines carry the output file's size after their batch, and a
+    first line records its size before the run, so a resumed run can cut off
+    output whose checkpoint was never written.
+    """
+
+    def __init__(
+        self,
+        output: Optional[TextIO],
+        checkpoint: Optional[TextIO],
+        use_storage: bool,
+        batch_size: int,
+    ):
+        self.output = output
+        self.checkpoint = checkpoint
+        self.storage = create_storage() if use_storage else None
+        self.batch_size = batch_size
+        self._records: List[str] = []
+        self._resumes: List[ResumeResponse] = []
+        self._finished: List[Dict[str, Optional[str]]] = []
+        if self.checkpoint is not None and self.output is not None:
+            self.checkpoint.write(json.dumps(self._output_position()) + "\n")
+            self.checkpoint.flush()
+
+    def _output_position(self) -> Dict:
+        return {
+            "output": self.output.name,
+            "output_bytes": os.fstat(self.output.fileno()).st_size,
+        }
+
+    def add(
+        self,
+        path: str,
+        resume: Optional[ResumeResponse] = None,
+        record: Optional[Dict] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Queue one finished file.
+
+        Args:
+            path: File path relative to the archive root
+            resume: Parsed resume (normal runs)
+            record: Extraction record (dry runs)
+            error: Failure reason, if the file failed
+        """
+        if resume is not None:
+            self._resumes.append(resume)
+        if record is not None:
+            self._records.append(json.dumps(record))
+        self._finished.append(
+            {"path": path, "status": "failed" if error else "done", "error": error}
+        )
+        if len(self._finished) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered results, then mark their files as finished."""
+        if self.storage is not None and self._resumes:
+            self.storage.save_many(self._resumes)
+        if self.output is not None:
+            lines = self._records + [
+                resume.model_dump_json() for resume in self._resumes
+            ]
+            if lines:
+                self.output.write("\n".join(lines) + "\n")
+                self.output.flush()
+        # Only now are the files finished: a crash before this line reparses
+        # them (and the next run cuts their output off), a crash after it
+        # finds them in the checkpoint
+        if self.checkpoint is not None and self._finished:
+            position = self._output_position() if self.output is not None else {}
+            self.checkpoint.write(
+                "".join(
+                    json.dumps({**item, **position}) + "\n" for item in self._finished
+                )
+            )
+            self.checkpoint.flush()
+        self._records.clear()
+        self._resumes.clear()
+        self._finished.clear()
+
+
+async def ingest(
+    root: str,
+    paths: List[str],
+    pipeline: ExtractionPipeline,
+    writer: ResultWriter,
+    progress: Progress,
+    dry_run: bool,
+    max_in_flight: int,
+) -> None:
+    """
+    Extract (and unless ``dry_run``, parse) every file, writing as they finish.
+
+    Args:
+        root: Archive directory
+        paths: Files to process, relative to ``root``
+        pipeline: Started extraction pipeline
+        writer: Destination of results and checkpoint lines
+        progress: Progress counters
+        dry_run: Only extract text
+        max_in_flight: Files scheduled at once, to bound memory
+    """
+    slots = asyncio.Semaphore(max_in_flight)
+
+    async def _ingest_one(path: str) -> None:
+        ext = os.path.splitext(path)[1].lower()
+        source = os.path.join(root, path)
+        try:
+            if dry_run:
+                text, _ = await pipeline.extract(source, ext)
+                writer.add(
+                    path,
+                    record={"file_name": path, "characters": len(text), "text": text},
+                )
+                progress.record(False, len(text))
+                return
+            resume_data = await pipeline.process(source, ext)
+            resume = ResumeResponse(
+                document_id=document_id_for(path),
+                data=resume_data,
+                extracted_at=datetime.now(),
+                file_name=path,
+            )
+            writer.add(path, resume=resume)
+            progress.record(False)
+        except Exception as e:
+            logger.error(f"Failed to ingest {path}: {str(e)}")
+            writer.add(path, error=str(e))
+            progress.record(True)
+        finally:
+            slots.release()
+
+    tasks: Set[asyncio.Task] = set()
+    for path in paths:
+        await slots.acquire()
+        task = asyncio.create_task(_ingest_one(path))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+def _pending(
+    paths: List[str], finished: Dict[str, str], retry_failed: bool
+) -> Iterator[str]:
+    for path in paths:
+        status = finished.get(path)
+        if status is None or (status == "failed" and retry_failed):
+            yield path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "root", help="Directory of PDF/DOCX resumes (searched recursively)"
+    )
+    parser.add_argument("--output", help="Append results to this JSONL file")
+    parser.add_argument(
+        "--storage",
+        action="store_true",
+        help="Save results to the STORAGE_BACKEND storage instead of (or as well as) JSONL",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Progress file (default: <output>.checkpoint, or data/ingest.checkpoint)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Extraction processes",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Concurrent LLM parse calls"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=20,
+        help="Results written (and checkpointed) together",
+    )
+    parser.add_argument("--limit", type=int, help="Process at most this many files")
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Process files that failed in earlier runs again",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only extract text (written to --output if given); no LLM calls, "
+        "no checkpoint",
+    )
+    parser.add_argument(
+        "--report-every", type=float, default=10.0, help="Seconds between reports"
+    )
+    args = parser.parse_args()
+
+    if not args.dry_run and not (args.output or args.storage):
+        parser.error("give --output and/or --storage (or --dry-run)")
+
+    checkpoint_path = args.checkpoint or (
+        f"{args.output}.checkpoint" if args.output else "data/ingest.checkpoint"
+    )
+    paths = find_documents(args.root)
+    finished = read_checkpoint(checkpoint_path)
+    pending = list(_pending(paths, finished, args.retry_failed))
+    logger.info(
+        f"Found {len(paths)} resumes under {args.root}; "
+        f"{len(paths) - len(pending)} already finished"
+    )
+    if args.limit is not None:
+        pending = pending[: args.limit]
+    logger.info(f"{len(pending)} to {'extract' if args.dry_run else 'ingest'}")
+
+    output = checkpoint = None
+    for path in (args.output, None if args.dry_run else checkpoint_path):
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+    if args.output:
+        if not args.dry_run:
+            size = checkpointed_output_bytes(checkpoint_path, args.output)
+            if size is not None:
+                truncate_output(args.output, size)
+        output = open(args.output, "a", encoding="utf-8")
+    if not args.dry_run:
+        checkpoint = open(checkpoint_path, "a", encoding="utf-8")
+
+    writer = ResultWriter(
+        output, checkpoint, args.storage and not args.dry_run, args.batch_size
+    )
+    progress = Progress(len(pending), args.report_every)
+    pipeline = ExtractionPipeline(
+        mode="always",
+        extract_workers=args.workers,
+        llm_workers=args.concurrency,
+        queue_size=args.concurrency,
+    )
+
+    async def _run() -> None:
+        await pipeline.start()
+        try:
+            await ingest(
+                args.root,
+                pending,
+                pipeline,
+                writer,
+                progress,
+                args.dry_run,
+                # Enough to keep both stages busy without loading the archive
+                max_in_flight=2 * (args.workers + args.concurrency),
+            )
+        finally:
+            pipeline.shutdown()
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        logger.warning("Interrupted; run the same command again to resume")
+    finally:
+        writer.flush()
+        for f in (output, checkpoint):
+            if f is not None:
+                f.close()
+        progress.report()
+        print(json.dumps(progress.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,103 @@
+import hashlib
+import json
 import os
+import time
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import FastAPI, File, UploadFile, HTTPException, status
-from app.models import ResumeResponse
-from app.services.parser import parse_resume
+from functools import partial
+from typing import Any, Iterator, List, Literal, Optional
+from fastapi import (
+    FastAPI,
+    File,
+    UploadFile,
+    HTTPException,
+    Header,
+    Query,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from app.models import (
+    BatchItemResult,
+    BatchUploadResponse,
+    JobStatus,
+    RankRequest,
+    RankResponse,
+    ResumeBulkRequest,
+    ResumeBulkResponse,
+    ResumeData,
+    ResumeListResponse,
+    ResumeResponse,
+    ResumeVersionHistory,
+    SearchRequest,
+    SearchResponse,
+    SearchResult,
+)
+from app.services.blob_store import blob_store
+from app.services.cache import parse_cache
+from app.services.compactor import compaction_stats
+from app.services.contact_extractor import extract_contact_info
+from app.services.document_extractor import DocumentExtractor
+from app.services.jobs import JobQueueFullError, job_manager
+from app.services.llm_service import client_manager
+from app.services.parser import astream_resume_text, parse_stats
+from app.services.pipeline import extraction_pipeline
+from app.services.ranker import resume_ranker
+from app.services.vector_index import vector_index
+from app.services.versioning import (
+    Revision,
+    aparse_revision,
+    normalize_candidate_id,
+    parse_revision,
+    record_version,
+)
 from app.storage import resume_storage
+from app.utils.body_limit import BodySizeLimitMiddleware
 from app.utils.logger import logger
+from app.utils.metrics import STAGE_SECONDS, UPLOADS, UPLOADS_IN_FLIGHT, registry
+from app.utils.tracing import Span, span, tracer, use_span
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background services with the application."""
+    await extraction_pipeline.start()
+    vector_index.start(resume_storage.iter_all())
+    blob_store.start()
+    resume_ranker.start(resume_storage.iter_all())
+    yield
+    job_manager.shutdown()
+    extraction_pipeline.shutdown()
+    vector_index.shutdown()
+    blob_store.shutdown()
+    await client_manager.aclose()
+
+
+ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc"}
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+MAX_UPLOAD_BYTES = int(float(os.getenv("MAX_UPLOAD_MB", "10")) * 1024 * 1024)
+MAX_BATCH_FILES = int(os.getenv("MAX_BATCH_FILES", "100"))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Bulk retrieval sends stored JSON in chunks of about this size
+BULK_CHUNK_SIZE = 64 * 1024
+# Keep a copy of the original upload in the blob store (extraction works from memory)
+PERSIST_UPLOADS = os.getenv("PERSIST_UPLOADS", "true").lower() == "true"
 
 app = FastAPI(
     title="Resume Parser API",
     description="AI-powered resume parsing using LLMs",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-UPLOAD_DIR = "data/uploads"
-ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc"}
-
-# Ensure upload directory exists
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Reject oversize bodies before they are buffered; batches get room for many files
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_bytes=MAX_UPLOAD_BYTES + UPLOAD_CHUNK_SIZE,
+    path_limits={"/api/upload/batch": MAX_UPLOAD_BYTES * MAX_BATCH_FILES},
+)
 
 
 @app.get("/")
@@ -28,81 +108,580 @@ def read_root():
         "version": "1.0.0",
         "endpoints": {
             "upload": "POST /api/upload",
+            "upload_stream": "POST /api/upload/stream",
+            "upload_batch": "POST /api/upload/batch",
             "retrieve": "GET /api/resume/{document_id}",
+            "trace": "GET /api/resume/{document_id}/trace",
+            "versions": "GET /api/candidates/{candidate_id}/versions",
+            "retrieve_many": "POST /api/resumes/get",
+            "list": "GET /api/resumes",
+            "search": "POST /api/search",
+            "rank": "POST /api/rank",
+            "job_status": "GET /api/jobs/{job_id}",
+            "cache_stats": "GET /api/cache/stats",
+            "metrics": "GET /metrics",
         },
     }
 
 
+def validate_extension(file_name: str) -> str:
+    """
+    Validate an upload's extension.
+
+    Args:
+        file_name: Original filename
+
+    Returns:
+        Lower-cased file extension
+
+    Raises:
+        HTTPException: If the extension is not allowed
+    """
+    file_ext = os.path.splitext(file_name)[1].lower()
+    if file_ext not in ALLOWED_EXTENSIONS:
+        logger.error(f"Invalid file type: {file_ext}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}",
+        )
+    return file_ext
+
+
+async def read_upload(file: UploadFile) -> bytearray:
+    """
+    Read an uploaded file in chunks, enforcing the maximum upload size.
+
+    Args:
+        file: Uploaded file
+
+    Returns:
+        Raw file content
+
+    Raises:
+        HTTPException: If the file exceeds MAX_UPLOAD_BYTES
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"File exceeds the maximum upload size of {MAX_UPLOAD_BYTES} bytes",
+    )
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        logger.error(f"Upload too large: {file.filename} ({file.size} bytes)")
+        raise too_large
+
+    content = bytearray()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        content.extend(chunk)
+        if len(content) > MAX_UPLOAD_BYTES:
+            logger.error(f"Upload too large: {file.filename}")
+            raise too_large
+
+    return content
+
+
+def persist_upload(content: bytes, document_id: str, file_ext: str) -> Optional[str]:
+    """
+    Save the original upload in the content-addressed blob store if enabled.
+
+    Identical files are stored once; a duplicate only adds a reference.
+
+    Args:
+        content: Raw file content
+        document_id: Unique document identifier
+        file_ext: File extension (.pdf or .docx)
+
+    Returns:
+        Path of the stored file, or None when persistence is disabled
+    """
+    if not PERSIST_UPLOADS:
+        return None
+
+    with STAGE_SECONDS.time(stage="file_write"), span("file_write", bytes=len(content)):
+        file_path = blob_store.put(content, document_id, file_ext)
+
+    logger.info(f"File saved: {file_path}")
+    return file_path
+
+
+def discard_upload(document_id: str) -> None:
+    """
+    Drop the blob reference of an upload whose result was never stored.
+
+    Args:
+        document_id: Unique document identifier passed to persist_upload
+    """
+    if PERSIST_UPLOADS:
+        blob_store.release(document_id)
+
+
+def build_response(
+    document_id: str, resume_data: ResumeData, file_name: str
+) -> ResumeResponse:
+    """
+    Wrap parsed data in a response.
+
+    Args:
+        document_id: Unique document identifier
+        resume_data: Parsed resume data
+        file_name: Original filename
+
+    Returns:
+        Resume response ready to store
+    """
+    return ResumeResponse(
+        document_id=document_id,
+        data=resume_data,
+        extracted_at=datetime.now(),
+        file_name=file_name,
+    )
+
+
+def store_resume(
+    document_id: str,
+    resume_data: ResumeData,
+    file_name: str,
+    revision: Optional[Revision] = None,
+) -> ResumeResponse:
+    """
+    Wrap parsed data in a response and store it.
+
+    Args:
+        document_id: Unique document identifier
+        resume_data: Parsed resume data
+        file_name: Original filename
+        revision: Versioned parse to add to its candidate's history
+
+    Returns:
+        Stored resume response
+    """
+    resume_response = build_response(document_id, resume_data, file_name)
+    version = record_version(revision, document_id, file_name) if revision else None
+    if version is not None:
+        resume_response.candidate_id = version.candidate_id
+        resume_response.version = version.version
+        resume_response.reparsed_sections = version.reparsed_sections
+
+    # Store with the configured backend and queue it for semantic search
+    with span("store"):
+        resume_storage.save(document_id, resume_response)
+        vector_index.add(resume_response)
+        resume_ranker.add(resume_response)
+
+    logger.info(f"Resume processed successfully: {document_id}")
+    return resume_response
+
+
+def sse_event(event: str, data: Any) -> str:
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def process_upload(
+    document_id: str,
+    content: bytes,
+    file_ext: str,
+    file_name: str,
+    trace: Optional[Span] = None,
+    candidate_id: Optional[str] = None,
+) -> ResumeResponse:
+    """
+    Parse an upload and store the result.
+
+    Args:
+        document_id: Unique document identifier
+        content: Raw file content
+        file_ext: File extension (.pdf or .docx)
+        file_name: Original filename
+        trace: Span of the request's trace to record the job under
+        candidate_id: Candidate whose latest version the upload is diffed against
+
+    Returns:
+        Parsed resume data with document ID
+    """
+    with tracer.activate(trace):
+        try:
+            # Extract text, then parse what changed since the candidate's last version
+            text, links = DocumentExtractor.extract_text_and_links(content, file_ext)
+            revision = parse_revision(text, links, candidate_id)
+            return store_resume(document_id, revision.data, file_name, revision)
+        except Exception:
+            discard_upload(document_id)
+            raise
+
+
 @app.post(
-    "/api/upload", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED
+    "/api/upload",
+    response_model=ResumeResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobStatus}},
 )
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(
+    file: UploadFile = File(...),
+    background: bool = Query(
+        False, description="Queue parsing as a job and return 202 with a job ID"
+    ),
+    contact_only: bool = Query(
+        False, description="Skip the LLM and return rule-based contact details only"
+    ),
+    candidate_id: Optional[str] = Query(
+        None,
+        description="Candidate to add this version to (default: the resume's email "
+        "when VERSIONING_ENABLED is set)",
+    ),
+):
     """
     Upload and parse a resume file.
 
     Args:
         file: Resume file (PDF or DOCX)
+        background: Return immediately with a job ID instead of waiting
+        contact_only: Extract contact details locally without calling the LLM
+        candidate_id: Link the upload to this candidate's earlier versions and
+            re-parse only the sections that changed
 
     Returns:
-        Parsed resume data with document ID
+        Parsed resume data with document ID, or the queued job status
     """
-    try:
-        logger.info(f"Received file upload: {file.filename}")
+    outcome = "failed"
+    document_id = None
+    UPLOADS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    with tracer.activate(tracer.start("upload", file_name=file.filename)) as trace:
+        try:
+            logger.info(f"Received file upload: {file.filename}")
 
-        # Validate file extension
-        file_ext = os.path.splitext(file.filename)[1].lower()
-        if file_ext not in ALLOWED_EXTENSIONS:
-            logger.error(f"Invalid file type: {file_ext}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}",
-            )
+            # Validate file extension
+            file_ext = validate_extension(file.filename)
 
-        # Generate unique document ID
-        document_id = str(uuid.uuid4())
+            # Generate unique document ID
+            document_id = str(uuid.uuid4())
+            trace.set_attributes(document_id=document_id, format=file_ext)
 
-        # Save uploaded file
-        file_path = os.path.join(UPLOAD_DIR, f"{document_id}{file_ext}")
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+            # Read the upload in bounded chunks and optionally keep the original
+            with STAGE_SECONDS.time(stage="read"), span("read"):
+                content = await read_upload(file)
+            trace.set_attributes(bytes=len(content))
+            await run_in_threadpool(persist_upload, content, document_id, file_ext)
 
-        logger.info(f"File saved: {file_path}")
+            if contact_only:
+                text, links = await run_in_threadpool(
+                    DocumentExtractor.extract_text_and_links, content, file_ext
+                )
+                resume_data = ResumeData(
+                    contact_information=extract_contact_info(
+                        text, links, include_name=True
+                    )
+                )
+                response = await run_in_threadpool(
+                    store_resume, document_id, resume_data, file.filename
+                )
+                outcome = "success"
+                return response
 
-        # Parse resume
-        resume_data = parse_resume(file_path, file_ext)
+            if background:
+                job = job_manager.submit(
+                    process_upload,
+                    document_id,
+                    content,
+                    file_ext,
+                    file.filename,
+                    document_id=document_id,
+                    file_name=file.filename,
+                    # The job's spans join this trace once a worker picks it up
+                    trace=trace.child("job"),
+                    candidate_id=candidate_id,
+                )
+                outcome = "queued"
+                return JSONResponse(
+                    status_code=status.HTTP_202_ACCEPTED,
+                    content=job.model_dump(mode="json"),
+                    headers={"Location": f"/api/jobs/{job.job_id}"},
+                )
 
-        # Create response
-        resume_response = ResumeResponse(
-            document_id=document_id,
-            data=resume_data,
-            extracted_at=datetime.now(),
-            file_name=file.filename,
-        )
+            # Parse off the event loop so other requests keep being served
+            revision = await extraction_pipeline.process(
+                content,
+                file_ext,
+                parse=partial(aparse_revision, candidate_id=candidate_id),
+            )
+            # Recording the version reads and writes the history in storage
+            response = await run_in_threadpool(
+                store_resume, document_id, revision.data, file.filename, revision
+            )
+            outcome = "success"
+            return response
 
-        # Store in memory
-        resume_storage.save(document_id, resume_response)
+        except HTTPException:
+            outcome = "rejected"
+            raise
+        except JobQueueFullError as e:
+            outcome = "rejected"
+            logger.warning(f"Rejected upload: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+            )
+        except Exception as e:
+            logger.error(f"Upload processing failed: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to process resume: {str(e)}",
+            )
+        finally:
+            if document_id and outcome not in ("success", "queued"):
+                discard_upload(document_id)
+            UPLOADS_IN_FLIGHT.dec()
+            STAGE_SECONDS.observe(time.perf_counter() - start, stage="upload")
+            UPLOADS.inc(outcome=outcome)
+            trace.set_attributes(outcome=outcome)
 
-        logger.info(f"Resume processed successfully: {document_id}")
-        return resume_response
 
-    except HTTPException:
+@app.post("/api/upload/stream")
+async def upload_resume_stream(file: UploadFile = File(...)):
+    """
+    Upload a resume and stream the parse as server-sent events.
+
+    Events, in order: ``document`` with the document ID, ``field`` as each
+    top-level ResumeData field completes, ``work_experience`` as each job
+    completes, and finally ``result`` with the stored ResumeResponse (or
+    ``error`` if parsing fails after the stream has started).
+
+    Args:
+        file: Resume file (PDF or DOCX)
+
+    Returns:
+        text/event-stream response
+    """
+    trace = tracer.start("upload", file_name=file.filename, stream=True)
+    document_id = None
+    try:
+        with use_span(trace):
+            logger.info(f"Received streaming upload: {file.filename}")
+            file_name = file.filename
+            file_ext = validate_extension(file_name)
+            document_id = str(uuid.uuid4())
+            trace.set_attributes(document_id=document_id, format=file_ext)
+
+            with span("read"):
+                content = await read_upload(file)
+            trace.set_attributes(bytes=len(content))
+            await run_in_threadpool(persist_upload, content, document_id, file_ext)
+            text, links = await run_in_threadpool(
+                DocumentExtractor.extract_text_and_links, content, file_ext
+            )
+    except HTTPException as e:
+        if document_id:
+            discard_upload(document_id)
+        tracer.finish(trace, e)
         raise
     except Exception as e:
         logger.error(f"Upload processing failed: {str(e)}")
+        if document_id:
+            discard_upload(document_id)
+        tracer.finish(trace, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process resume: {str(e)}",
         )
 
+    async def events():
+        # The trace stays open until the last event has been produced
+        with tracer.activate(trace):
+            stored = False
+            yield sse_event(
+                "document", {"document_id": document_id, "file_name": file_name}
+            )
+            try:
+                async for event, data in astream_resume_text(
+                    text, prefilled=extract_contact_info(text, links)
+                ):
+                    if event == "result":
+                        resume_response = await run_in_threadpool(
+                            store_resume, document_id, data, file_name
+                        )
+                        stored = True
+                        yield sse_event(
+                            "result", resume_response.model_dump(mode="json")
+                        )
+                    else:
+                        yield sse_event(event, data)
+            except Exception as e:
+                logger.error(f"Streaming parse failed: {str(e)}")
+                trace.record_error(e)
+                yield sse_event(
+                    "error", {"detail": f"Failed to process resume: {str(e)}"}
+                )
+            finally:
+                # Also reached when the client disconnects mid-stream
+                if not stored:
+                    discard_upload(document_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/upload/batch", response_model=BatchUploadResponse)
+async def upload_resume_batch(files: List[UploadFile] = File(...)):
+    """
+    Upload and parse many resume files concurrently.
+
+    Files flow through the extraction pipeline, so text extraction on the
+    process pool overlaps the LLM calls, with at most BATCH_CONCURRENCY
+    files in flight. A failing file is reported in its own result without
+    aborting the rest of the batch.
+
+    Args:
+        files: Resume files (PDF or DOCX)
+
+    Returns:
+        Per-file results in upload order
+
+    Raises:
+        HTTPException: If the batch has more than MAX_BATCH_FILES files
+    """
+    logger.info(f"Received batch upload of {len(files)} files")
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Batch exceeds the maximum of {MAX_BATCH_FILES} files",
+        )
+    results: List[BatchItemResult] = []
+    traces: List[Span] = []
+    pending = []
+
+    for file in files:
+        item = BatchItemResult(file_name=file.filename, status="failed")
+        results.append(item)
+        # One trace per file, kept under the file's document ID
+        trace = tracer.start("upload", file_name=file.filename, batch=True)
+        traces.append(trace)
+        try:
+            with use_span(trace):
+                file_ext = validate_extension(file.filename)
+                item.document_id = str(uuid.uuid4())
+                trace.set_attributes(document_id=item.document_id, format=file_ext)
+                with span("read"):
+                    content = await read_upload(file)
+                await run_in_threadpool(
+                    persist_upload, content, item.document_id, file_ext
+                )
+            pending.append((item, (content, file_ext), trace))
+        except HTTPException as e:
+            item.error = e.detail
+        except Exception as e:
+            logger.error(f"Batch upload failed for {file.filename}: {str(e)}")
+            item.error = str(e)
+
+    # Extract and parse all files under the concurrency limit
+    parsed = await extraction_pipeline.process_many(
+        [source for _, source, _ in pending],
+        concurrency=BATCH_CONCURRENCY,
+        traces=[trace for _, _, trace in pending],
+    )
+    for (item, _, _), resume_data in zip(pending, parsed):
+        if isinstance(resume_data, Exception):
+            item.error = f"Failed to process resume: {str(resume_data)}"
+            continue
+        item.result = build_response(item.document_id, resume_data, item.file_name)
+        item.status = "success"
+
+    # Write the whole batch in one storage round trip
+    stored = [item.result for item in results if item.result is not None]
+    if stored:
+        try:
+            await run_in_threadpool(resume_storage.save_many, stored)
+            vector_index.add_many(stored)
+            resume_ranker.add_many(stored)
+        except Exception as e:
+            logger.error(f"Failed to store batch results: {str(e)}")
+            for item in results:
+                if item.result is not None:
+                    item.result = None
+                    item.status = "failed"
+                    item.error = f"Failed to store resume: {str(e)}"
+
+    for item, trace in zip(results, traces):
+        if item.status != "success" and item.document_id:
+            discard_upload(item.document_id)
+        trace.set_attributes(outcome=item.status)
+        if item.error:
+            trace.record_error(item.error)
+        tracer.finish(trace)
+
+    succeeded = sum(1 for item in results if item.status == "success")
+    logger.info(f"Batch processed: {succeeded}/{len(results)} succeeded")
+    return BatchUploadResponse(
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+    )
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobStatus)
+def get_job(job_id: str):
+    """
+    Retrieve the status of an asynchronous parse job.
+
+    Args:
+        job_id: Job identifier returned by a background upload
+
+    Returns:
+        Job status, including the parsed resume once done
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        logger.warning(f"Job not found: {job_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID '{job_id}' not found",
+        )
+    return job
+
+
+def resume_etag(payload: bytes) -> str:
+    """Returns a strong ETag for a stored resume's JSON."""
+    return f'"{hashlib.sha256(payload).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Header value, e.g. '"abc", W/"def"' or "*"
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
 
 @app.get("/api/resume/{document_id}", response_model=ResumeResponse)
-def get_resume(document_id: str):
+def get_resume(
+    document_id: str, if_none_match: Optional[str] = Header(None)
+) -> Response:
     """
     Retrieve parsed resume data by document ID.
 
+    The JSON serialized when the resume was saved is sent as is, with an
+    ETag; a request whose If-None-Match matches gets 304 Not Modified.
+
     Args:
         document_id: Unique document identifier
+        if_none_match: ETags of copies the client already has
 
     Returns:
         Parsed resume data
@@ -110,18 +689,24 @@ def get_resume(document_id: str):
     try:
         logger.info(f"Retrieving resume: {document_id}")
 
-        # Retrieve from storage
-        resume_response = resume_storage.get(document_id)
+        # Retrieve the stored JSON, skipping model validation and serialization
+        payload = resume_storage.get_json(document_id)
 
-        if resume_response is None:
+        if payload is None:
             logger.warning(f"Resume not found: {document_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Resume with ID '{document_id}' not found",
             )
 
+        etag = resume_etag(payload)
+        # Clients may reuse their copy, but must revalidate it first
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
         logger.info(f"Resume retrieved successfully: {document_id}")
-        return resume_response
+        return Response(content=payload, media_type="application/json", headers=headers)
 
     except HTTPException:
         raise
@@ -131,3 +716,291 @@ def get_resume(document_id: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve resume: {str(e)}",
         )
+
+
+def stream_resumes(document_ids: List[str]) -> Iterator[bytes]:
+    """
+    Write stored resumes as one ResumeBulkResponse JSON document.
+
+    Stored JSON is concatenated without parsing and sent in chunks of about
+    BULK_CHUNK_SIZE bytes, so memory stays flat however many IDs are asked for.
+
+    Args:
+        document_ids: Unique document identifiers, without duplicates
+
+    Yields:
+        Pieces of the response body
+    """
+    found = set()
+    chunk = bytearray(b'{"resumes":[')
+    try:
+        for document_id, payload in resume_storage.iter_json(document_ids):
+            if found:
+                chunk += b","
+            chunk += payload
+            found.add(document_id)
+            if len(chunk) >= BULK_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+    except Exception as e:
+        # The status line is already sent; truncated JSON signals the failure
+        logger.error(f"Bulk retrieval failed: {str(e)}")
+        raise
+    missing = [document_id for document_id in document_ids if document_id not in found]
+    chunk += b'],"missing":' + json.dumps(missing).encode("utf-8") + b"}"
+    yield bytes(chunk)
+
+
+@app.post("/api/resumes/get", response_model=ResumeBulkResponse)
+def get_resumes(request: ResumeBulkRequest):
+    """
+    Retrieve many stored resumes in one streamed response.
+
+    Args:
+        request: Document identifiers to fetch
+
+    Returns:
+        Resumes found in the order requested, and the IDs that are not stored
+    """
+    document_ids = list(dict.fromkeys(request.document_ids))
+    logger.info(f"Retrieving {len(document_ids)} resumes")
+    return StreamingResponse(
+        stream_resumes(document_ids), media_type="application/json"
+    )
+
+
+@app.get("/api/resume/{document_id}/trace")
+def get_resume_trace(document_id: str):
+    """
+    Retrieve the span timeline recorded while processing a resume.
+
+    Only the most recent TRACE_BUFFER_SIZE traces are kept in memory.
+
+    Args:
+        document_id: Unique document identifier
+
+    Returns:
+        Per-stage totals and the nested spans with millisecond timings
+    """
+    trace = tracer.get(document_id)
+    if trace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trace for resume '{document_id}' not found",
+        )
+    return trace
+
+
+@app.get("/api/candidates/{candidate_id}/versions", response_model=ResumeVersionHistory)
+def get_candidate_versions(candidate_id: str):
+    """
+    Retrieve the version history of a candidate's resume.
+
+    Args:
+        candidate_id: Candidate ID given at upload, or the resume's email
+
+    Returns:
+        Versions oldest first, each with the sections re-parsed for it
+    """
+    try:
+        candidate_id = normalize_candidate_id(candidate_id)
+        versions = resume_storage.list_versions(candidate_id)
+        if not versions:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Candidate '{candidate_id}' not found",
+            )
+        return ResumeVersionHistory(candidate_id=candidate_id, versions=versions)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Version history retrieval failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve versions: {str(e)}",
+        )
+
+
+@app.get("/api/resumes", response_model=ResumeListResponse)
+def list_resumes(
+    skill: Optional[List[str]] = Query(None, description="Technical skill"),
+    company: Optional[List[str]] = Query(None, description="Employer"),
+    role: Optional[List[str]] = Query(None, description="Job title"),
+    institution: Optional[List[str]] = Query(None, description="School"),
+    location: Optional[List[str]] = Query(None, description="Candidate location"),
+    match: Literal["all", "any"] = Query(
+        "all", description="Require every filter value, or any of them"
+    ),
+    offset: int = Query(0, ge=0, description="Number of resumes to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum page size"),
+):
+    """
+    Page through stored resumes, newest first, optionally filtered.
+
+    Filters are matched case-insensitively against the storage indexes and
+    may be repeated (e.g. ``?skill=python&skill=sql``).
+
+    Args:
+        skill: Technical skills to match
+        company: Companies to match
+        role: Roles to match
+        institution: Institutions to match
+        location: Locations to match
+        match: "all" for AND semantics, "any" for OR
+        offset: Number of resumes to skip
+        limit: Maximum number of resumes to return
+
+    Returns:
+        Total count and the requested page of resumes
+    """
+    filters = {
+        "skill": skill,
+        "company": company,
+        "role": role,
+        "institution": institution,
+        "location": location,
+    }
+    try:
+        total, items = resume_storage.query(
+            {field: values for field, values in filters.items() if values},
+            match=match,
+            offset=offset,
+            limit=limit,
+        )
+        return ResumeListResponse(total=total, offset=offset, limit=limit, items=items)
+    except Exception as e:
+        logger.error(f"Listing failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to list resumes: {str(e)}",
+        )
+
+
+@app.post("/api/search", response_model=SearchResponse)
+def search_resumes(request: SearchRequest):
+    """
+    Find stored resumes semantically similar to a free-text query.
+
+    Args:
+        request: Query text and number of results
+
+    Returns:
+        Matching resumes ranked by cosine similarity
+    """
+    if not vector_index.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Semantic search is disabled",
+        )
+    try:
+        hits = vector_index.search(request.query, top_k=request.top_k)
+        stored = resume_storage.get_many([document_id for document_id, _ in hits])
+        resumes = {resume.document_id: resume for resume in stored}
+        results = [
+            SearchResult(
+                document_id=document_id, score=score, resume=resumes[document_id]
+            )
+            for document_id, score in hits
+            if document_id in resumes
+        ]
+        logger.info(f"Search returned {len(results)} resumes")
+        return SearchResponse(query=request.query, results=results)
+    except Exception as e:
+        logger.error(f"Search failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search resumes: {str(e)}",
+        )
+
+
+@app.post("/api/rank", response_model=RankResponse)
+def rank_resumes(request: RankRequest):
+    """
+    Rank all stored resumes against a job description.
+
+    The score combines skill overlap, years of experience and text
+    similarity, computed for the whole corpus at once.
+
+    Args:
+        request: Job description and optional explicit requirements
+
+    Returns:
+        Best matching resumes with their score components
+    """
+    try:
+        ranking = resume_ranker.rank(
+            request.job_description,
+            top_k=request.top_k,
+            skills=request.skills,
+            min_years=request.min_years,
+        )
+        stored = resume_storage.get_many(
+            [result.document_id for result in ranking.results]
+        )
+        resumes = {resume.document_id: resume for resume in stored}
+        for result in ranking.results:
+            result.resume = resumes.get(result.document_id)
+        logger.info(f"Ranked {ranking.ranked} resumes for skills {ranking.job_skills}")
+        return ranking
+    except Exception as e:
+        logger.error(f"Ranking failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rank resumes: {str(e)}",
+        )
+
+
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """Returns hit/miss counters for the parse result cache."""
+    return parse_cache.stats()
+
+
+@app.get("/api/uploads/stats")
+def get_upload_stats():
+    """Returns file, reference and garbage collection counts of the upload store."""
+    return blob_store.stats()
+
+
+@app.get("/api/compaction/stats")
+def get_compaction_stats():
+    """Returns input-token savings from prompt text compaction."""
+    return compaction_stats.stats()
+
+
+@app.get("/api/parse/stats")
+def get_parse_stats():
+    """Returns parse counts, failure rates and prompt tokens per parsing path."""
+    return parse_stats.stats()
+
+
+@app.get("/api/jobs")
+def get_job_stats():
+    """Returns worker pool size and queue occupancy for background jobs."""
+    return job_manager.stats()
+
+
+@app.get("/api/llm/stats")
+def get_llm_stats():
+    """Returns LLM request, retry, throttling and token counters."""
+    return client_manager.stats()
+
+
+@app.get("/api/search/stats")
+def get_search_stats():
+    """Returns vector index size and embedding counters."""
+    return vector_index.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """Returns stage latencies, token counts and upload counters for Prometheus."""
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/api/pipeline")
+def get_pipeline_stats():
+    """Returns extraction pipeline configuration and occupancy."""
+    return extraction_pipeline.stats()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 from datetime import datetime
 
 
@@ -103,6 +103,187 @@ class ResumeResponse(BaseModel):
         default_factory=datetime.now, description="Timestamp of extraction"
     )
     file_name: str = Field(..., description="Original filename")
+    candidate_id: Optional[str] = Field(
+        None, description="Candidate whose version history this upload joined"
+    )
+    version: Optional[int] = Field(None, description="Version number for the candidate")
+    reparsed_sections: Optional[List[str]] = Field(
+        None, description="Sections parsed by the LLM for this version"
+    )
+
+
+class ResumeVersion(BaseModel):
+    """One uploaded version of a candidate's resume."""
+
+    candidate_id: str = Field(..., description="Candidate identifier")
+    version: int = Field(0, description="Version number, starting at 1")
+    document_id: str = Field(..., description="Document holding this version")
+    file_name: str = Field(..., description="Original filename")
+    created_at: datetime = Field(
+        default_factory=datetime.now, description="Time the version was stored"
+    )
+    parse: Literal["full", "incremental", "unchanged"] = Field(
+        ..., description="How the version was parsed"
+    )
+    reparsed_sections: List[str] = Field(
+        default_factory=list, description="Sections parsed by the LLM"
+    )
+    section_hashes: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Digest of each section's text, compared with the next upload",
+    )
+
+
+class ResumeVersionHistory(BaseModel):
+    """Versions of a candidate's resume, oldest first."""
+
+    candidate_id: str = Field(..., description="Candidate identifier")
+    versions: List[ResumeVersion] = Field(
+        default_factory=list, description="Uploaded versions"
+    )
+
+
+class JobStatus(BaseModel):
+    """Status of an asynchronous parse job."""
+
+    job_id: str = Field(..., description="Unique job identifier")
+    status: Literal["queued", "running", "done", "failed"] = Field(
+        ..., description="Current job state"
+    )
+    document_id: str = Field(..., description="Document identifier being produced")
+    file_name: str = Field(..., description="Original filename")
+    created_at: datetime = Field(
+        default_factory=datetime.now, description="Time the job was queued"
+    )
+    started_at: Optional[datetime] = Field(None, description="Time parsing started")
+    finished_at: Optional[datetime] = Field(None, description="Time parsing ended")
+    result: Optional[ResumeResponse] = Field(
+        None, description="Parsed resume once the job is done"
+    )
+    error: Optional[str] = Field(None, description="Failure reason if job failed")
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of a single file in a batch upload."""
+
+    file_name: str = Field(..., description="Original filename")
+    status: Literal["success", "failed"] = Field(..., description="Outcome")
+    document_id: Optional[str] = Field(None, description="Assigned document ID")
+    result: Optional[ResumeResponse] = Field(
+        None, description="Parsed resume on success"
+    )
+    error: Optional[str] = Field(None, description="Failure reason")
+
+
+class BatchUploadResponse(BaseModel):
+    """API response for a batch upload."""
+
+    total: int = Field(..., description="Number of files received")
+    succeeded: int = Field(..., description="Number of files parsed")
+    failed: int = Field(..., description="Number of files that failed")
+    results: List[BatchItemResult] = Field(
+        default_factory=list, description="Per-file results in upload order"
+    )
+
+
+class ResumeListResponse(BaseModel):
+    """A page of stored resumes."""
+
+    total: int = Field(..., description="Number of resumes matching the request")
+    offset: int = Field(..., description="Number of resumes skipped")
+    limit: int = Field(..., description="Maximum page size")
+    items: List[ResumeResponse] = Field(
+        default_factory=list, description="Resumes on this page, newest first"
+    )
+
+
+class ResumeBulkRequest(BaseModel):
+    """API request to fetch several stored resumes at once."""
+
+    document_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Document identifiers; duplicates are returned once",
+    )
+
+
+class ResumeBulkResponse(BaseModel):
+    """Stored resumes fetched in one request."""
+
+    resumes: List[ResumeResponse] = Field(
+        default_factory=list, description="Resumes found, in the order requested"
+    )
+    missing: List[str] = Field(
+        default_factory=list, description="Requested IDs that are not stored"
+    )
+
+
+class SearchRequest(BaseModel):
+    """Semantic search request."""
+
+    query: str = Field(..., min_length=1, description="Free-text search query")
+    top_k: int = Field(10, ge=1, le=100, description="Maximum number of results")
+
+
+class SearchResult(BaseModel):
+    """A resume matched by semantic search."""
+
+    document_id: str = Field(..., description="Unique document identifier")
+    score: float = Field(..., description="Cosine similarity to the query")
+    resume: ResumeResponse = Field(..., description="Stored resume")
+
+
+class SearchResponse(BaseModel):
+    """API response for semantic search."""
+
+    query: str = Field(..., description="Search query")
+    results: List[SearchResult] = Field(
+        default_factory=list, description="Matches, most similar first"
+    )
+
+
+class RankRequest(BaseModel):
+    """Job description ranking request."""
+
+    job_description: str = Field(..., min_length=1, description="Job description")
+    top_k: int = Field(20, ge=1, le=500, description="Number of results to return")
+    skills: Optional[List[str]] = Field(
+        None, description="Required skills (detected from the description if omitted)"
+    )
+    min_years: Optional[float] = Field(
+        None, ge=0, description="Required years of experience (detected if omitted)"
+    )
+
+
+class RankedResume(BaseModel):
+    """A resume scored against a job description."""
+
+    document_id: str = Field(..., description="Unique document identifier")
+    score: float = Field(..., description="Combined score between 0 and 1")
+    skill_score: float = Field(..., description="Share of job skills matched")
+    experience_score: float = Field(..., description="Experience against requirement")
+    similarity_score: float = Field(..., description="Text similarity to the job")
+    matched_skills: List[str] = Field(
+        default_factory=list, description="Job skills found on the resume"
+    )
+    years_experience: float = Field(..., description="Total years of experience")
+    resume: Optional[ResumeResponse] = Field(None, description="Stored resume")
+
+
+class RankResponse(BaseModel):
+    """API response for job description ranking."""
+
+    job_skills: List[str] = Field(
+        default_factory=list, description="Skills the ranking looked for"
+    )
+    required_years: Optional[float] = Field(
+        None, description="Years of experience the ranking looked for"
+    )
+    ranked: int = Field(..., description="Number of resumes scored")
+    results: List[RankedResume] = Field(
+        default_factory=list, description="Best matches first"
+    )
 
 
 class ErrorResponse(BaseModel):
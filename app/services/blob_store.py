@@ -0,0 +1,478 @@
+"""
+Content-addressed store for original uploads.
+
+Files are stored once per SHA-256 digest under two levels of shard
+directories (``ab/cd/abcd....pdf``) and written to a temporary file that
+is renamed into place, so readers never see a partial blob. Document IDs
+reference blobs; the reference index is held in memory and flushed to a
+SQLite file in the background, so a duplicate upload costs a hash, a
+dictionary lookup and a check that the file still exists. A background collector removes
+unreferenced blobs, blobs not referenced within the TTL, and then the
+least recently referenced ones until the store fits its size budget. The
+SQLite file is authoritative: every process sharing the directory writes
+its references there, and the collector reloads it before deciding what to
+delete.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Set
+from dotenv import load_dotenv
+from app.utils.logger import logger
+from app.utils.tracing import current_span
+
+load_dotenv()
+
+# Configuration from environment variables
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "data/uploads")
+# Blobs not referenced by a new upload for this long are collected (0 keeps them)
+BLOB_STORE_TTL_SECONDS = int(os.getenv("BLOB_STORE_TTL_SECONDS", str(30 * 86400)))
+# Least recently referenced blobs are collected above this size (0 disables)
+BLOB_STORE_MAX_DISK_MB = int(os.getenv("BLOB_STORE_MAX_DISK_MB", "2048"))
+BLOB_STORE_GC_INTERVAL_SECONDS = int(os.getenv("BLOB_STORE_GC_INTERVAL_SECONDS", "600"))
+# How often new references are written to the index file
+BLOB_STORE_FLUSH_SECONDS = float(os.getenv("BLOB_STORE_FLUSH_SECONDS", "2"))
+
+INDEX_FILE = "index.db"
+# Files on disk unknown to the index are removed once this old; younger
+# ones may be a write whose index entry is not in memory yet
+_ORPHAN_GRACE_SECONDS = 3600
+
+
+class _Blob:
+    """Index entry of one stored file."""
+
+    __slots__ = ("ext", "size", "created", "last_used", "refs")
+
+    def __init__(
+        self, ext: str, size: int, created: float, last_used: float, refs: int = 0
+    ):
+        self.ext = ext
+        self.size = size
+        self.created = created
+        self.last_used = last_used
+        self.refs = refs
+
+
+class BlobStore:
+    """SHA-256 keyed file store with reference counts and background GC."""
+
+    def __init__(
+        self,
+        root: str = BLOB_STORE_DIR,
+        ttl_seconds: int = BLOB_STORE_TTL_SECONDS,
+        max_disk_bytes: int = BLOB_STORE_MAX_DISK_MB * 1024 * 1024,
+        gc_interval_seconds: int = BLOB_STORE_GC_INTERVAL_SECONDS,
+        flush_seconds: float = BLOB_STORE_FLUSH_SECONDS,
+    ):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+        self.gc_interval_seconds = gc_interval_seconds
+        self.flush_seconds = flush_seconds
+        self._blobs: Dict[str, _Blob] = {}
+        self._documents: Dict[str, str] = {}
+        self._disk_bytes = 0
+        # Digests and document IDs changed since the last flush
+        self._dirty_blobs: Set[str] = set()
+        self._dirty_documents: Set[str] = set()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._stats: Dict[str, int] = {
+            "writes": 0,
+            "duplicates": 0,
+            "collected": 0,
+            "collected_bytes": 0,
+        }
+
+    def start(self) -> None:
+        """Load the reference index and start the background collector."""
+        if self._worker is not None:
+            return
+        if self._db is None:
+            self._load()
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._run, name="blob-store-gc", daemon=True
+        )
+        self._worker.start()
+
+    def _load(self) -> None:
+        """Open the index file and read the references into memory."""
+        with self._db_lock:
+            if self._db is not None:
+                return
+            os.makedirs(self.root, exist_ok=True)
+            db = sqlite3.connect(
+                os.path.join(self.root, INDEX_FILE),
+                timeout=30,
+                check_same_thread=False,
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, "
+                "ext TEXT, size INTEGER, created REAL, last_used REAL)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS refs (document_id TEXT PRIMARY KEY, "
+                "digest TEXT NOT NULL)"
+            )
+            db.commit()
+
+            blobs: Dict[str, _Blob] = {}
+            for digest, ext, size, created, last_used in db.execute(
+                "SELECT digest, ext, size, created, last_used FROM blobs"
+            ):
+                # Entries whose file was removed by hand are forgotten
+                if os.path.exists(self._path(digest, ext)):
+                    blobs[digest] = _Blob(ext, size, created, last_used)
+            documents: Dict[str, str] = {}
+            for document_id, digest in db.execute(
+                "SELECT document_id, digest FROM refs"
+            ):
+                if digest in blobs:
+                    documents[document_id] = digest
+                    blobs[digest].refs += 1
+
+            with self._lock:
+                self._blobs = blobs
+                self._documents = documents
+                self._disk_bytes = sum(blob.size for blob in blobs.values())
+            self._db = db
+        logger.info(
+            f"Loaded blob store with {len(blobs)} files for {len(documents)} documents"
+        )
+
+    def _path(self, digest: str, ext: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], f"{digest}{ext}")
+
+    def put(self, content: bytes, document_id: str, file_ext: str) -> str:
+        """
+        Store a file for a document, reusing an existing copy of the same bytes.
+
+        Args:
+            content: Raw file content
+            document_id: Unique document identifier referencing the file
+            file_ext: File extension, used for the name of a new blob
+
+        Returns:
+            Path of the stored file
+        """
+        if self._db is None:
+            self._load()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            blob = self._blobs.get(digest)
+            # Another process's collector may have removed the file since
+            if blob is not None and os.path.exists(self._path(digest, blob.ext)):
+                self._reference(digest, document_id)
+                self._stats["duplicates"] += 1
+                current_span().set_attributes(deduplicated=True)
+                return self._path(digest, blob.ext)
+
+        path = self._path(digest, file_ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            # A concurrent upload of the same bytes may have won the race
+            blob = self._blobs.get(digest)
+            if blob is None or not os.path.exists(self._path(digest, blob.ext)):
+                now = time.time()
+                refs = 0
+                if blob is None:
+                    self._disk_bytes += len(content)
+                else:
+                    refs = blob.refs
+                blob = _Blob(file_ext, len(content), now, now, refs)
+                self._blobs[digest] = blob
+                self._dirty_blobs.add(digest)
+                self._stats["writes"] += 1
+            self._reference(digest, document_id)
+            return self._path(digest, blob.ext)
+
+    def _reference(self, digest: str, document_id: str) -> None:
+        """Point a document at a stored blob. Caller must hold the lock."""
+        blob = self._blobs[digest]
+        previous = self._documents.get(document_id)
+        if previous != digest:
+            if previous is not None:
+                self._blobs[previous].refs -= 1
+                self._dirty_blobs.add(previous)
+            self._documents[document_id] = digest
+            self._dirty_documents.add(document_id)
+            blob.refs += 1
+        blob.last_used = time.time()
+        self._dirty_blobs.add(digest)
+
+    def release(self, document_id: str) -> None:
+        """Drop a document's reference; unreferenced blobs go on the next GC."""
+        with self._lock:
+            digest = self._documents.pop(document_id, None)
+            if digest is None:
+                return
+            self._blobs[digest].refs -= 1
+            self._dirty_blobs.add(digest)
+            self._dirty_documents.add(document_id)
+
+    def _run(self) -> None:
+        """Flush new references often and collect garbage every interval."""
+        next_gc = time.monotonic() + self.gc_interval_seconds
+        while not self._stop.wait(self.flush_seconds):
+            try:
+                self.flush()
+                if time.monotonic() >= next_gc:
+                    self.collect()
+                    next_gc = time.monotonic() + self.gc_interval_seconds
+            except Exception as e:
+                logger.error(f"Blob store maintenance failed: {str(e)}")
+
+    def flush(self) -> None:
+        """Write references and blobs changed since the last flush to the index."""
+        if self._db is None:
+            return
+        with self._lock:
+            if not self._dirty_blobs and not self._dirty_documents:
+                return
+            blob_rows = []
+            removed_blobs = []
+            for digest in self._dirty_blobs:
+                blob = self._blobs.get(digest)
+                if blob is None:
+                    removed_blobs.append((digest,))
+                else:
+                    blob_rows.append(
+                        (digest, blob.ext, blob.size, blob.created, blob.last_used)
+                    )
+            ref_rows = []
+            removed_refs = []
+            for document_id in self._dirty_documents:
+                digest = self._documents.get(document_id)
+                if digest is None:
+                    removed_refs.append((document_id,))
+                else:
+                    ref_rows.append((document_id, digest))
+            self._dirty_blobs.clear()
+            self._dirty_documents.clear()
+
+        with self._db_lock:
+            with self._db:
+                # Another process may have referenced the blob more recently
+                self._db.executemany(
+                    "INSERT INTO blobs VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(digest) DO UPDATE SET "
+                    "last_used = MAX(last_used, excluded.last_used)",
+                    blob_rows,
+                )
+                self._db.executemany(
+                    "DELETE FROM blobs WHERE digest = ?", removed_blobs
+                )
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO refs VALUES (?, ?)", ref_rows
+                )
+                self._db.executemany(
+                    "DELETE FROM refs WHERE document_id = ?", removed_refs
+                )
+
+    def _sync(self) -> None:
+        """
+        Reload blobs and references from the index file.
+
+        Other processes sharing the directory (e.g. uvicorn workers) keep
+        their own references in memory and flush them to the same file, so
+        the collector must see them before it deletes anything. Changes made
+        here since the last flush are kept.
+        """
+        with self._db_lock:
+            if self._db is None:
+                return
+            blob_rows = self._db.execute(
+                "SELECT digest, ext, size, created, last_used FROM blobs"
+            ).fetchall()
+            ref_rows = self._db.execute(
+                "SELECT document_id, digest FROM refs"
+            ).fetchall()
+
+        with self._lock:
+            blobs: Dict[str, _Blob] = {}
+            for digest, ext, size, created, last_used in blob_rows:
+                current = self._blobs.get(digest)
+                if current is not None:
+                    last_used = max(last_used, current.last_used)
+                blobs[digest] = _Blob(ext, size, created, last_used)
+            for digest in self._dirty_blobs:
+                if digest in self._blobs:
+                    blobs[digest] = self._blobs[digest]
+                else:
+                    blobs.pop(digest, None)
+
+            documents = dict(ref_rows)
+            for document_id in self._dirty_documents:
+                digest = self._documents.get(document_id)
+                if digest is None:
+                    documents.pop(document_id, None)
+                else:
+                    documents[document_id] = digest
+
+            for blob in blobs.values():
+                blob.refs = 0
+            for document_id, digest in list(documents.items()):
+                if digest in blobs:
+                    blobs[digest].refs += 1
+                else:
+                    # The blob was collected by another process
+                    del documents[document_id]
+                    self._dirty_documents.add(document_id)
+            self._blobs = blobs
+            self._documents = documents
+            self._disk_bytes = sum(blob.size for blob in blobs.values())
+
+    def collect(self) -> Dict[str, int]:
+        """
+        Remove unreferenced and expired blobs, then evict to the size budget.
+
+        The index file is reloaded first, so references held by other
+        processes keep their blobs. References of documents whose blob is
+        collected are dropped too.
+
+        Returns:
+            Number of files and bytes removed
+        """
+        self.flush()
+        self._sync()
+        now = time.time()
+        with self._lock:
+            doomed = [
+                digest
+                for digest, blob in self._blobs.items()
+                if blob.refs <= 0
+                or (self.ttl_seconds and now - blob.last_used > self.ttl_seconds)
+            ]
+            if self.max_disk_bytes:
+                # Evict down to 90% of the budget so we don't collect on every pass
+                target = int(self.max_disk_bytes * 0.9)
+                remaining = self._disk_bytes - sum(
+                    self._blobs[digest].size for digest in doomed
+                )
+                if remaining > self.max_disk_bytes:
+                    kept = set(doomed)
+                    for digest, blob in sorted(
+                        self._blobs.items(), key=lambda item: item[1].last_used
+                    ):
+                        if remaining <= target:
+                            break
+                        if digest not in kept:
+                            doomed.append(digest)
+                            remaining -= blob.size
+
+            # Files are removed under the lock so a concurrent upload of the
+            # same bytes cannot be rewritten and then deleted
+            removed = {"files": 0, "bytes": 0}
+            doomed_set = set(doomed)
+            for digest in doomed:
+                blob = self._blobs.pop(digest)
+                self._disk_bytes -= blob.size
+                self._dirty_blobs.add(digest)
+                if self._remove_file(self._path(digest, blob.ext)):
+                    removed["files"] += 1
+                    removed["bytes"] += blob.size
+            for document_id, digest in list(self._documents.items()):
+                if digest in doomed_set:
+                    del self._documents[document_id]
+                    self._dirty_documents.add(document_id)
+
+        removed["files"] += self._remove_orphans(now)
+        with self._lock:
+            self._stats["collected"] += removed["files"]
+            self._stats["collected_bytes"] += removed["bytes"]
+        self.flush()
+        if removed["files"]:
+            logger.info(
+                f"Blob store collected {removed['files']} files "
+                f"({removed['bytes']} bytes)"
+            )
+        return removed
+
+    def _remove_file(self, path: str) -> bool:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove blob {path}: {str(e)}")
+            return False
+        return True
+
+    def _remove_orphans(self, now: float) -> int:
+        """
+        Delete old files and temporaries that no index entry points to.
+
+        Relies on the index just reloaded by collect; files written by other
+        processes are in the index file long before the grace period ends.
+        """
+        candidates = []
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for subshard in os.scandir(shard.path):
+                if not subshard.is_dir():
+                    continue
+                for entry in os.scandir(subshard.path):
+                    try:
+                        if (
+                            entry.is_file()
+                            and now - entry.stat().st_mtime > _ORPHAN_GRACE_SECONDS
+                        ):
+                            candidates.append(entry)
+                    except OSError:
+                        pass
+        if not candidates:
+            return 0
+
+        removed = 0
+        with self._lock:
+            for entry in candidates:
+                blob = self._blobs.get(entry.name[:64])
+                if blob is not None and entry.name == f"{entry.name[:64]}{blob.ext}":
+                    continue
+                if self._remove_file(entry.path):
+                    removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, float]:
+        """Returns file, reference and byte counts and GC counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["files"] = len(self._blobs)
+            stats["documents"] = len(self._documents)
+            stats["disk_bytes"] = self._disk_bytes
+        stats["dedup_ratio"] = (
+            round(stats["documents"] / stats["files"], 4) if stats["files"] else 0.0
+        )
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop the collector and write pending references."""
+        if self._worker is not None:
+            self._stop.set()
+            self._worker.join()
+            self._worker = None
+        self.flush()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# Global blob store instance
+blob_store = BlobStore()
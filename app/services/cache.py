@@ -0,0 +1,257 @@
+"""
+Two-tier result cache for LLM resume parsing.
+
+Parsed results are keyed by a hash of the normalized resume text, the model
+name and the prompt fingerprint. The schema of ``ResumeData`` is folded into
+every key and into the on-disk namespace, so changing the model class or the
+prompt invalidates old entries automatically.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from app.models import ResumeData
+from app.utils.logger import logger
+
+load_dotenv()
+
+# Configuration from environment variables
+PARSE_CACHE_ENABLED = os.getenv("PARSE_CACHE_ENABLED", "true").lower() == "true"
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR", "data/cache")
+PARSE_CACHE_MAX_ITEMS = int(os.getenv("PARSE_CACHE_MAX_ITEMS", "512"))
+PARSE_CACHE_MAX_DISK_MB = int(os.getenv("PARSE_CACHE_MAX_DISK_MB", "256"))
+PARSE_CACHE_TTL_SECONDS = int(os.getenv("PARSE_CACHE_TTL_SECONDS", str(7 * 86400)))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different extractions share a key."""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def schema_fingerprint() -> str:
+    """Returns a short hash of the ResumeData JSON schema."""
+    schema = json.dumps(ResumeData.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+class ParseCache:
+    """In-memory LRU backed by a size and TTL bounded disk tier."""
+
+    def __init__(
+        self,
+        cache_dir: str = PARSE_CACHE_DIR,
+        max_items: int = PARSE_CACHE_MAX_ITEMS,
+        max_disk_bytes: int = PARSE_CACHE_MAX_DISK_MB * 1024 * 1024,
+        ttl_seconds: int = PARSE_CACHE_TTL_SECONDS,
+        enabled: bool = PARSE_CACHE_ENABLED,
+    ):
+        self.enabled = enabled
+        self.max_items = max_items
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+        self._schema = schema_fingerprint()
+        self._root = cache_dir
+        self._dir = os.path.join(cache_dir, self._schema)
+        self._memory: "OrderedDict[str, ResumeData]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self._stats: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+        }
+
+        if self.enabled:
+            self._prepare_disk()
+
+    def _prepare_disk(self) -> None:
+        """Create the namespace directory and purge entries of old schemas."""
+        os.makedirs(self._dir, exist_ok=True)
+        for name in os.listdir(self._root):
+            path = os.path.join(self._root, name)
+            if name != self._schema and os.path.isdir(path):
+                logger.info(f"Purging stale parse cache namespace: {name}")
+                shutil.rmtree(path, ignore_errors=True)
+
+        for entry in os.scandir(self._dir):
+            if entry.is_file():
+                self._disk_bytes += entry.stat().st_size
+
+    def make_key(self, text: str, model_name: str, prompt_fingerprint: str) -> str:
+        """
+        Build the cache key for a parse request.
+
+        Args:
+            text: Extracted resume text
+            model_name: Chat model used for parsing
+            prompt_fingerprint: Hash or version identifying the prompt
+
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        for part in (
+            self._schema,
+            model_name,
+            prompt_fingerprint,
+            normalize_text(text),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[ResumeData]:
+        """
+        Look up a parsed result.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            ResumeData if cached and fresh, None otherwise
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return cached.model_copy(deep=True)
+
+        path = self._path(key)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age > self.ttl_seconds:
+                self._remove_file(path)
+                raise FileNotFoundError(path)
+            with open(path, "r", encoding="utf-8") as f:
+                data = ResumeData.model_validate_json(f.read())
+        except (OSError, ValueError):
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self._stats["disk_hits"] += 1
+            self._remember(key, data)
+        return data.model_copy(deep=True)
+
+    def set(self, key: str, data: ResumeData) -> None:
+        """
+        Store a parsed result in both tiers.
+
+        Args:
+            key: Cache key from make_key
+            data: Parsed resume data
+        """
+        if not self.enabled:
+            return
+
+        payload = data.model_dump_json().encode("utf-8")
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        # An entry for the same key is replaced, so its bytes no longer count
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write parse cache entry: {str(e)}")
+            payload = b""
+            replaced = 0
+
+        with self._lock:
+            self._remember(key, data.model_copy(deep=True))
+            self._stats["writes"] += 1
+            self._disk_bytes += len(payload) - replaced
+            over_budget = self._disk_bytes > self.max_disk_bytes
+
+        if over_budget:
+            self._evict_disk()
+
+    def _remember(self, key: str, data: ResumeData) -> None:
+        """Insert into the memory tier. Caller must hold the lock."""
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _remove_file(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
+            self._stats["evictions"] += 1
+
+    def _evict_disk(self) -> None:
+        """Drop expired entries, then the oldest ones until under budget."""
+        entries = []
+        now = time.time()
+        for entry in os.scandir(self._dir):
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            stat = entry.stat()
+            if now - stat.st_mtime > self.ttl_seconds:
+                self._remove_file(entry.path)
+            else:
+                entries.append((stat.st_mtime, entry.path))
+
+        # Evict down to 90% of the budget so we don't rescan on every write
+        target = int(self.max_disk_bytes * 0.9)
+        for _, path in sorted(entries):
+            if self._disk_bytes <= target:
+                break
+            self._remove_file(path)
+
+        logger.info(f"Parse cache evicted to {self._disk_bytes} bytes on disk")
+
+    def clear(self) -> None:
+        """Remove all cached entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._disk_bytes = 0
+        if self.enabled:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            os.makedirs(self._dir, exist_ok=True)
+
+    def stats(self) -> Dict[str, float]:
+        """Returns hit/miss counters and tier sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_items"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4)
+            if lookups
+            else 0.0
+        )
+        return stats
+
+
+# Global cache instance
+parse_cache = ParseCache()
@@ -0,0 +1,218 @@
+"""
+Prompt-size compaction of extracted resume text.
+
+Runs between text extraction and the LLM call. It drops page furniture
+(running headers/footers and page numbers), collapses whitespace, removes
+DOCX table cells that repeat paragraph text, and enforces a token budget.
+"""
+
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+from app.services.document_extractor import PAGE_BREAK, TABLE_CELL_SEPARATOR
+from app.utils.logger import logger
+from app.utils.tokenizer import count_tokens, truncate_to_tokens
+
+load_dotenv()
+
+# Configuration from environment variables
+COMPACTION_ENABLED = os.getenv("COMPACTION_ENABLED", "true").lower() == "true"
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "8000"))
+
+# Lines at the top/bottom of each page inspected for running headers/footers
+_FURNITURE_DEPTH = 3
+_PAGE_NUMBER_RE = re.compile(
+    r"^\s*(?:page\s*)?\d{1,3}(?:\s*(?:of|/)\s*\d{1,3})?\s*$", re.IGNORECASE
+)
+_DIGITS_RE = re.compile(r"\d+")
+_SPACES_RE = re.compile(r"[ \t ]+")
+
+
+@dataclass
+class CompactionResult:
+    """Compacted text and its token accounting."""
+
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+    truncated: bool = False
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.compacted_tokens
+
+    @property
+    def savings_ratio(self) -> float:
+        if not self.original_tokens:
+            return 0.0
+        return round(self.saved_tokens / self.original_tokens, 4)
+
+
+def _furniture_key(line: str) -> str:
+    """Normalize a line so "Page 2 of 5" and "Page 3 of 5" compare equal."""
+    key = _SPACES_RE.sub(" ", line).strip().lower()
+    if "page" in key:
+        key = _DIGITS_RE.sub("#", key)
+    return key
+
+
+def _remove_page_furniture(pages: List[List[str]]) -> List[List[str]]:
+    """Drop headers/footers repeated on most pages and edge page numbers."""
+    if len(pages) < 2:
+        return pages
+
+    edges = (slice(0, _FURNITURE_DEPTH), slice(-_FURNITURE_DEPTH, None))
+    # Indexes of the non-blank lines at the top and bottom of each page
+    page_edges = []
+    for lines in pages:
+        content = [i for i, line in enumerate(lines) if line.strip()]
+        page_edges.append([content[edge] for edge in edges])
+
+    # Headers and footers are counted separately so a line must recur
+    # at the same edge of the page to count as furniture
+    threshold = max(2, (len(pages) + 1) // 2)
+    furniture = []
+    for side in range(len(edges)):
+        counts: Counter = Counter()
+        for lines, sides in zip(pages, page_edges):
+            counts.update({_furniture_key(lines[i]) for i in sides[side]})
+        furniture.append({key for key, count in counts.items() if count >= threshold})
+
+    cleaned = []
+    for page_num, (lines, sides) in enumerate(zip(pages, page_edges)):
+        # Furniture and page numbers only sit at the edges of a page;
+        # elsewhere the same text is content (a score, a repeated heading)
+        drop = set()
+        for side, indexes in enumerate(sides):
+            for i in indexes:
+                if _PAGE_NUMBER_RE.match(lines[i]):
+                    drop.add(i)
+                # Keep the first page's copy: running headers often carry the name
+                elif page_num > 0 and _furniture_key(lines[i]) in furniture[side]:
+                    drop.add(i)
+        kept = [line for i, line in enumerate(lines) if i not in drop]
+        cleaned.append(kept)
+    return cleaned
+
+
+def _compact_lines(lines: List[str]) -> List[str]:
+    """Collapse whitespace and dedupe table cells already seen in paragraphs."""
+    paragraphs = {
+        _SPACES_RE.sub(" ", line).strip().lower()
+        for line in lines
+        if TABLE_CELL_SEPARATOR not in line
+    }
+
+    compacted: List[str] = []
+    for line in lines:
+        if TABLE_CELL_SEPARATOR in line:
+            cells: List[str] = []
+            for cell in line.split(TABLE_CELL_SEPARATOR):
+                cell = _SPACES_RE.sub(" ", cell).strip()
+                # Merged cells repeat; cells echoing a paragraph add nothing
+                if not cell or (cells and cells[-1] == cell):
+                    continue
+                if cell.lower() in paragraphs:
+                    continue
+                cells.append(cell)
+            line = " | ".join(cells)
+        else:
+            line = _SPACES_RE.sub(" ", line).strip()
+
+        if line or (compacted and compacted[-1]):
+            compacted.append(line)
+
+    while compacted and not compacted[-1]:
+        compacted.pop()
+    return compacted
+
+
+def compact_text(
+    text: str,
+    token_budget: int = PROMPT_TOKEN_BUDGET,
+    model_name: Optional[str] = None,
+) -> CompactionResult:
+    """
+    Compact extracted resume text for the LLM prompt.
+
+    Args:
+        text: Text from DocumentExtractor.extract_text
+        token_budget: Maximum tokens to keep (0 disables the budget)
+        model_name: Chat model whose tokenizer is used for counting
+
+    Returns:
+        CompactionResult with the compacted text and token counts
+    """
+    original_tokens = count_tokens(text, model_name)
+
+    pages = [page.splitlines() for page in text.split(PAGE_BREAK)]
+    pages = _remove_page_furniture(pages)
+    lines: List[str] = []
+    for page in pages:
+        lines.extend(page)
+        lines.append("")
+    compacted = "\n".join(_compact_lines(lines))
+
+    compacted_tokens = count_tokens(compacted, model_name)
+    truncated = False
+    if token_budget and compacted_tokens > token_budget:
+        logger.warning(
+            f"Resume text has {compacted_tokens} tokens, truncating to {token_budget}"
+        )
+        compacted = truncate_to_tokens(compacted, token_budget, model_name)
+        compacted_tokens = count_tokens(compacted, model_name)
+        truncated = True
+
+    result = CompactionResult(
+        text=compacted,
+        original_tokens=original_tokens,
+        compacted_tokens=compacted_tokens,
+        truncated=truncated,
+    )
+    compaction_stats.record(result)
+    logger.info(
+        f"Compacted resume text: {original_tokens} -> {compacted_tokens} tokens "
+        f"({result.savings_ratio:.1%} saved)"
+    )
+    return result
+
+
+class CompactionStats:
+    """Running totals of input-token savings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {
+            "documents": 0,
+            "original_tokens": 0,
+            "compacted_tokens": 0,
+            "truncated": 0,
+        }
+
+    def record(self, result: CompactionResult) -> None:
+        with self._lock:
+            self._totals["documents"] += 1
+            self._totals["original_tokens"] += result.original_tokens
+            self._totals["compacted_tokens"] += result.compacted_tokens
+            self._totals["truncated"] += int(result.truncated)
+
+    def stats(self) -> Dict[str, float]:
+        """Returns totals and the overall savings ratio."""
+        with self._lock:
+            stats = dict(self._totals)
+        saved = stats["original_tokens"] - stats["compacted_tokens"]
+        stats["saved_tokens"] = saved
+        stats["savings_ratio"] = (
+            round(saved / stats["original_tokens"], 4)
+            if stats["original_tokens"]
+            else 0.0
+        )
+        return stats
+
+
+# Global compaction statistics
+compaction_stats = CompactionStats()
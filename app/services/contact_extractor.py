@@ -0,0 +1,166 @@
+"""
+Rule-based extraction of contact details from resume text and hyperlinks.
+
+Email, phone and profile URLs follow rigid formats, so they are pulled out
+locally instead of being generated by the LLM.
+"""
+
+import re
+from typing import Iterable, List, Optional
+from app.models import ContactInformation
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_RE = re.compile(r"(?<![\w/.])\+?\(?\d[\d\s().-]{6,18}\d(?![\w/])")
+LINKEDIN_RE = re.compile(
+    r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%-]+/?",
+    re.IGNORECASE,
+)
+GITHUB_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})/?",
+    re.IGNORECASE,
+)
+URL_RE = re.compile(
+    r"(?:https?://|www\.)[A-Za-z0-9.-]+\.[A-Za-z]{2,}(?:/[^\s,;)\]]*)?",
+    re.IGNORECASE,
+)
+NAME_RE = re.compile(r"^[A-Z][A-Za-z'.-]+(?: [A-Z][A-Za-z'.-]*){1,3}$")
+
+# Hosts that are never a candidate's own portfolio
+_NON_PORTFOLIO_HOSTS = ("linkedin.com", "github.com", "mailto:", "tel:")
+
+# Fields the rule-based extractor owns when it finds a value
+PREFILLABLE_FIELDS = ("email", "linkedin", "github")
+# Fields the LLM still extracts; the rule-based value only fills a blank.
+# The portfolio guess is any other URL, which may be an employer or a course
+FALLBACK_FIELDS = ("phone", "portfolio")
+
+# Dates that look like phone numbers: 2019 - 2021, 2016.08 - 2020.05, 2020-05-01
+_DATE = r"(?:19|20)\d{2}(?:\s*[./-]\s*\d{1,2}){0,2}"
+_DATE_LIKE_RE = re.compile(rf"{_DATE}(?:\s*(?:-|–|to)\s*{_DATE})?")
+_PHONE_PUNCTUATION = "()[]{}.,;: "
+
+
+def _normalize_url(url: str) -> str:
+    url = url.strip().rstrip("/.,;")
+    if not url.lower().startswith(("http://", "https://")):
+        url = f"https://{url}"
+    return url
+
+
+def _first(pattern: re.Pattern, candidates: Iterable[str]) -> Optional[str]:
+    for candidate in candidates:
+        match = pattern.search(candidate)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _find_phone(text: str, links: List[str]) -> Optional[str]:
+    for link in links:
+        if link.lower().startswith("tel:"):
+            return link[4:].strip()
+    for match in PHONE_RE.finditer(text):
+        phone = match.group(0).strip()
+        digits = re.sub(r"\D", "", phone)
+        if not 7 <= len(digits) <= 15:
+            continue
+        # Skip dates and date ranges, also inside brackets: "(2015 - 2019)"
+        if _DATE_LIKE_RE.fullmatch(phone.strip(_PHONE_PUNCTUATION)):
+            continue
+        # A bare digit run is more likely an ID or a number than a phone
+        if phone.isdigit():
+            continue
+        return phone
+    return None
+
+
+def _find_portfolio(text: str, links: List[str]) -> Optional[str]:
+    for candidate in list(links) + [m.group(0) for m in URL_RE.finditer(text)]:
+        lowered = candidate.lower()
+        if any(host in lowered for host in _NON_PORTFOLIO_HOSTS):
+            continue
+        if URL_RE.match(candidate):
+            return _normalize_url(candidate)
+    return None
+
+
+def guess_name(text: str) -> Optional[str]:
+    """
+    Guess the candidate name from the first lines of the resume.
+
+    Args:
+        text: Extracted resume text
+
+    Returns:
+        A capitalized 2-4 word line near the top, or None
+    """
+    for line in text.splitlines()[:5]:
+        line = line.strip()
+        if line and NAME_RE.match(line) and "@" not in line:
+            return line
+    return None
+
+
+def extract_contact_info(
+    text: str, links: Optional[List[str]] = None, include_name: bool = False
+) -> ContactInformation:
+    """
+    Extract contact details with regular expressions.
+
+    Args:
+        text: Extracted resume text
+        links: Hyperlink targets found in the document
+        include_name: Also guess the name heuristically (not used as LLM prefill)
+
+    Returns:
+        ContactInformation with the fields that could be found
+    """
+    links = [link.strip() for link in (links or []) if link and link.strip()]
+    mailto = [link[7:] for link in links if link.lower().startswith("mailto:")]
+
+    email = _first(EMAIL_RE, mailto + [text])
+    linkedin = _first(LINKEDIN_RE, links + [text])
+    github = _first(GITHUB_RE, links + [text])
+
+    return ContactInformation(
+        name=guess_name(text) if include_name else None,
+        email=email.lower() if email else None,
+        phone=_find_phone(text, links),
+        linkedin=_normalize_url(linkedin) if linkedin else None,
+        github=_normalize_url(github) if github else None,
+        portfolio=_find_portfolio(text, links),
+    )
+
+
+def prefilled_fields(contact: Optional[ContactInformation]) -> List[str]:
+    """Returns the names of prefillable fields that already have a value."""
+    if contact is None:
+        return []
+    return [field for field in PREFILLABLE_FIELDS if getattr(contact, field)]
+
+
+def merge_contact_info(
+    generated: Optional[ContactInformation], prefilled: Optional[ContactInformation]
+) -> Optional[ContactInformation]:
+    """
+    Overlay rule-based values onto LLM-generated contact information.
+
+    Prefillable fields override the LLM's values; fallback fields (the
+    phone and portfolio) only fill what the LLM left empty.
+
+    Args:
+        generated: Contact information produced by the LLM
+        prefilled: Contact information extracted locally
+
+    Returns:
+        Merged contact information
+    """
+    if prefilled is None:
+        return generated
+    merged = generated.model_copy() if generated else ContactInformation()
+    for field in prefilled_fields(prefilled):
+        setattr(merged, field, getattr(prefilled, field))
+    for field in FALLBACK_FIELDS:
+        if not getattr(merged, field) and getattr(prefilled, field):
+            setattr(merged, field, getattr(prefilled, field))
+    return merged
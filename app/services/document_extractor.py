@@ -1,84 +1,280 @@
 """
 Document text extraction service for PDF and DOCX files.
+
+Text is assembled in linear time and bounded by a page limit and a
+character cap, so oversized uploads (e.g. a long portfolio PDF) cost a
+bounded amount of CPU and memory. PDFs without a text layer on their first
+pages are rejected before the rest is read.
 """
 
+import io
+import itertools
+import os
 import sys
+import time
+from typing import Iterable, Iterator, List, Tuple, Union
 import pymupdf  # PyMuPDF
 from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE
+from dotenv import load_dotenv
 from app.utils.custom_exception import CustomException
 from app.utils.logger import logger
+from app.utils.metrics import DOCUMENT_CHARACTERS, DOCUMENT_PAGES, STAGE_SECONDS
+from app.utils.tracing import current_span, span, traced
+
+load_dotenv()
+
+# Configuration from environment variables
+# Only the first MAX_PDF_PAGES pages are read (0 reads all)
+MAX_PDF_PAGES = int(os.getenv("MAX_PDF_PAGES", "50"))
+# Extracted text is cut at this many characters (0 disables the cap)
+MAX_EXTRACTED_CHARS = int(os.getenv("MAX_EXTRACTED_CHARS", "200000"))
+# Leading pages that must contain some text, or the PDF is treated as scanned
+TEXT_LAYER_SAMPLE_PAGES = int(os.getenv("TEXT_LAYER_SAMPLE_PAGES", "3"))
+
+# A document is either a path on disk or its raw bytes held in memory
+DocumentSource = Union[str, bytes]
+
+# Separators kept in extracted text so later stages can see the layout
+PAGE_BREAK = "\f"
+TABLE_CELL_SEPARATOR = "\t"
+
+
+def describe_source(source: DocumentSource) -> str:
+    """Returns a short, log-friendly description of a document source."""
+    if isinstance(source, (bytes, bytearray)):
+        return f"<in-memory, {len(source)} bytes>"
+    return source
+
+
+def record_extraction(file_extension: str, text: str, seconds: float) -> None:
+    """
+    Record the duration, page count and size of one extraction.
+
+    Metrics recorded in extraction worker processes are not exported, so
+    the pipeline calls this in the parent for pool extractions. Pages are
+    counted for PDFs only; DOCX files have no fixed pagination.
+
+    Args:
+        file_extension: File extension (.pdf or .docx)
+        text: Extracted text
+        seconds: Extraction time
+    """
+    fmt = file_extension.lower().lstrip(".")
+    STAGE_SECONDS.observe(seconds, stage="extract")
+    DOCUMENT_CHARACTERS.observe(len(text), format=fmt)
+    current_span().set_attributes(format=fmt, characters=len(text))
+    if fmt == "pdf":
+        # The trailing page break is stripped with the surrounding whitespace
+        pages = text.count(PAGE_BREAK) + 1
+        DOCUMENT_PAGES.observe(pages, format=fmt)
+        current_span().set_attributes(pages=pages)
+
+
+class _TextBuilder:
+    """Collects text pieces in a list and joins once, up to a character cap."""
+
+    def __init__(self, limit: int = MAX_EXTRACTED_CHARS):
+        self.limit = limit
+        self.parts: List[str] = []
+        self.size = 0
+
+    def add(self, piece: str) -> bool:
+        """Append a piece; returns False once the cap has been reached."""
+        if self.limit and self.size + len(piece) > self.limit:
+            self.parts.append(piece[: self.limit - self.size])
+            self.size = self.limit
+            logger.warning(f"Extracted text capped at {self.limit} characters")
+            return False
+        self.parts.append(piece)
+        self.size += len(piece)
+        return True
+
+    def build(self) -> str:
+        return "".join(self.parts)
+
+
+def _open_pdf(source: DocumentSource) -> pymupdf.Document:
+    """Open a PDF from disk or directly from memory."""
+    if isinstance(source, (bytes, bytearray)):
+        return pymupdf.open(stream=source, filetype="pdf")
+    return pymupdf.open(source)
+
+
+def _page_limit(doc: pymupdf.Document) -> int:
+    """Number of leading pages to extract, honouring MAX_PDF_PAGES."""
+    pages = len(doc)
+    if MAX_PDF_PAGES and pages > MAX_PDF_PAGES:
+        logger.warning(f"PDF has {pages} pages, extracting the first {MAX_PDF_PAGES}")
+        return MAX_PDF_PAGES
+    return pages
+
+
+def _page_text(doc: pymupdf.Document, index: int) -> str:
+    with span("extract.page", page=index):
+        return doc[index].get_text()
+
+
+def _leading_pages(doc: pymupdf.Document, limit: int) -> List[str]:
+    """
+    Extract the first few pages and fail fast on scanned documents.
+
+    Raises:
+        ValueError: If the sampled pages have images but no text layer
+    """
+    sample = [_page_text(doc, i) for i in range(min(limit, TEXT_LAYER_SAMPLE_PAGES))]
+    if sample and not any(page.strip() for page in sample):
+        if any(doc[i].get_images() for i in range(len(sample))):
+            raise ValueError(
+                "PDF appears to be scanned (image-only) and has no extractable "
+                "text; OCR is not supported"
+            )
+    return sample
+
+
+def join_pdf_pages(pages: Iterable[str], source: DocumentSource) -> str:
+    """
+    Assemble page texts separated by page breaks, within the character cap.
+
+    Args:
+        pages: Page texts in order; consumed lazily, so pages past the cap
+            are never extracted when a generator is passed
+        source: The PDF, for log messages
+
+    Returns:
+        Extracted text content
+    """
+    builder = _TextBuilder()
+    for page in pages:
+        if not builder.add(page + PAGE_BREAK):
+            break
+    text = builder.build()
+
+    if not text.strip():
+        logger.warning(f"No text extracted from PDF: {describe_source(source)}")
+        raise ValueError("PDF file appears to be empty or contains no extractable text")
+
+    logger.info(f"Successfully extracted {len(text)} characters from PDF")
+    return text.strip()
+
+
+def _docx_pieces(doc) -> Iterator[str]:
+    """Yield paragraph lines, then table rows cell by cell, lazily."""
+    for paragraph in doc.paragraphs:
+        yield paragraph.text + "\n"
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                yield cell.text + TABLE_CELL_SEPARATOR
+            yield "\n"
+
+
+def inspect_pdf(source: DocumentSource) -> int:
+    """
+    Check a PDF's text layer and count the pages that would be extracted.
+
+    Args:
+        source: Path to the PDF file or its raw bytes
+
+    Returns:
+        Number of pages to extract (after MAX_PDF_PAGES)
+
+    Raises:
+        ValueError: If the PDF looks scanned (image-only)
+    """
+    doc = _open_pdf(source)
+    try:
+        limit = _page_limit(doc)
+        _leading_pages(doc, limit)
+        return limit
+    finally:
+        doc.close()
+
+
+def extract_pdf_pages_worker(
+    source: DocumentSource, start: int, stop: int
+) -> List[str]:
+    """
+    Process-pool entry point extracting the text of pages ``start`` to ``stop``.
+
+    Args:
+        source: Path to the PDF file or its raw bytes
+        start: First page (0-based)
+        stop: Page after the last one to extract
+
+    Returns:
+        Page texts in order
+    """
+    try:
+        doc = _open_pdf(source)
+        try:
+            return [doc[i].get_text() for i in range(start, stop)]
+        finally:
+            doc.close()
+    except Exception as e:
+        raise ValueError(str(e)) from None
 
 
 class DocumentExtractor:
     """Extract text content from PDF and DOCX files."""
 
-    def extract_from_pdf(file_path: str) -> str:
+    def extract_from_pdf(source: DocumentSource) -> str:
         """
         Extract text from a PDF file.
 
         Args:
-            file_path: Path to the PDF file
+            source: Path to the PDF file or its raw bytes
 
         Returns:
             Extracted text content
         """
         try:
-            logger.info(f"Extracting text from PDF: {file_path}")
-            text = ""
+            logger.info(f"Extracting text from PDF: {describe_source(source)}")
 
-            # Open the PDF file
-            doc = pymupdf.open(file_path)
-
-            # Extract text from each page
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text += page.get_text()
-
-            doc.close()
-
-            if not text.strip():
-                logger.warning(f"No text extracted from PDF: {file_path}")
-                raise ValueError(
-                    "PDF file appears to be empty or contains no extractable text"
-                )
-
-            logger.info(f"Successfully extracted {len(text)} characters from PDF")
-            return text.strip()
+            doc = _open_pdf(source)
+            try:
+                limit = _page_limit(doc)
+                # Scanned PDFs fail here, before the remaining pages are read
+                leading = _leading_pages(doc, limit)
+                remaining = (_page_text(doc, i) for i in range(len(leading), limit))
+                return join_pdf_pages(itertools.chain(leading, remaining), source)
+            finally:
+                doc.close()
 
         except Exception as e:
             logger.error(f"Failed to extract text from PDF: {str(e)}")
             raise CustomException(e, sys)
 
-    def extract_from_docx(file_path: str) -> str:
+    def extract_from_docx(source: DocumentSource) -> str:
         """
         Extract text from a DOCX file.
 
         Args:
-            file_path: Path to the DOCX file
+            source: Path to the DOCX file or its raw bytes
 
         Returns:
             Extracted text content
         """
         try:
-            logger.info(f"Extracting text from DOCX: {file_path}")
-            text = ""
-
-            # Open the DOCX file
-            doc = Document(file_path)
+            logger.info(f"Extracting text from DOCX: {describe_source(source)}")
 
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            # Open the DOCX from disk or directly from memory
+            if isinstance(source, (bytes, bytearray)):
+                doc = Document(io.BytesIO(source))
+            else:
+                doc = Document(source)
 
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+            # Paragraphs first, then tables, stopping at the character cap
+            builder = _TextBuilder()
+            for piece in _docx_pieces(doc):
+                if not builder.add(piece):
+                    break
+            text = builder.build()
 
             if not text.strip():
-                logger.warning(f"No text extracted from DOCX: {file_path}")
+                logger.warning(
+                    f"No text extracted from DOCX: {describe_source(source)}"
+                )
                 raise ValueError(
                     "DOCX file appears to be empty or contains no extractable text"
                 )
@@ -90,12 +286,13 @@ class DocumentExtractor:
             logger.error(f"Failed to extract text from DOCX: {str(e)}")
             raise CustomException(e, sys)
 
-    def extract_text(file_path: str, file_extension: str) -> str:
+    @traced("extract")
+    def extract_text(source: DocumentSource, file_extension: str) -> str:
         """
         Extract text from a file based on its extension.
 
         Args:
-            file_path: Path to the file
+            source: Path to the file or its raw bytes
             file_extension: File extension (.pdf or .docx)
 
         Returns:
@@ -103,18 +300,98 @@ class DocumentExtractor:
         """
         try:
             logger.info(
-                f"Extracting text from file: {file_path} (type: {file_extension})"
+                f"Extracting text from file: {describe_source(source)} (type: {file_extension})"
             )
 
+            start = time.perf_counter()
             if file_extension.lower() == ".pdf":
-                return DocumentExtractor.extract_from_pdf(file_path)
+                text = DocumentExtractor.extract_from_pdf(source)
             elif file_extension.lower() in [".docx", ".doc"]:
-                return DocumentExtractor.extract_from_docx(file_path)
+                text = DocumentExtractor.extract_from_docx(source)
             else:
                 error_msg = f"Unsupported file format: {file_extension}. Only PDF and DOCX are supported."
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
+            record_extraction(file_extension, text, time.perf_counter() - start)
+            return text
+
         except Exception as e:
             logger.error(f"Document extraction failed: {str(e)}")
             raise CustomException(e, sys)
+
+    def extract_links(source: DocumentSource, file_extension: str) -> List[str]:
+        """
+        Extract hyperlink targets (URLs, mailto:, tel:) from a file.
+
+        Link annotations often carry profile URLs that are shown as plain
+        labels like "LinkedIn" in the text. Failures are logged and yield
+        an empty list, since links are only used to enrich contact details.
+
+        Args:
+            source: Path to the file or its raw bytes
+            file_extension: File extension (.pdf or .docx)
+
+        Returns:
+            Hyperlink targets in document order
+        """
+        links: List[str] = []
+        try:
+            if file_extension.lower() == ".pdf":
+                doc = _open_pdf(source)
+                for page_num in range(_page_limit(doc)):
+                    links.extend(
+                        link["uri"]
+                        for link in doc[page_num].get_links()
+                        if link.get("uri")
+                    )
+                doc.close()
+            elif file_extension.lower() in [".docx", ".doc"]:
+                if isinstance(source, (bytes, bytearray)):
+                    doc = Document(io.BytesIO(source))
+                else:
+                    doc = Document(source)
+                for rel in doc.part.rels.values():
+                    if rel.reltype == RELATIONSHIP_TYPE.HYPERLINK and rel.is_external:
+                        links.append(rel.target_ref)
+        except Exception as e:
+            logger.warning(f"Failed to extract links: {str(e)}")
+        return links
+
+    def extract_text_and_links(
+        source: DocumentSource, file_extension: str
+    ) -> Tuple[str, List[str]]:
+        """
+        Extract both the text and the hyperlink targets of a file.
+
+        Args:
+            source: Path to the file or its raw bytes
+            file_extension: File extension (.pdf or .docx)
+
+        Returns:
+            Tuple of extracted text and hyperlink targets
+        """
+        text = DocumentExtractor.extract_text(source, file_extension)
+        return text, DocumentExtractor.extract_links(source, file_extension)
+
+
+def extract_text_worker(
+    source: DocumentSource, file_extension: str
+) -> Tuple[str, List[str]]:
+    """
+    Process-pool entry point for DocumentExtractor.extract_text_and_links.
+
+    CustomException cannot be rebuilt from its pickled args, so failures are
+    re-raised as ValueError carrying the formatted message.
+
+    Args:
+        source: Path to the file or its raw bytes
+        file_extension: File extension (.pdf or .docx)
+
+    Returns:
+        Tuple of extracted text and hyperlink targets
+    """
+    try:
+        return DocumentExtractor.extract_text_and_links(source, file_extension)
+    except Exception as e:
+        raise ValueError(str(e)) from None
@@ -0,0 +1,156 @@
+"""
+Background job execution for asynchronous resume parsing.
+"""
+
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from dotenv import load_dotenv
+from app.models import JobStatus, ResumeResponse
+from app.utils.logger import logger
+
+load_dotenv()
+
+# Configuration from environment variables
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_DEPTH = int(os.getenv("JOB_QUEUE_DEPTH", "100"))
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", "1000"))
+
+
+class JobQueueFullError(Exception):
+    """Raised when the job queue has no room for another job."""
+
+
+class JobManager:
+    """Runs parse jobs on a bounded worker pool and tracks their status."""
+
+    def __init__(
+        self,
+        max_workers: int = JOB_WORKERS,
+        max_queue: int = JOB_QUEUE_DEPTH,
+        retention: int = JOB_RETENTION,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="parse-job"
+        )
+        self._jobs: "OrderedDict[str, JobStatus]" = OrderedDict()
+        self._queued = 0
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        fn: Callable[..., ResumeResponse],
+        *args,
+        document_id: str,
+        file_name: str,
+        **kwargs,
+    ) -> JobStatus:
+        """
+        Queue a parse job.
+
+        Args:
+            fn: Callable producing the ResumeResponse
+            document_id: Document identifier the job will produce
+            file_name: Original filename
+
+        Returns:
+            Initial job status
+
+        Raises:
+            JobQueueFullError: If the queue is at capacity
+        """
+        job = JobStatus(
+            job_id=str(uuid.uuid4()),
+            status="queued",
+            document_id=document_id,
+            file_name=file_name,
+        )
+
+        with self._lock:
+            if self._queued >= self.max_queue:
+                raise JobQueueFullError(
+                    f"Job queue is full ({self.max_queue} jobs waiting)"
+                )
+            self._queued += 1
+            self._jobs[job.job_id] = job
+            self._trim()
+            snapshot = job.model_copy()
+
+        self._executor.submit(self._run, job.job_id, fn, args, kwargs)
+        logger.info(f"Queued parse job {job.job_id} for document {document_id}")
+        return snapshot
+
+    def _run(self, job_id: str, fn: Callable, args: tuple, kwargs: Dict) -> None:
+        with self._lock:
+            self._queued -= 1
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.status = "running"
+                job.started_at = datetime.now()
+
+        try:
+            result = fn(*args, **kwargs)
+            update = {"status": "done", "result": result}
+            logger.info(f"Parse job completed: {job_id}")
+        except Exception as e:
+            update = {"status": "failed", "error": str(e)}
+            logger.error(f"Parse job failed: {job_id}: {str(e)}")
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                for field, value in update.items():
+                    setattr(job, field, value)
+                job.finished_at = datetime.now()
+
+    def _trim(self) -> None:
+        """Forget the oldest finished jobs. Caller must hold the lock."""
+        excess = len(self._jobs) - self.retention
+        if excess <= 0:
+            return
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].status in ("done", "failed"):
+                del self._jobs[job_id]
+                excess -= 1
+
+    def get(self, job_id: str) -> Optional[JobStatus]:
+        """
+        Retrieve job status by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            JobStatus if known, None otherwise
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job is not None else None
+
+    def stats(self) -> Dict[str, int]:
+        """Returns worker pool sizing and current queue occupancy."""
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job.status == "running")
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": running,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global job manager instance
+job_manager = JobManager()
@@ -1,22 +1,469 @@
+import asyncio
 import os
+import random
+import threading
+import time
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+import httpx
+import openai
 from dotenv import load_dotenv
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import BaseMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGenerationChunk, ChatResult, Generation
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from app.services.local_embeddings import HashingEmbeddings
+from app.utils.logger import logger
+from app.utils.metrics import LLM_TOKENS, STAGE_SECONDS
+from app.utils.rate_limiter import RateLimiter
+from app.utils.tokenizer import count_tokens
+from app.utils.tracing import Span, current_span, span
 
 # Load environment variables (e.g., OPENAI_API_KEY)
 load_dotenv()
 
 # Configuration from environment variables
 OPENAI_CHAT_MODEL = os.getenv("OPENAI_CHAT_MODEL", "gpt-4o")
+# Cheaper model tried first by the parse cascade (empty, the default, disables
+# the cascade)
+OPENAI_FAST_MODEL = os.getenv("OPENAI_FAST_MODEL", "")
 OPENAI_EMBED_MODEL = os.getenv("OPENAI_EMBED_MODEL", "text-embedding-3-small")
+# Point at a local OpenAI-compatible stub server for testing
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+# "local" (deterministic hashing embeddings, no network) or "openai" (paid
+# embeddings call per indexed resume and per search)
+EMBEDDINGS_PROVIDER = os.getenv("EMBEDDINGS_PROVIDER", "local").lower()
+LOCAL_EMBEDDING_DIMENSIONS = int(os.getenv("LOCAL_EMBEDDING_DIMENSIONS", "256"))
+
+# Client-side budgets (0 disables the limit)
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "0"))
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "0"))
+# Completion tokens reserved per request before the real usage is known
+LLM_COMPLETION_TOKEN_ESTIMATE = int(os.getenv("LLM_COMPLETION_TOKEN_ESTIMATE", "1500"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "30"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "50"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, RETRYABLE_ERRORS):
+        return True
+    return isinstance(error, openai.APIStatusError) and error.status_code >= 500
+
+
+class LLMClientManager:
+    """
+    Process-wide owner of LLM clients and request budgets.
+
+    Chat models and embeddings are created once per configuration and share
+    pooled HTTP connections. Every chat request reserves one request and its
+    estimated tokens from the RPM/TPM buckets before it is sent, and
+    retryable failures (429, 5xx, connection errors) are retried with
+    jittered exponential backoff, so bursts queue client-side instead of
+    being rejected by the provider.
+    """
+
+    def __init__(
+        self,
+        rpm_limit: int = LLM_RPM_LIMIT,
+        tpm_limit: int = LLM_TPM_LIMIT,
+        max_retries: int = LLM_MAX_RETRIES,
+        backoff_base: float = LLM_BACKOFF_BASE_SECONDS,
+        backoff_max: float = LLM_BACKOFF_MAX_SECONDS,
+        max_connections: int = LLM_MAX_CONNECTIONS,
+        timeout: float = LLM_TIMEOUT_SECONDS,
+        base_url: Optional[str] = OPENAI_BASE_URL,
+    ):
+        self.requests = RateLimiter(rpm_limit)
+        self.tokens = RateLimiter(tpm_limit)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.base_url = base_url
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        self._chat_models: Dict[Tuple[str, float], ChatOpenAI] = {}
+        self._embeddings: Dict[str, OpenAIEmbeddings] = {}
+        # Drop caches elsewhere that hold on to the clients created here
+        self._close_callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "throttled_seconds": 0.0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        }
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+
+    @property
+    def http_client(self) -> httpx.Client:
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                limits=self._limits(), timeout=self.timeout
+            )
+        return self._http_client
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        if self._http_async_client is None:
+            self._http_async_client = httpx.AsyncClient(
+                limits=self._limits(), timeout=self.timeout
+            )
+        return self._http_async_client
+
+    def get_chat_model(
+        self, model_name: str = OPENAI_CHAT_MODEL, temperature: float = 0.0
+    ) -> "ManagedChatOpenAI":
+        """Returns the shared chat model for this configuration."""
+        key = (model_name, temperature)
+        with self._lock:
+            if key not in self._chat_models:
+                self._chat_models[key] = ManagedChatOpenAI(
+                    model=model_name,
+                    temperature=temperature,
+                    base_url=self.base_url,
+                    http_client=self.http_client,
+                    http_async_client=self.http_async_client,
+                    # Retries are handled by the manager with shared budgets
+                    max_retries=0,
+                    timeout=self.timeout,
+                    stream_usage=True,
+                )
+                logger.info(f"Created pooled chat client for {model_name}")
+            return self._chat_models[key]
+
+    def get_embeddings(self, model_name: str = OPENAI_EMBED_MODEL) -> OpenAIEmbeddings:
+        """Returns the shared embeddings client for this model."""
+        with self._lock:
+            if model_name not in self._embeddings:
+                self._embeddings[model_name] = OpenAIEmbeddings(
+                    model=model_name,
+                    base_url=self.base_url,
+                    http_client=self.http_client,
+                    http_async_client=self.http_async_client,
+                )
+            return self._embeddings[model_name]
+
+    def _record(self, **values: float) -> None:
+        with self._lock:
+            for key, value in values.items():
+                self._stats[key] += value
+
+    def reserve(self, estimated_tokens: int) -> None:
+        """Block until a request and its tokens fit in the budgets."""
+        waited = self.requests.acquire(1) + self.tokens.acquire(estimated_tokens)
+        self._record(requests=1, throttled_seconds=waited)
+
+    async def areserve(self, estimated_tokens: int) -> None:
+        """Wait on the event loop until a request and its tokens fit."""
+        waited = await self.requests.aacquire(1)
+        waited += await self.tokens.aacquire(estimated_tokens)
+        self._record(requests=1, throttled_seconds=waited)
+
+    def settle(
+        self, estimated_tokens: int, usage: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Replace the token estimate with the provider-reported usage.
+
+        Returns:
+            Prompt and completion tokens, or None if no usage was reported
+        """
+        if not usage:
+            return None
+        prompt = usage.get("prompt_tokens") or usage.get("input_tokens") or 0
+        completion = usage.get("completion_tokens") or usage.get("output_tokens") or 0
+        self.tokens.adjust(prompt + completion - estimated_tokens)
+        self._record(prompt_tokens=prompt, completion_tokens=completion)
+        LLM_TOKENS.inc(prompt, kind="prompt")
+        LLM_TOKENS.inc(completion, kind="completion")
+        return prompt, completion
+
+    def backoff(self, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Decide whether and how long to wait before retrying.
+
+        Args:
+            attempt: Number of the failed attempt (1-based)
+            error: The raised error
+
+        Returns:
+            Delay in seconds, or None if the error should be raised
+        """
+        if not _is_retryable(error) or attempt > self.max_retries:
+            self._record(failures=1)
+            return None
+
+        # Full jitter, but never sooner than the server asked for
+        delay = random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        )
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.backoff_max))
+            except ValueError:
+                pass
+
+        self._record(retries=1)
+        logger.warning(
+            f"LLM request failed ({type(error).__name__}), "
+            f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+        )
+        return delay
+
+    def stats(self) -> Dict[str, float]:
+        """Returns request, retry, throttling and token counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["rpm_limit"] = self.requests.limit_per_minute
+        stats["tpm_limit"] = self.tokens.limit_per_minute
+        stats["throttled_seconds"] = round(stats["throttled_seconds"], 3)
+        return stats
+
+    def on_close(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback run by aclose.
+
+        Chains built once around a chat model (or objects keeping an
+        embeddings client) register here to be rebuilt with the new clients
+        after a restart instead of calling through closed connections.
+
+        Args:
+            callback: Function dropping the cached objects, e.g. cache_clear
+        """
+        self._close_callbacks.append(callback)
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections and drop the cached clients."""
+        with self._lock:
+            self._chat_models.clear()
+            self._embeddings.clear()
+        for callback in self._close_callbacks:
+            callback()
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+            self._http_async_client = None
+
+
+def _estimate_request(model: ChatOpenAI, messages: List[BaseMessage]) -> int:
+    # Same tokenizer the compactor budgets prompts with
+    prompt_tokens = sum(
+        count_tokens(str(m.content), model.model_name) for m in messages
+    )
+    return prompt_tokens + (model.max_tokens or LLM_COMPLETION_TOKEN_ESTIMATE)
+
+
+def _usage(result: ChatResult) -> Optional[Dict[str, Any]]:
+    if result.llm_output and result.llm_output.get("token_usage"):
+        return result.llm_output["token_usage"]
+    for generation in result.generations:
+        metadata = getattr(generation.message, "usage_metadata", None)
+        if metadata:
+            return metadata
+    return None
+
+
+def _settle(span: Span, estimated: int, usage: Optional[Dict[str, Any]]) -> None:
+    tokens = client_manager.settle(estimated, usage)
+    if tokens:
+        span.set_attributes(prompt_tokens=tokens[0], completion_tokens=tokens[1])
+
+
+def _retry_delay(span: Span, attempt: int, error: Exception) -> Optional[float]:
+    """Backoff for a failed attempt, recorded as an event on the request span."""
+    delay = client_manager.backoff(attempt, error)
+    span.add_event(
+        "attempt_failed",
+        attempt=attempt,
+        error=type(error).__name__,
+        retry_in_seconds=round(delay, 3) if delay is not None else None,
+    )
+    if delay is not None:
+        span.set_attributes(retries=attempt)
+    return delay
+
+
+class ManagedChatOpenAI(ChatOpenAI):
+    """ChatOpenAI that goes through the client manager's budgets and retries."""
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        estimated = _estimate_request(self, messages)
+        attempt = 0
+        with span("llm", model=self.model_name) as request:
+            while True:
+                client_manager.reserve(estimated)
+                try:
+                    with STAGE_SECONDS.time(stage="llm"):
+                        result = super()._generate(
+                            messages, stop, run_manager, **kwargs
+                        )
+                    _settle(request, estimated, _usage(result))
+                    return result
+                except Exception as e:
+                    attempt += 1
+                    delay = _retry_delay(request, attempt, e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+
+    async def _agenerate(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> ChatResult:
+        estimated = _estimate_request(self, messages)
+        attempt = 0
+        with span("llm", model=self.model_name) as request:
+            while True:
+                await client_manager.areserve(estimated)
+                try:
+                    with STAGE_SECONDS.time(stage="llm"):
+                        result = await super()._agenerate(
+                            messages, stop, run_manager, **kwargs
+                        )
+                    _settle(request, estimated, _usage(result))
+                    return result
+                except Exception as e:
+                    attempt += 1
+                    delay = _retry_delay(request, attempt, e)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+
+    def _stream(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> Iterator[ChatGenerationChunk]:
+        # Retry only until the first chunk arrives; later failures propagate.
+        # The span is not made active: the caller runs between chunks.
+        estimated = _estimate_request(self, messages)
+        request = current_span().child("llm", model=self.model_name, stream=True)
+        attempt = 0
+        try:
+            while True:
+                client_manager.reserve(estimated)
+                start = time.perf_counter()
+                try:
+                    chunks = super()._stream(messages, stop, run_manager, **kwargs)
+                    first = next(chunks)
+                    break
+                except StopIteration:
+                    return
+                except Exception as e:
+                    attempt += 1
+                    delay = _retry_delay(request, attempt, e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+
+            request.add_event("first_chunk")
+            usage = first.message.usage_metadata
+            yield first
+            for chunk in chunks:
+                usage = chunk.message.usage_metadata or usage
+                yield chunk
+            STAGE_SECONDS.observe(time.perf_counter() - start, stage="llm")
+            _settle(request, estimated, usage)
+        except BaseException as e:
+            request.record_error(e)
+            raise
+        finally:
+            request.end()
+
+    async def _astream(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        estimated = _estimate_request(self, messages)
+        request = current_span().child("llm", model=self.model_name, stream=True)
+        attempt = 0
+        try:
+            while True:
+                await client_manager.areserve(estimated)
+                start = time.perf_counter()
+                try:
+                    chunks = super()._astream(messages, stop, run_manager, **kwargs)
+                    first = await chunks.__anext__()
+                    break
+                except StopAsyncIteration:
+                    return
+                except Exception as e:
+                    attempt += 1
+                    delay = _retry_delay(request, attempt, e)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+
+            request.add_event("first_chunk")
+            usage = first.message.usage_metadata
+            yield first
+            async for chunk in chunks:
+                usage = chunk.message.usage_metadata or usage
+                yield chunk
+            STAGE_SECONDS.observe(time.perf_counter() - start, stage="llm")
+            _settle(request, estimated, usage)
+        except BaseException as e:
+            request.record_error(e)
+            raise
+        finally:
+            request.end()
+
+
+class TimedPydanticOutputParser(PydanticOutputParser):
+    """PydanticOutputParser that records JSON parsing and validation time."""
+
+    def parse_result(self, result: List[Generation], *, partial: bool = False):
+        with STAGE_SECONDS.time(stage="output_parse"), span("output_parse"):
+            return super().parse_result(result, partial=partial)
+
+
+# Global client manager instance
+client_manager = LLMClientManager()
 
 
 def get_llm(
     model_name: str = OPENAI_CHAT_MODEL, temperature: float = 0.0
 ) -> ChatOpenAI:
-    """Returns an instance of the configured ChatOpenAI model."""
-    return ChatOpenAI(model=model_name, temperature=temperature)
+    """Returns the shared, rate-limited instance of the configured ChatOpenAI model."""
+    return client_manager.get_chat_model(model_name, temperature)
+
+
+@lru_cache(maxsize=1)
+def _local_embeddings() -> HashingEmbeddings:
+    return HashingEmbeddings(LOCAL_EMBEDDING_DIMENSIONS)
 
 
-def get_embeddings(model_name: str = OPENAI_EMBED_MODEL) -> OpenAIEmbeddings:
-    """Returns an instance of the configured OpenAI embeddings model."""
-    return OpenAIEmbeddings(model=model_name)
+def get_embeddings(model_name: str = OPENAI_EMBED_MODEL) -> Embeddings:
+    """Returns the shared instance of the configured embeddings model."""
+    if EMBEDDINGS_PROVIDER == "local":
+        return _local_embeddings()
+    return client_manager.get_embeddings(model_name)
@@ -0,0 +1,48 @@
+"""
+Deterministic, offline embeddings for tests and air-gapped deployments.
+
+Words and word bigrams are hashed into a fixed number of signed buckets
+(the "hashing trick") and the vector is L2-normalized. Texts that share
+vocabulary get a high cosine similarity, which is enough to exercise the
+semantic search path without calling an embeddings API.
+"""
+
+import hashlib
+import re
+from typing import List
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_WORD_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+class HashingEmbeddings(Embeddings):
+    """Feature-hashing embeddings that need no network or model weights."""
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+        # Named like OpenAIEmbeddings.model so indexes can record the source
+        self.model = f"local-hashing-{dimensions}"
+
+    def _features(self, text: str) -> List[str]:
+        words = [word.strip(".") for word in _WORD_RE.findall(text.lower())]
+        words = [word for word in words if word]
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self.dimensions] += sign
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
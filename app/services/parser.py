@@ -2,86 +2,807 @@
 Resume parsing service using LLM for structured extraction.
 """
 
+import hashlib
+import os
 import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from app.models import ResumeData
-from app.services.llm_service import get_llm
-from app.services.document_extractor import DocumentExtractor
+from langchain_core.utils.json import parse_partial_json
+from pydantic import BaseModel, ValidationError
+from app.models import ContactInformation, ResumeData, WorkExperience
+from app.services.cache import parse_cache
+from app.services.compactor import COMPACTION_ENABLED, compact_text
+from app.services.contact_extractor import merge_contact_info, prefilled_fields
+from app.services.llm_service import (
+    OPENAI_CHAT_MODEL,
+    OPENAI_FAST_MODEL,
+    TimedPydanticOutputParser,
+    client_manager,
+    get_llm,
+)
+from app.services.section_parser import (
+    SECTION_PROMPT_TEMPLATE,
+    build_section_runnable,
+    merge_sections,
+    section_inputs,
+    section_variables,
+)
+from app.services.quality import cascade_stats, check_resume
+from app.services.sectioner import segment_resume
 from app.utils.custom_exception import CustomException
 from app.utils.logger import logger
+from app.utils.metrics import PARSE_FAILURES, STAGE_SECONDS
+from app.utils.tracing import current_span, span, traced
 
+# Parse detected sections concurrently instead of with one monolithic prompt
+SECTIONED_PARSING = os.getenv("SECTIONED_PARSING", "false").lower() == "true"
+# Below this segmentation confidence the single-prompt path is used
+SECTION_CONFIDENCE_THRESHOLD = float(os.getenv("SECTION_CONFIDENCE_THRESHOLD", "0.75"))
 
-def parse_resume_text(resume_text: str) -> ResumeData:
+# "prompt" embeds the JSON schema as format instructions and parses the reply;
+# "structured" sends the schema once as a tool definition (function calling)
+PARSE_OUTPUT_MODE = os.getenv("PARSE_OUTPUT_MODE", "prompt").lower()
+# Structured mode: re-ask this many times when the tool arguments fail validation
+PARSE_REPAIR_RETRIES = int(os.getenv("PARSE_REPAIR_RETRIES", "1"))
+
+# Cascade: try OPENAI_FAST_MODEL first and escalate to OPENAI_CHAT_MODEL when
+# the result fails more than CASCADE_MAX_ISSUES local quality checks
+CASCADE_ENABLED = bool(OPENAI_FAST_MODEL) and OPENAI_FAST_MODEL != OPENAI_CHAT_MODEL
+CASCADE_MAX_ISSUES = int(os.getenv("CASCADE_MAX_ISSUES", "0"))
+
+# Streaming: new characters to accumulate before the partial JSON is re-parsed
+STREAM_PARSE_INTERVAL = int(os.getenv("STREAM_PARSE_INTERVAL", "32"))
+
+# Bump when the prompt semantics change without the template text changing
+PROMPT_VERSION = "1"
+
+RESUME_PROMPT_TEMPLATE = """You are an expert resume parser. Extract all information from the resume text.
+
+            Extract: Name, Email, Phone, Location, LinkedIn, GitHub, Portfolio, professional summary, work experience, projects, education, skills, and certifications.
+            {known_fields}
+            {format_instructions}
+
+            Resume Text:
+            {resume_text}
+
+            Output:"""
+
+REPAIR_INSTRUCTION = """The arguments did not match the schema:
+{error}
+
+Call the tool again with the complete, corrected arguments."""
+
+PROMPT_FINGERPRINT = (
+    PROMPT_VERSION
+    + ":"
+    + hashlib.sha256(RESUME_PROMPT_TEMPLATE.encode("utf-8")).hexdigest()[:16]
+)
+SECTION_PROMPT_FINGERPRINT = (
+    PROMPT_VERSION
+    + ":"
+    + hashlib.sha256(SECTION_PROMPT_TEMPLATE.encode("utf-8")).hexdigest()[:16]
+)
+
+
+class ParseStats:
+    """Running totals per parsing path, to compare prompt size and failures."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, int]] = {}
+
+    def _mode(self, mode: str) -> Dict[str, int]:
+        """Totals for one path. Caller must hold the lock."""
+        return self._totals.setdefault(
+            mode,
+            {
+                "parses": 0,
+                "failures": 0,
+                "repairs": 0,
+                "llm_calls": 0,
+                "calls_with_usage": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+            },
+        )
+
+    def record_call(self, mode: str, usage: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            totals = self._mode(mode)
+            totals["llm_calls"] += 1
+            if usage:
+                totals["calls_with_usage"] += 1
+                totals["prompt_tokens"] += usage.get("input_tokens", 0)
+                totals["completion_tokens"] += usage.get("output_tokens", 0)
+
+    def record(self, mode: str, succeeded: bool) -> None:
+        with self._lock:
+            self._mode(mode)["parses" if succeeded else "failures"] += 1
+
+    def record_repair(self, mode: str) -> None:
+        with self._lock:
+            self._mode(mode)["repairs"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns totals, averages and failure rates per path."""
+        with self._lock:
+            modes = {mode: dict(totals) for mode, totals in self._totals.items()}
+        for totals in modes.values():
+            attempts = totals["parses"] + totals["failures"]
+            calls = totals["calls_with_usage"]
+            totals["failure_rate"] = (
+                round(totals["failures"] / attempts, 4) if attempts else 0.0
+            )
+            totals["avg_prompt_tokens"] = (
+                round(totals["prompt_tokens"] / calls, 1) if calls else None
+            )
+            totals["avg_completion_tokens"] = (
+                round(totals["completion_tokens"] / calls, 1) if calls else None
+            )
+        stats: Dict[str, Any] = {"output_mode": PARSE_OUTPUT_MODE, "modes": modes}
+        stats["cascade"] = {
+            "enabled": CASCADE_ENABLED,
+            "fast_model": OPENAI_FAST_MODEL if CASCADE_ENABLED else None,
+            "strong_model": OPENAI_CHAT_MODEL,
+            "max_issues": CASCADE_MAX_ISSUES,
+            **cascade_stats.stats(),
+        }
+        prompt_avg = modes.get("prompt", {}).get("avg_prompt_tokens")
+        structured_avg = modes.get("structured", {}).get("avg_prompt_tokens")
+        if prompt_avg and structured_avg:
+            stats["prompt_token_reduction"] = round(1 - structured_avg / prompt_avg, 4)
+        return stats
+
+
+# Global parse statistics
+parse_stats = ParseStats()
+
+
+@lru_cache(maxsize=None)
+def _build_chain(model_name: str = OPENAI_CHAT_MODEL):
+    """Assemble the prompt | llm chain, its output parser and static inputs once."""
+    llm = get_llm(model_name)
+    parser = TimedPydanticOutputParser(pydantic_object=ResumeData)
+    prompt = ChatPromptTemplate.from_template(RESUME_PROMPT_TEMPLATE)
+    chain = prompt | llm
+    return chain, parser, {"format_instructions": parser.get_format_instructions()}
+
+
+@lru_cache(maxsize=None)
+def _build_structured_chain(model_name: str = OPENAI_CHAT_MODEL):
+    """Assemble the prompt and the tool-calling model for structured output once."""
+    llm = get_llm(model_name).with_structured_output(
+        ResumeData, method="function_calling", include_raw=True
+    )
+    prompt = ChatPromptTemplate.from_template(RESUME_PROMPT_TEMPLATE)
+    # The schema travels as the tool definition, not as prompt text
+    return prompt, llm, {"format_instructions": ""}
+
+
+@lru_cache(maxsize=None)
+def _build_tool_chain():
+    """Assemble prompt | llm with the ResumeData tool forced, for streaming its arguments."""
+    llm = get_llm().bind_tools([ResumeData], tool_choice="ResumeData")
+    prompt = ChatPromptTemplate.from_template(RESUME_PROMPT_TEMPLATE)
+    return prompt | llm, {"format_instructions": ""}
+
+
+# The chains hold the chat models; rebuild them once the clients are closed
+for _builder in (_build_chain, _build_structured_chain, _build_tool_chain):
+    client_manager.on_close(_builder.cache_clear)
+
+
+def _structured_result(output: Dict[str, Any]) -> Tuple[Optional[ResumeData], Any]:
+    """
+    Unpack a structured-output reply and record its token usage.
+
+    Returns:
+        The parsed resume (None on failure) and the error, if any
+    """
+    raw = output["raw"]
+    parse_stats.record_call("structured", getattr(raw, "usage_metadata", None))
+    error = output["parsing_error"]
+    if error is None and output["parsed"] is None:
+        error = ValueError("The model did not call the ResumeData tool")
+    return output["parsed"], error
+
+
+def _repair_messages(raw: AIMessage, error: Exception) -> List[BaseMessage]:
+    """Follow-up messages asking the model to fix arguments that failed validation."""
+    instruction = REPAIR_INSTRUCTION.format(error=str(error))
+    if raw.tool_calls:
+        return [
+            raw,
+            ToolMessage(content=instruction, tool_call_id=raw.tool_calls[0]["id"]),
+        ]
+    return [raw, HumanMessage(content=instruction)]
+
+
+def _invoke_structured(
+    variables: Dict[str, str], model_name: str = OPENAI_CHAT_MODEL
+) -> ResumeData:
+    """Parse with native structured output, repairing validation errors."""
+    prompt, llm, inputs = _build_structured_chain(model_name)
+    messages = prompt.format_messages(**inputs, **variables)
+    for attempt in range(PARSE_REPAIR_RETRIES + 1):
+        output = llm.invoke(messages)
+        result, error = _structured_result(output)
+        if error is None:
+            return result
+        # Malformed JSON or a missing tool call is not worth another round trip
+        if not isinstance(error, ValidationError) or attempt == PARSE_REPAIR_RETRIES:
+            raise error
+        logger.warning(f"Structured output failed validation, repairing: {error}")
+        parse_stats.record_repair("structured")
+        current_span().add_event("repair", error=type(error).__name__)
+        messages = messages + _repair_messages(output["raw"], error)
+
+
+async def _ainvoke_structured(
+    variables: Dict[str, str], model_name: str = OPENAI_CHAT_MODEL
+) -> ResumeData:
+    """Async variant of _invoke_structured."""
+    prompt, llm, inputs = _build_structured_chain(model_name)
+    messages = prompt.format_messages(**inputs, **variables)
+    for attempt in range(PARSE_REPAIR_RETRIES + 1):
+        output = await llm.ainvoke(messages)
+        result, error = _structured_result(output)
+        if error is None:
+            return result
+        if not isinstance(error, ValidationError) or attempt == PARSE_REPAIR_RETRIES:
+            raise error
+        logger.warning(f"Structured output failed validation, repairing: {error}")
+        parse_stats.record_repair("structured")
+        current_span().add_event("repair", error=type(error).__name__)
+        messages = messages + _repair_messages(output["raw"], error)
+
+
+def _invoke_prompt(
+    variables: Dict[str, str], model_name: str = OPENAI_CHAT_MODEL
+) -> ResumeData:
+    """Parse with schema format instructions in the prompt."""
+    chain, parser, inputs = _build_chain(model_name)
+    message = chain.invoke({**inputs, **variables})
+    parse_stats.record_call("prompt", message.usage_metadata)
+    return parser.invoke(message)
+
+
+async def _ainvoke_prompt(
+    variables: Dict[str, str], model_name: str = OPENAI_CHAT_MODEL
+) -> ResumeData:
+    """Async variant of _invoke_prompt."""
+    chain, parser, inputs = _build_chain(model_name)
+    message = await chain.ainvoke({**inputs, **variables})
+    parse_stats.record_call("prompt", message.usage_metadata)
+    return await parser.ainvoke(message)
+
+
+def _review_fast(
+    result: Optional[ResumeData],
+    error: Optional[Exception],
+    seconds: float,
+    resume_text: str,
+    prefilled: Optional[ContactInformation],
+) -> bool:
+    """Check a fast-model result and record whether it is kept or escalated."""
+    if error is not None:
+        issues = ["fast_model_error"]
+    else:
+        issues = check_resume(result, resume_text, prefilled)
+    accepted = error is None and len(issues) <= CASCADE_MAX_ISSUES
+    cascade_stats.record("fast", seconds, accepted, issues if not accepted else None)
+    if accepted:
+        current_span().set_attributes(tier="fast")
+    else:
+        logger.info(f"Escalating to {OPENAI_CHAT_MODEL}: {', '.join(issues)}")
+        current_span().add_event("escalate", issues=",".join(issues))
+    return accepted
+
+
+def _cascade(
+    mode: str,
+    variables: Dict[str, str],
+    resume_text: str,
+    prefilled: Optional[ContactInformation],
+) -> ResumeData:
+    """
+    Parse with the fast model, escalating to the strong one when checks fail.
+
+    Returns:
+        The fast model's result if it passes the quality checks, otherwise
+        the strong model's
+    """
+    invoke = _invoke_structured if mode == "structured" else _invoke_prompt
+    if not CASCADE_ENABLED:
+        return invoke(variables)
+
+    start = time.perf_counter()
+    result, error = None, None
+    try:
+        result = invoke(variables, OPENAI_FAST_MODEL)
+    except Exception as e:
+        logger.warning(f"Fast model parse failed: {str(e)}")
+        error = e
+    if _review_fast(result, error, time.perf_counter() - start, resume_text, prefilled):
+        return result
+
+    start = time.perf_counter()
+    try:
+        result = invoke(variables, OPENAI_CHAT_MODEL)
+    except Exception:
+        cascade_stats.record("strong", time.perf_counter() - start, False)
+        raise
+    cascade_stats.record("strong", time.perf_counter() - start, True)
+    current_span().set_attributes(tier="strong")
+    return result
+
+
+async def _acascade(
+    mode: str,
+    variables: Dict[str, str],
+    resume_text: str,
+    prefilled: Optional[ContactInformation],
+) -> ResumeData:
+    """Async variant of _cascade."""
+    invoke = _ainvoke_structured if mode == "structured" else _ainvoke_prompt
+    if not CASCADE_ENABLED:
+        return await invoke(variables)
+
+    start = time.perf_counter()
+    result, error = None, None
+    try:
+        result = await invoke(variables, OPENAI_FAST_MODEL)
+    except Exception as e:
+        logger.warning(f"Fast model parse failed: {str(e)}")
+        error = e
+    if _review_fast(result, error, time.perf_counter() - start, resume_text, prefilled):
+        return result
+
+    start = time.perf_counter()
+    try:
+        result = await invoke(variables, OPENAI_CHAT_MODEL)
+    except Exception:
+        cascade_stats.record("strong", time.perf_counter() - start, False)
+        raise
+    cascade_stats.record("strong", time.perf_counter() - start, True)
+    current_span().set_attributes(tier="strong")
+    return result
+
+
+def _known_fields_instruction(fields: List[str]) -> str:
+    """Tell the model which contact fields it does not need to generate."""
+    if not fields:
+        return ""
+    return (
+        "These contact fields were already extracted and will be filled in "
+        f"automatically, so return null for them: {', '.join(fields)}.\n"
+    )
+
+
+def _compact(resume_text: str) -> str:
+    """Shrink the text to what the prompt needs, within the token budget."""
+    if not COMPACTION_ENABLED:
+        return resume_text
+    with span("compact"):
+        return compact_text(resume_text, model_name=OPENAI_CHAT_MODEL).text
+
+
+def _prepare(
+    resume_text: str, prefilled: Optional[ContactInformation]
+) -> Tuple[str, Dict[str, str]]:
+    """Returns the cache key and the prompt variables for a parse request."""
+    fields = prefilled_fields(prefilled)
+    fingerprint = PROMPT_FINGERPRINT
+    if SECTIONED_PARSING:
+        fingerprint += f"+{SECTION_PROMPT_FINGERPRINT}"
+    if CASCADE_ENABLED:
+        # Cached results may come from the fast model
+        fingerprint += f"+cascade:{OPENAI_FAST_MODEL}:{CASCADE_MAX_ISSUES}"
+    cache_key = parse_cache.make_key(
+        resume_text, OPENAI_CHAT_MODEL, f"{fingerprint}:{','.join(fields)}"
+    )
+    variables = {
+        "resume_text": resume_text,
+        "known_fields": _known_fields_instruction(fields),
+    }
+    return cache_key, variables
+
+
+def _sectioned_inputs(
+    resume_text: str, variables: Dict[str, str]
+) -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Segment the resume for per-section parsing.
+
+    Returns:
+        Per-section prompt variables, or None to use the single-prompt path
+    """
+    if not SECTIONED_PARSING:
+        return None
+
+    segmented = segment_resume(resume_text)
+    if segmented.confidence < SECTION_CONFIDENCE_THRESHOLD:
+        logger.info(
+            f"Segmentation confidence {segmented.confidence} below threshold, "
+            "using single-prompt parsing"
+        )
+        return None
+
+    texts = section_inputs(segmented)
+    logger.info(f"Parsing {len(texts)} sections concurrently: {', '.join(texts)}")
+    return section_variables(texts, variables["known_fields"])
+
+
+def _finish(result: ResumeData, prefilled: Optional[ContactInformation]) -> ResumeData:
+    """Overlay locally extracted contact details onto the parsed result."""
+    result.contact_information = merge_contact_info(
+        result.contact_information, prefilled
+    )
+    return result
+
+
+@traced("parse")
+def parse_resume_text(
+    resume_text: str,
+    use_cache: bool = True,
+    prefilled: Optional[ContactInformation] = None,
+) -> ResumeData:
     """
     Parse resume text using LLM.
 
     Args:
         resume_text: Extracted text from resume
+        use_cache: Whether to serve and store results in the parse cache
+        prefilled: Contact details already extracted by rules; the LLM is
+            told not to generate them and they override its output
 
     Returns:
         ResumeData object
     """
+    mode = PARSE_OUTPUT_MODE
     try:
+        resume_text = _compact(resume_text)
+        cache_key, variables = _prepare(resume_text, prefilled)
+        if use_cache:
+            cached = parse_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Resume served from parse cache")
+                current_span().set_attributes(cached=True)
+                return _finish(cached, prefilled)
+
         logger.info("Parsing resume with LLM")
+        start = time.perf_counter()
 
-        # Setup LLM and parser
-        llm = get_llm()
-        parser = PydanticOutputParser(pydantic_object=ResumeData)
+        sections = _sectioned_inputs(resume_text, variables)
+        if sections is not None:
+            mode = "sectioned"
+            runnable = build_section_runnable(tuple(sections))
+            result = merge_sections(runnable.invoke(sections))
+        else:
+            result = _cascade(mode, variables, resume_text, prefilled)
 
-        # Create prompt
-        prompt = ChatPromptTemplate.from_template(
-            """You are an expert resume parser. Extract all information from the resume text.
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage="parse")
+        parse_stats.record(mode, succeeded=True)
+        current_span().set_attributes(mode=mode)
+        if use_cache:
+            parse_cache.set(cache_key, result)
 
-            Extract: Name, Email, Phone, Location, LinkedIn, GitHub, Portfolio, professional summary, work experience, projects, education, skills, and certifications.
+        logger.info("Resume parsed successfully")
+        return _finish(result, prefilled)
 
-            {format_instructions}
+    except Exception as e:
+        logger.error(f"Parsing failed: {str(e)}")
+        parse_stats.record(mode, succeeded=False)
+        PARSE_FAILURES.inc(mode=mode, error=type(e).__name__)
+        current_span().set_attributes(mode=mode)
+        raise CustomException(e, sys)
 
-            Resume Text:
-            {resume_text}
 
-            Output:"""
-        )
+@traced("parse")
+async def aparse_resume_text(
+    resume_text: str,
+    use_cache: bool = True,
+    prefilled: Optional[ContactInformation] = None,
+) -> ResumeData:
+    """
+    Parse resume text using LLM without blocking the event loop.
 
-        # Create chain and invoke
-        chain = prompt | llm | parser
-        result = chain.invoke(
-            {
-                "resume_text": resume_text,
-                "format_instructions": parser.get_format_instructions(),
-            }
-        )
+    Args:
+        resume_text: Extracted text from resume
+        use_cache: Whether to serve and store results in the parse cache
+        prefilled: Contact details already extracted by rules
+
+    Returns:
+        ResumeData object
+    """
+    mode = PARSE_OUTPUT_MODE
+    try:
+        resume_text = _compact(resume_text)
+        cache_key, variables = _prepare(resume_text, prefilled)
+        if use_cache:
+            cached = parse_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Resume served from parse cache")
+                current_span().set_attributes(cached=True)
+                return _finish(cached, prefilled)
+
+        logger.info("Parsing resume with LLM (async)")
+        start = time.perf_counter()
+
+        sections = _sectioned_inputs(resume_text, variables)
+        if sections is not None:
+            mode = "sectioned"
+            runnable = build_section_runnable(tuple(sections))
+            result = merge_sections(await runnable.ainvoke(sections))
+        else:
+            result = await _acascade(mode, variables, resume_text, prefilled)
+
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage="parse")
+        parse_stats.record(mode, succeeded=True)
+        current_span().set_attributes(mode=mode)
+        if use_cache:
+            parse_cache.set(cache_key, result)
 
         logger.info("Resume parsed successfully")
-        return result
+        return _finish(result, prefilled)
 
     except Exception as e:
         logger.error(f"Parsing failed: {str(e)}")
+        parse_stats.record(mode, succeeded=False)
+        PARSE_FAILURES.inc(mode=mode, error=type(e).__name__)
+        current_span().set_attributes(mode=mode)
         raise CustomException(e, sys)
 
 
-def parse_resume(file_path: str, file_extension: str) -> ResumeData:
+def _section_request(
+    texts: Dict[str, str], prefilled: Optional[ContactInformation]
+) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+    """Returns the runnable and prompt variables for a set of sections."""
+    known_fields = _known_fields_instruction(prefilled_fields(prefilled))
+    logger.info(f"Parsing {len(texts)} sections: {', '.join(texts)}")
+    current_span().set_attributes(mode="incremental", sections=",".join(texts))
+    return build_section_runnable(tuple(texts)), section_variables(texts, known_fields)
+
+
+@traced("parse")
+def parse_resume_sections(
+    texts: Dict[str, str], prefilled: Optional[ContactInformation] = None
+) -> Dict[str, BaseModel]:
     """
-    Parse resume file.
+    Parse selected sections of a resume, each with its own small prompt.
+
+    Used to update an earlier result when only part of a resume changed;
+    the parse cache does not apply.
 
     Args:
-        file_path: Path to resume file
-        file_extension: File extension (.pdf or .docx)
+        texts: Section name (a key of SECTION_SCHEMAS) to section text
+        prefilled: Contact details already extracted by rules
 
     Returns:
-        ResumeData object
+        Section name to parsed section model
+    """
+    mode = "incremental"
+    try:
+        start = time.perf_counter()
+        runnable, sections = _section_request(texts, prefilled)
+        parsed = runnable.invoke(sections)
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage="parse")
+        parse_stats.record(mode, succeeded=True)
+        return parsed
+
+    except Exception as e:
+        logger.error(f"Section parsing failed: {str(e)}")
+        parse_stats.record(mode, succeeded=False)
+        PARSE_FAILURES.inc(mode=mode, error=type(e).__name__)
+        raise CustomException(e, sys)
+
+
+@traced("parse")
+async def aparse_resume_sections(
+    texts: Dict[str, str], prefilled: Optional[ContactInformation] = None
+) -> Dict[str, BaseModel]:
+    """
+    Parse selected sections of a resume concurrently on the event loop.
+
+    Args:
+        texts: Section name (a key of SECTION_SCHEMAS) to section text
+        prefilled: Contact details already extracted by rules
+
+    Returns:
+        Section name to parsed section model
+    """
+    mode = "incremental"
+    try:
+        start = time.perf_counter()
+        runnable, sections = _section_request(texts, prefilled)
+        parsed = await runnable.ainvoke(sections)
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage="parse")
+        parse_stats.record(mode, succeeded=True)
+        return parsed
+
+    except Exception as e:
+        logger.error(f"Section parsing failed: {str(e)}")
+        parse_stats.record(mode, succeeded=False)
+        PARSE_FAILURES.inc(mode=mode, error=type(e).__name__)
+        raise CustomException(e, sys)
+
+
+class PartialResumeTracker:
+    """
+    Turns a growing ResumeData JSON document into completion events.
+
+    JSON object members arrive in order, so a top-level field is complete
+    once a later field has started, and a work experience entry once the
+    next entry has. Everything left is complete when the stream ends.
+    """
+
+    def __init__(self, prefilled: Optional[ContactInformation] = None):
+        self.prefilled = prefilled
+        self._fields: set = set()
+        self._jobs = 0
+
+    def _field_value(self, name: str, value: Any) -> Any:
+        if name == "contact_information":
+            contact = ContactInformation.model_validate(value or {})
+            return merge_contact_info(contact, self.prefilled).model_dump(mode="json")
+        return value
+
+    def feed(self, document: Dict[str, Any], final: bool = False) -> List[Tuple]:
+        """
+        Report what completed since the last call.
+
+        Args:
+            document: Partially parsed JSON object
+            final: Whether the stream has ended
+
+        Returns:
+            ("work_experience", {"index", "value"}) and ("field", {"field",
+            "value"}) events in document order
+        """
+        names = [name for name in document if name in ResumeData.model_fields]
+        complete = names if final else names[:-1]
+        events = []
+
+        jobs = document.get("work_experience")
+        if isinstance(jobs, list):
+            done = (
+                len(jobs) if final or "work_experience" in complete else len(jobs) - 1
+            )
+            while self._jobs < done:
+                try:
+                    job = WorkExperience.model_validate(jobs[self._jobs])
+                    events.append(
+                        (
+                            "work_experience",
+                            {"index": self._jobs, "value": job.model_dump(mode="json")},
+                        )
+                    )
+                except ValidationError as e:
+                    logger.warning(f"Skipping invalid streamed work experience: {e}")
+                self._jobs += 1
+
+        for name in complete:
+            if name in self._fields:
+                continue
+            self._fields.add(name)
+            try:
+                value = self._field_value(name, document[name])
+            except ValidationError as e:
+                logger.warning(f"Skipping invalid streamed field {name}: {e}")
+                continue
+            events.append(("field", {"field": name, "value": value}))
+        return events
+
+
+def _json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Parse the (possibly incomplete) JSON object in a model reply."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    parsed = parse_partial_json(text[start:])
+    return parsed if isinstance(parsed, dict) else None
+
+
+async def _astream_json(
+    mode: str, variables: Dict[str, str], usage: Dict[str, Any]
+) -> AsyncIterator[str]:
+    """
+    Stream the JSON text of a ResumeData reply.
+
+    Prompt mode streams the message content; structured mode streams the
+    arguments of the forced ResumeData tool call. The provider-reported
+    usage is stored in ``usage`` when the stream ends.
     """
+    if mode == "structured":
+        chain, inputs = _build_tool_chain()
+    else:
+        chain, _, inputs = _build_chain()
+    async for chunk in chain.astream({**inputs, **variables}):
+        if chunk.usage_metadata:
+            usage.update(chunk.usage_metadata)
+        if mode == "structured":
+            for call in chunk.tool_call_chunks:
+                if call.get("args"):
+                    yield call["args"]
+        elif chunk.content:
+            yield chunk.content
+
+
+async def astream_resume_text(
+    resume_text: str,
+    use_cache: bool = True,
+    prefilled: Optional[ContactInformation] = None,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Parse resume text with a streaming LLM call, reporting fields as they complete.
+
+    Always uses a single prompt (sectioned parsing does not apply). A cached
+    result is replayed as events immediately.
+
+    Args:
+        resume_text: Extracted text from resume
+        use_cache: Whether to serve and store results in the parse cache
+        prefilled: Contact details already extracted by rules
+
+    Yields:
+        ("field", ...) and ("work_experience", ...) events from
+        PartialResumeTracker, then ("result", ResumeData)
+    """
+    mode = "structured" if PARSE_OUTPUT_MODE == "structured" else "prompt"
     try:
-        logger.info(f"Parsing resume: {file_path}")
+        resume_text = _compact(resume_text)
+        cache_key, variables = _prepare(resume_text, prefilled)
+        tracker = PartialResumeTracker(prefilled)
+        if use_cache:
+            cached = parse_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Resume served from parse cache")
+                for event in tracker.feed(cached.model_dump(mode="json"), final=True):
+                    yield event
+                yield "result", _finish(cached, prefilled)
+                return
 
-        # Extract text
-        text = DocumentExtractor.extract_text(file_path, file_extension)
+        logger.info("Streaming resume parse with LLM")
+        start = time.perf_counter()
+        usage: Dict[str, Any] = {}
+        parts: List[str] = []
+        size = parsed_size = 0
+        async for text in _astream_json(mode, variables, usage):
+            parts.append(text)
+            size += len(text)
+            # Re-parsing the whole reply on every token would be quadratic
+            if size - parsed_size < STREAM_PARSE_INTERVAL:
+                continue
+            parsed_size = size
+            document = _json_object("".join(parts))
+            if document:
+                for event in tracker.feed(document):
+                    yield event
 
-        # Parse with LLM
-        resume_data = parse_resume_text(text)
+        reply = "".join(parts)
+        parse_stats.record_call(mode, usage)
+        if mode == "structured":
+            with span("output_parse"):
+                result = ResumeData.model_validate_json(reply)
+        else:
+            result = _build_chain()[1].parse(reply)
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage="parse")
+        parse_stats.record(mode, succeeded=True)
+        for event in tracker.feed(result.model_dump(mode="json"), final=True):
+            yield event
 
-        return resume_data
+        if use_cache:
+            parse_cache.set(cache_key, result)
+
+        logger.info("Resume parsed successfully")
+        yield "result", _finish(result, prefilled)
 
     except Exception as e:
-        logger.error(f"Resume parsing failed: {str(e)}")
+        logger.error(f"Parsing failed: {str(e)}")
+        parse_stats.record(mode, succeeded=False)
+        PARSE_FAILURES.inc(mode=mode, error=type(e).__name__)
         raise CustomException(e, sys)
@@ -0,0 +1,342 @@
+"""
+Two-stage extraction/LLM pipeline.
+
+Text extraction is CPU-bound and runs on a process pool sized to the
+machine's cores; LLM parsing is network-bound and runs as async workers.
+A bounded queue connects the stages so extraction of the next file overlaps
+the LLM call for the current one without extracted text piling up. Callers
+may replace the LLM stage's parse function per file.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple, Union
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+from app.models import ResumeData
+from app.services.contact_extractor import extract_contact_info
+from app.services.document_extractor import (
+    DocumentExtractor,
+    DocumentSource,
+    extract_pdf_pages_worker,
+    extract_text_worker,
+    inspect_pdf,
+    join_pdf_pages,
+    record_extraction,
+)
+from app.services.parser import aparse_resume_text
+from app.utils.logger import logger
+from app.utils.tracing import Span, current_span, span, traced, use_span
+
+load_dotenv()
+
+# Configuration from environment variables
+# "auto" bypasses the pipeline when it is idle, "always" forces it, "off" disables it
+PIPELINE_MODE = os.getenv("PIPELINE_MODE", "auto").lower()
+PIPELINE_EXTRACT_WORKERS = int(
+    os.getenv("PIPELINE_EXTRACT_WORKERS", str(os.cpu_count() or 1))
+)
+PIPELINE_LLM_WORKERS = int(os.getenv("PIPELINE_LLM_WORKERS", "8"))
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "16"))
+# PDFs with at least this many pages are split into page ranges across the
+# extraction processes (0 disables splitting)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "32"))
+
+# LLM stage: (text, links) -> parse result
+ParseFunction = Callable[[str, List[str]], Awaitable[Any]]
+
+
+async def parse_extracted(text: str, links: List[str]) -> ResumeData:
+    """Default LLM stage: prefill contact details by rules and parse the text."""
+    return await aparse_resume_text(text, prefilled=extract_contact_info(text, links))
+
+
+class ExtractionPipeline:
+    """Overlaps process-pool text extraction with async LLM parsing."""
+
+    def __init__(
+        self,
+        mode: str = PIPELINE_MODE,
+        extract_workers: int = PIPELINE_EXTRACT_WORKERS,
+        llm_workers: int = PIPELINE_LLM_WORKERS,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+    ):
+        self.mode = mode
+        self.extract_workers = extract_workers
+        self.llm_workers = llm_workers
+        self.queue_size = queue_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._extract_slots: Optional[asyncio.Semaphore] = None
+        self._workers: List[asyncio.Task] = []
+        # Strong references keep in-flight extract stages from being collected
+        self._extract_tasks: Set[asyncio.Task] = set()
+        self._in_flight = 0
+
+    def _ensure_started(self) -> None:
+        """Start the process pool and LLM workers on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._pool is None:
+            # Spawn keeps children free of the parent's threads and locks
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.extract_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._extract_slots = asyncio.Semaphore(self.extract_workers)
+        self._workers = [
+            loop.create_task(self._llm_worker()) for _ in range(self.llm_workers)
+        ]
+        logger.info(
+            f"Pipeline started: {self.extract_workers} extract processes, "
+            f"{self.llm_workers} LLM workers, queue size {self.queue_size}"
+        )
+
+    async def start(self) -> None:
+        """Start the pipeline and spawn the extraction processes up front."""
+        if self.mode == "off":
+            return
+        self._ensure_started()
+        await asyncio.gather(
+            *(
+                self._loop.run_in_executor(self._pool, os.getpid)
+                for _ in range(self.extract_workers)
+            )
+        )
+
+    async def _llm_worker(self) -> None:
+        """Consume extracted text and resolve each item's future."""
+        while True:
+            text, links, parse, future, waiting = await self._queue.get()
+            waiting.end()
+            try:
+                # Continue the request's trace under the span that queued it
+                with use_span(waiting.parent):
+                    result = await parse(text, links)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def _splits_pdfs(self, file_extension: str) -> bool:
+        return (
+            file_extension.lower() == ".pdf"
+            and PDF_PARALLEL_MIN_PAGES > 0
+            and self.extract_workers > 1
+            and self._pool is not None
+        )
+
+    async def _extract_pdf_ranges(
+        self, source: DocumentSource, pages: int
+    ) -> Tuple[str, List[str]]:
+        """Extract a large PDF as page ranges spread over the process pool."""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        size = -(-pages // self.extract_workers)
+        ranges = [(i, min(i + size, pages)) for i in range(0, pages, size)]
+        logger.info(f"Extracting {pages} PDF pages in {len(ranges)} ranges")
+
+        async def _extract_range(first: int, stop: int) -> List[str]:
+            with span("extract.pages", first=first, stop=stop):
+                return await loop.run_in_executor(
+                    self._pool, extract_pdf_pages_worker, source, first, stop
+                )
+
+        chunks, links = await asyncio.gather(
+            asyncio.gather(*(_extract_range(first, stop) for first, stop in ranges)),
+            loop.run_in_executor(
+                self._pool, DocumentExtractor.extract_links, source, ".pdf"
+            ),
+        )
+        text = join_pdf_pages((page for chunk in chunks for page in chunk), source)
+        record_extraction(".pdf", text, time.perf_counter() - start)
+        return text, links
+
+    @traced("extract")
+    async def _extract(
+        self, source: DocumentSource, file_extension: str
+    ) -> Tuple[str, List[str]]:
+        """Extract on the process pool, splitting large PDFs by page range."""
+        if self._splits_pdfs(file_extension):
+            # Opening a PDF is cheap; this also rejects scanned ones up front
+            pages = await run_in_threadpool(inspect_pdf, source)
+            if pages >= PDF_PARALLEL_MIN_PAGES:
+                return await self._extract_pdf_ranges(source, pages)
+
+        start = time.perf_counter()
+        text, links = await self._loop.run_in_executor(
+            self._pool, extract_text_worker, source, file_extension
+        )
+        record_extraction(file_extension, text, time.perf_counter() - start)
+        return text, links
+
+    async def extract(
+        self, source: DocumentSource, file_extension: str
+    ) -> Tuple[str, List[str]]:
+        """
+        Extract text and links on the process pool, without parsing.
+
+        Args:
+            source: Path to resume file or its raw bytes
+            file_extension: File extension (.pdf or .docx)
+
+        Returns:
+            Tuple of extracted text and hyperlink targets
+        """
+        self._ensure_started()
+        async with self._extract_slots:
+            return await self._extract(source, file_extension)
+
+    async def _extract_stage(
+        self,
+        source: DocumentSource,
+        file_extension: str,
+        parse: ParseFunction,
+        future: asyncio.Future,
+    ) -> None:
+        """Extract text on the process pool and hand it to the LLM stage."""
+        try:
+            async with self._extract_slots:
+                text, links = await self._extract(source, file_extension)
+                # Holding the slot until the queue accepts the text applies
+                # backpressure to extraction when the LLM stage falls behind
+                waiting = current_span().child("queue")
+                await self._queue.put((text, links, parse, future, waiting))
+        except Exception as e:
+            # Worker failures already carry the formatted CustomException text
+            if not future.done():
+                future.set_exception(e)
+
+    async def _run_direct(
+        self, source: DocumentSource, file_extension: str, parse: ParseFunction
+    ) -> Any:
+        """Single-request path: extract in a thread and parse inline."""
+        if self._splits_pdfs(file_extension):
+            # Idle extraction processes can share the pages of a large PDF
+            pages = await run_in_threadpool(inspect_pdf, source)
+            if pages >= PDF_PARALLEL_MIN_PAGES:
+                text, links = await self._extract_pdf_ranges(source, pages)
+                return await parse(text, links)
+        text, links = await run_in_threadpool(
+            DocumentExtractor.extract_text_and_links, source, file_extension
+        )
+        return await parse(text, links)
+
+    async def _run_pipelined(
+        self, source: DocumentSource, file_extension: str, parse: ParseFunction
+    ) -> Any:
+        self._ensure_started()
+        future = self._loop.create_future()
+        task = self._loop.create_task(
+            self._extract_stage(source, file_extension, parse, future)
+        )
+        self._extract_tasks.add(task)
+        task.add_done_callback(self._extract_tasks.discard)
+        return await future
+
+    async def process(
+        self,
+        source: DocumentSource,
+        file_extension: str,
+        force_pipeline: bool = False,
+        parse: ParseFunction = parse_extracted,
+    ) -> Any:
+        """
+        Extract and parse one resume file.
+
+        Args:
+            source: Path to resume file or its raw bytes
+            file_extension: File extension (.pdf or .docx)
+            force_pipeline: Use the pipeline even when it is idle
+            parse: LLM stage to run on the extracted text and links
+
+        Returns:
+            What ``parse`` returns; a ResumeData object by default
+        """
+        use_pipeline = self.mode == "always" or (
+            self.mode == "auto" and (force_pipeline or self._in_flight > 0)
+        )
+        self._in_flight += 1
+        try:
+            if use_pipeline:
+                return await self._run_pipelined(source, file_extension, parse)
+            return await self._run_direct(source, file_extension, parse)
+        finally:
+            self._in_flight -= 1
+
+    async def process_many(
+        self,
+        items: List[Tuple[DocumentSource, str]],
+        concurrency: Optional[int] = None,
+        traces: Optional[List[Span]] = None,
+    ) -> List[Union[ResumeData, Exception]]:
+        """
+        Extract and parse many resume files through the pipeline.
+
+        Args:
+            items: (source, file_extension) pairs
+            concurrency: Maximum number of these items in flight at once
+            traces: Optional trace span per item to record its stages under
+
+        Returns:
+            ResumeData or the raised exception for each input, in order
+        """
+        force = len(items) > 1
+        semaphore = asyncio.Semaphore(concurrency or len(items) or 1)
+
+        async def _process_one(
+            source: DocumentSource, file_extension: str, trace: Optional[Span]
+        ) -> ResumeData:
+            # Each gathered coroutine runs in its own task and context
+            with use_span(trace):
+                async with semaphore:
+                    return await self.process(
+                        source, file_extension, force_pipeline=force
+                    )
+
+        return await asyncio.gather(
+            *(
+                _process_one(path, ext, trace)
+                for (path, ext), trace in zip(
+                    items, traces or [current_span()] * len(items)
+                )
+            ),
+            return_exceptions=True,
+        )
+
+    def stats(self) -> dict:
+        """Returns pipeline configuration and current occupancy."""
+        return {
+            "mode": self.mode,
+            "extract_workers": self.extract_workers,
+            "llm_workers": self.llm_workers,
+            "queue_size": self.queue_size,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "in_flight": self._in_flight,
+        }
+
+    def shutdown(self) -> None:
+        """Cancel LLM workers and extract stages, then stop the processes."""
+        for task in [*self._workers, *self._extract_tasks]:
+            task.cancel()
+        self._workers = []
+        self._extract_tasks.clear()
+        self._loop = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Global pipeline instance
+extraction_pipeline = ExtractionPipeline()
@@ -0,0 +1,172 @@
+"""
+Local completeness and consistency checks on parsed resumes.
+
+The parse cascade runs these on the fast model's output and escalates to
+the strong model only when they find problems. Checks compare the result
+with what rules can see in the text (contact details, section headings,
+date ranges) and look for malformed entries, so they cost a few regex
+passes and no LLM call.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional
+from app.models import ContactInformation, ResumeData
+from app.services.contact_extractor import (
+    extract_contact_info,
+    guess_name,
+    prefilled_fields,
+)
+from app.services.sectioner import segment_resume
+from app.utils.dates import parse_duration_interval
+from app.utils.metrics import CASCADE_ESCALATIONS, PARSE_TIER_SECONDS
+
+# A year followed by a dash or "to" and another year or an open end
+_DATE_RANGE_RE = re.compile(
+    r"\b(?:19|20)\d{2}\s*(?:-|–|—|to)\s*(?:[a-z]{3,9}\.?\s+)?"
+    r"(?:(?:19|20)\d{2}|present|current|now)\b",
+    re.IGNORECASE,
+)
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+# Date ranges that indicate employment history even without a heading
+MIN_DATE_RANGES = 2
+
+# Contact fields rules can find, checked against the parsed result
+_CONTACT_FIELDS = ("email", "phone", "linkedin", "github")
+# Detected section -> ResumeData field that should then be non-empty
+_SECTION_FIELDS = {
+    "experience": "work_experience",
+    "education": "education",
+    "projects": "projects",
+    "certifications": "certifications",
+}
+
+
+def _blank(value: Optional[str]) -> bool:
+    return not value or not value.strip()
+
+
+def check_resume(
+    result: ResumeData,
+    resume_text: str,
+    prefilled: Optional[ContactInformation] = None,
+) -> List[str]:
+    """
+    Find signs that a parse missed or garbled information.
+
+    Args:
+        result: Parsed resume
+        resume_text: Text the resume was parsed from
+        prefilled: Contact details that will be overlaid on the result;
+            fields it overrides are not checked
+
+    Returns:
+        Names of the failed checks, e.g. "missing_email" or
+        "malformed_work_experience"; empty when the result looks complete
+    """
+    issues: List[str] = []
+
+    # Contact details that rules can see in the text must not be missing
+    # from the LLM output. Fallback values (the phone) are only a guess, so
+    # they are not merged in first; overridden fields are skipped because
+    # the overlay fills them whatever the LLM returned
+    contact = result.contact_information or ContactInformation()
+    if _blank(contact.name) and guess_name(resume_text):
+        issues.append("missing_name")
+    found = extract_contact_info(resume_text)
+    overridden = prefilled_fields(prefilled)
+    for field in _CONTACT_FIELDS:
+        if field in overridden:
+            continue
+        if getattr(found, field) and _blank(getattr(contact, field)):
+            issues.append(f"missing_{field}")
+
+    # Sections with a heading (or, for experience, dated entries) must be filled
+    sections = segment_resume(resume_text).sections
+    for section, field in _SECTION_FIELDS.items():
+        present = section in sections
+        if section == "experience" and not present:
+            present = len(_DATE_RANGE_RE.findall(resume_text)) >= MIN_DATE_RANGES
+        if present and not getattr(result, field):
+            issues.append(f"missing_{field}")
+    if "skills" in sections and not (
+        result.skills and (result.skills.technical or result.skills.soft)
+    ):
+        issues.append("missing_skills")
+
+    # Entries without their identifying fields, or with a reversed date range
+    for job in result.work_experience or []:
+        reversed_range = (
+            len(_YEAR_RE.findall(job.duration or "")) >= 2
+            and parse_duration_interval(job.duration) is None
+        )
+        if _blank(job.company) or _blank(job.role) or reversed_range:
+            issues.append("malformed_work_experience")
+            break
+    for education in result.education or []:
+        if _blank(education.degree) and _blank(education.institution):
+            issues.append("malformed_education")
+            break
+    for certification in result.certifications or []:
+        if _blank(certification.name):
+            issues.append("malformed_certifications")
+            break
+
+    return issues
+
+
+class CascadeStats:
+    """Running totals per model tier, to tune the escalation threshold."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tiers: Dict[str, Dict[str, float]] = {}
+        self._issues: Dict[str, int] = {}
+
+    def record(
+        self,
+        tier: str,
+        seconds: float,
+        accepted: bool,
+        issues: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Record one call of a tier.
+
+        Args:
+            tier: "fast" or "strong"
+            seconds: Time spent in the tier, checks included
+            accepted: Whether the tier's result was returned; a rejected fast
+                result is escalated, a rejected strong result is a failure
+            issues: Failed checks (or the error) that caused the rejection
+        """
+        PARSE_TIER_SECONDS.observe(seconds, tier=tier)
+        with self._lock:
+            totals = self._tiers.setdefault(
+                tier, {"calls": 0, "accepted": 0, "rejected": 0, "seconds": 0.0}
+            )
+            totals["calls"] += 1
+            totals["seconds"] += seconds
+            totals["accepted" if accepted else "rejected"] += 1
+            for issue in issues or []:
+                self._issues[issue] = self._issues.get(issue, 0) + 1
+        for issue in issues or []:
+            CASCADE_ESCALATIONS.inc(reason=issue)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Returns per-tier hit rates and latency, and escalation reasons."""
+        with self._lock:
+            tiers = {tier: dict(totals) for tier, totals in self._tiers.items()}
+            issues = dict(self._issues)
+        for totals in tiers.values():
+            calls = totals["calls"]
+            totals["hit_rate"] = round(totals["accepted"] / calls, 4)
+            totals["avg_latency_ms"] = round(totals.pop("seconds") / calls * 1000, 1)
+        return {
+            "tiers": tiers,
+            "escalation_reasons": dict(sorted(issues.items(), key=lambda i: -i[1])),
+        }
+
+
+# Global cascade statistics
+cascade_stats = CascadeStats()
@@ -0,0 +1,304 @@
+"""
+Rank stored resumes against a job description.
+
+Per-resume features are computed once when a resume is stored: normalized
+technical skills (kept as postings lists from skill to row) and total years
+of experience. Ranking a job description is then a handful of array
+operations over the whole corpus, combined with the text similarity from the
+vector index.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from dotenv import load_dotenv
+from app.models import RankedResume, RankResponse, ResumeResponse, WorkExperience
+from app.services.vector_index import vector_index
+from app.storage import index_terms, normalize_term
+from app.utils.dates import parse_duration_interval, parse_duration_years
+from app.utils.logger import logger
+
+load_dotenv()
+
+# Configuration from environment variables
+RANK_WEIGHT_SKILLS = float(os.getenv("RANK_WEIGHT_SKILLS", "0.5"))
+RANK_WEIGHT_EXPERIENCE = float(os.getenv("RANK_WEIGHT_EXPERIENCE", "0.2"))
+RANK_WEIGHT_SIMILARITY = float(os.getenv("RANK_WEIGHT_SIMILARITY", "0.3"))
+# Experience that earns a full score when the job states no requirement
+RANK_EXPERIENCE_CAP_YEARS = float(os.getenv("RANK_EXPERIENCE_CAP_YEARS", "10"))
+
+_REQUIRED_YEARS_RE = re.compile(
+    r"(\d+(?:\.\d+)?)\s*\+?\s*(?:-\s*\d+\s*)?(?:years?|yrs?)", re.IGNORECASE
+)
+_WORD_RE = re.compile(r"[a-z0-9+#./-]+")
+# Longest skill phrase looked up in a job description, in words
+_MAX_SKILL_WORDS = 3
+
+
+def total_experience_years(work_experience: Iterable[WorkExperience]) -> float:
+    """
+    Total years of experience, counting overlapping date ranges once.
+
+    Args:
+        work_experience: Work experience entries
+
+    Returns:
+        Years of experience
+    """
+    intervals = []
+    years = 0.0
+    for job in work_experience:
+        interval = parse_duration_interval(job.duration or "")
+        if interval:
+            intervals.append(interval)
+        else:
+            years += parse_duration_years(job.duration or "")
+
+    end = None
+    for start, stop in sorted(intervals):
+        if end is not None and start < end:
+            if stop > end:
+                years += stop - end
+                end = stop
+            continue
+        years += stop - start
+        end = stop
+    return round(years, 2)
+
+
+def required_years(job_description: str) -> Optional[float]:
+    """Returns the first "N+ years" requirement stated in a job description."""
+    for value in _REQUIRED_YEARS_RE.findall(job_description):
+        if 0 < float(value) <= 40:
+            return float(value)
+    return None
+
+
+class ResumeRanker:
+    """Columnar per-resume features for batch ranking."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._skills: List[Set[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._years = np.zeros(0, dtype=np.float32)
+        # Rows replaced by a newer version of the same document
+        self._alive = np.zeros(0, dtype=bool)
+        # Vector index row of each row (-1 until indexed), to align similarities
+        self._vector_rows = np.zeros(0, dtype=np.int64)
+        self._loader: Optional[threading.Thread] = None
+        vector_index.on_rows(self._set_vector_rows)
+
+    def start(self, resumes: Iterable[ResumeResponse]) -> None:
+        """Load features for already stored resumes in the background."""
+        if self._loader is not None:
+            return
+        self._loader = threading.Thread(
+            target=self._load, args=(resumes,), name="ranker-loader", daemon=True
+        )
+        self._loader.start()
+
+    def _load(self, resumes: Iterable[ResumeResponse]) -> None:
+        try:
+            batch: List[ResumeResponse] = []
+            for resume in resumes:
+                batch.append(resume)
+                if len(batch) >= 1000:
+                    self.add_many(batch)
+                    batch = []
+            self.add_many(batch)
+            logger.info(f"Ranker loaded features for {self.size()} resumes")
+        except Exception as e:
+            logger.error(f"Failed to load ranking features: {str(e)}")
+
+    def add(self, resume_response: ResumeResponse) -> None:
+        """Compute and store the ranking features of a resume."""
+        self.add_many([resume_response])
+
+    def add_many(self, resume_responses: List[ResumeResponse]) -> None:
+        """Compute and store the ranking features of several resumes."""
+        if not resume_responses:
+            return
+        features = [
+            (
+                resume.document_id,
+                index_terms(resume)["skill"],
+                total_experience_years(resume.data.work_experience or []),
+            )
+            for resume in resume_responses
+        ]
+
+        with self._lock:
+            # Looked up under the lock so an indexer update cannot slip between
+            vector_rows = vector_index.rows(
+                [document_id for document_id, _, _ in features]
+            )
+            start = len(self._ids)
+            needed = start + len(features)
+            if needed > len(self._years):
+                capacity = max(1024, 2 * len(self._years), needed)
+                years = np.zeros(capacity, dtype=np.float32)
+                alive = np.zeros(capacity, dtype=bool)
+                mapped = np.full(capacity, -1, dtype=np.int64)
+                years[:start] = self._years[:start]
+                alive[:start] = self._alive[:start]
+                mapped[:start] = self._vector_rows[:start]
+                self._years, self._alive, self._vector_rows = years, alive, mapped
+
+            self._vector_rows[start:needed] = vector_rows
+            for row, (document_id, skills, years) in enumerate(features, start):
+                previous = self._rows.get(document_id)
+                if previous is not None:
+                    self._alive[previous] = False
+                self._ids.append(document_id)
+                self._rows[document_id] = row
+                self._skills.append(skills)
+                self._years[row] = years
+                self._alive[row] = True
+                for skill in skills:
+                    self._postings.setdefault(skill, []).append(row)
+
+    def _set_vector_rows(self, assigned: List[Tuple[str, int]]) -> None:
+        """Record the vector index rows documents were (re-)indexed at."""
+        with self._lock:
+            for document_id, vector_row in assigned:
+                row = self._rows.get(document_id)
+                if row is not None:
+                    self._vector_rows[row] = vector_row
+
+    def size(self) -> int:
+        """Returns the number of ranked resumes."""
+        with self._lock:
+            return int(self._alive[: len(self._ids)].sum())
+
+    def job_skills(self, job_description: str) -> List[str]:
+        """
+        Find known skills mentioned in a job description.
+
+        Args:
+            job_description: Job description text
+
+        Returns:
+            Normalized skills that appear in at least one stored resume
+        """
+        words = [
+            word.rstrip(".,") for word in _WORD_RE.findall(job_description.lower())
+        ]
+        found = []
+        with self._lock:
+            for size in range(1, _MAX_SKILL_WORDS + 1):
+                for start in range(len(words) - size + 1):
+                    term = normalize_term(" ".join(words[start : start + size]))
+                    if term in self._postings and term not in found:
+                        found.append(term)
+        return found
+
+    def rank(
+        self,
+        job_description: str,
+        top_k: int = 20,
+        skills: Optional[List[str]] = None,
+        min_years: Optional[float] = None,
+    ) -> RankResponse:
+        """
+        Score every stored resume against a job description.
+
+        Args:
+            job_description: Job description text
+            top_k: Number of results to return
+            skills: Required skills; detected from the description if omitted
+            min_years: Required years of experience; detected if omitted
+
+        Returns:
+            Requirements used and the top results with their score components
+        """
+        if skills:
+            job_skills = list(dict.fromkeys(normalize_term(s) for s in skills if s))
+        else:
+            job_skills = self.job_skills(job_description)
+        years_required = (
+            min_years if min_years is not None else required_years(job_description)
+        )
+
+        similarity_scores = np.zeros(0, dtype=np.float32)
+        if vector_index.enabled and RANK_WEIGHT_SIMILARITY > 0:
+            try:
+                similarity_scores = vector_index.similarities(job_description)
+            except Exception as e:
+                logger.warning(f"Ranking without text similarity: {str(e)}")
+
+        with self._lock:
+            total = len(self._ids)
+            alive = self._alive[:total]
+            years = self._years[:total]
+
+            # Skill overlap: count postings hits per row in one pass
+            skill_score = np.zeros(total, dtype=np.float32)
+            postings = [self._postings[s] for s in job_skills if s in self._postings]
+            if job_skills and postings:
+                rows = np.concatenate([np.asarray(p, dtype=np.int64) for p in postings])
+                skill_score = np.bincount(rows, minlength=total).astype(np.float32)
+                skill_score /= len(job_skills)
+
+            # Experience relative to the requirement, or to a fixed cap
+            divisor = years_required or RANK_EXPERIENCE_CAP_YEARS
+            experience_score = np.minimum(years / divisor, 1.0)
+
+            # Align vector-index scores with ranker rows
+            similarity_score = np.zeros(total, dtype=np.float32)
+            use_similarity = len(similarity_scores) > 0
+            if use_similarity:
+                # Rows indexed after the scores were taken are left at zero
+                rows = self._vector_rows[:total]
+                valid = (rows >= 0) & (rows < len(similarity_scores))
+                scores = similarity_scores[rows[valid]]
+                similarity_score[valid] = np.where(
+                    np.isfinite(scores), np.clip(scores, 0.0, 1.0), 0.0
+                )
+
+            weights = [
+                (RANK_WEIGHT_SKILLS, skill_score, bool(job_skills)),
+                (RANK_WEIGHT_EXPERIENCE, experience_score, True),
+                (RANK_WEIGHT_SIMILARITY, similarity_score, use_similarity),
+            ]
+            used = sum(weight for weight, _, active in weights if active) or 1.0
+            score = np.zeros(total, dtype=np.float32)
+            for weight, component, active in weights:
+                if active:
+                    score += (weight / used) * component
+            score[~alive] = -np.inf
+
+            ranked = int(alive.sum())
+            k = min(top_k, ranked)
+            results = []
+            if k > 0:
+                top = np.argpartition(-score, k - 1)[:k]
+                top = top[np.argsort(-score[top])]
+                wanted = set(job_skills)
+                for row in top:
+                    results.append(
+                        RankedResume(
+                            document_id=self._ids[row],
+                            score=round(float(score[row]), 4),
+                            skill_score=round(float(skill_score[row]), 4),
+                            experience_score=round(float(experience_score[row]), 4),
+                            similarity_score=round(float(similarity_score[row]), 4),
+                            matched_skills=sorted(self._skills[row] & wanted),
+                            years_experience=round(float(years[row]), 2),
+                        )
+                    )
+
+        return RankResponse(
+            job_skills=job_skills,
+            required_years=years_required,
+            ranked=ranked,
+            results=results,
+        )
+
+
+# Global ranker instance
+resume_ranker = ResumeRanker()
@@ -0,0 +1,197 @@
+"""
+Per-section LLM parsing that runs all sections of a resume concurrently.
+
+Each section is parsed against its own small schema, so every call emits a
+short output and wall-clock latency approaches the slowest section rather
+than the time to generate the full ResumeData JSON.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda, RunnableParallel
+from pydantic import BaseModel, Field
+from app.models import (
+    Certification,
+    ContactInformation,
+    Education,
+    Project,
+    ResumeData,
+    Skills,
+    WorkExperience,
+)
+from app.services.llm_service import (
+    TimedPydanticOutputParser,
+    client_manager,
+    get_llm,
+)
+from app.services.sectioner import SegmentedResume
+
+
+class ResumeHeader(BaseModel):
+    """Contact details and summary found at the top of a resume."""
+
+    contact_information: Optional[ContactInformation] = Field(
+        None, description="Contact information"
+    )
+    professional_summary: Optional[str] = Field(
+        None, description="Professional summary or objective statement"
+    )
+
+
+class WorkExperienceSection(BaseModel):
+    """Work experience entries of a resume."""
+
+    items: List[WorkExperience] = Field(
+        default_factory=list, description="Work experience history"
+    )
+
+
+class EducationSection(BaseModel):
+    """Education entries of a resume."""
+
+    items: List[Education] = Field(
+        default_factory=list, description="Educational background"
+    )
+
+
+class ProjectSection(BaseModel):
+    """Project entries of a resume."""
+
+    items: List[Project] = Field(default_factory=list, description="Projects")
+
+
+class CertificationSection(BaseModel):
+    """Certification entries of a resume."""
+
+    items: List[Certification] = Field(
+        default_factory=list, description="Professional certifications"
+    )
+
+
+# Section name -> (schema, human readable title)
+SECTION_SCHEMAS: Dict[str, Tuple[Type[BaseModel], str]] = {
+    "header": (ResumeHeader, "contact information and professional summary"),
+    "experience": (WorkExperienceSection, "work experience"),
+    "education": (EducationSection, "education"),
+    "projects": (ProjectSection, "projects"),
+    "skills": (Skills, "skills"),
+    "certifications": (CertificationSection, "certifications"),
+}
+
+SECTION_PROMPT_TEMPLATE = """You are an expert resume parser. Extract the {section_title} from this part of a resume.
+            {known_fields}
+            {format_instructions}
+
+            Resume Section:
+            {section_text}
+
+            Output:"""
+
+
+def section_inputs(segmented: SegmentedResume) -> Dict[str, str]:
+    """
+    Map a segmented resume onto the sections that get their own LLM call.
+
+    Args:
+        segmented: Resume split at headings
+
+    Returns:
+        Section name to the text sent for that section
+    """
+    header_parts = [segmented.header, segmented.sections.get("summary", "")]
+    inputs = {"header": "\n\n".join(part for part in header_parts if part)}
+    for name in SECTION_SCHEMAS:
+        if name != "header" and segmented.sections.get(name):
+            inputs[name] = segmented.sections[name]
+    return {name: text for name, text in inputs.items() if text}
+
+
+@lru_cache(maxsize=None)
+def build_section_runnable(section_names: Tuple[str, ...]):
+    """
+    Build (once per combination) a runnable that parses sections in parallel.
+
+    The runnable takes a mapping of section name to prompt variables and
+    returns a mapping of section name to parsed section model. invoke runs
+    the sections on threads and ainvoke runs them concurrently on the loop.
+
+    Args:
+        section_names: Sections to include
+
+    Returns:
+        RunnableParallel over the section chains
+    """
+    llm = get_llm()
+    prompt = ChatPromptTemplate.from_template(SECTION_PROMPT_TEMPLATE)
+    steps = {}
+    for name in section_names:
+        schema, title = SECTION_SCHEMAS[name]
+        parser = TimedPydanticOutputParser(pydantic_object=schema)
+        static = {
+            "section_title": title,
+            "format_instructions": parser.get_format_instructions(),
+        }
+        select = RunnableLambda(
+            lambda inputs, name=name, static=static: {**static, **inputs[name]}
+        )
+        steps[name] = select | prompt | llm | parser
+    return RunnableParallel(steps)
+
+
+# The runnables hold the chat model; rebuild them once the clients are closed
+client_manager.on_close(build_section_runnable.cache_clear)
+
+
+def section_variables(
+    texts: Dict[str, str], known_fields: str = ""
+) -> Dict[str, Dict[str, str]]:
+    """
+    Build per-section prompt variables.
+
+    Args:
+        texts: Section name to section text
+        known_fields: Instruction listing prefilled contact fields
+
+    Returns:
+        Section name to prompt variables
+    """
+    return {
+        name: {
+            "section_text": text,
+            "known_fields": known_fields if name == "header" else "",
+        }
+        for name, text in texts.items()
+    }
+
+
+def merge_sections(
+    parsed: Dict[str, BaseModel], base: Optional[ResumeData] = None
+) -> ResumeData:
+    """
+    Assemble parsed sections into ResumeData.
+
+    Args:
+        parsed: Section name to parsed section model
+        base: Earlier result to update; fields of sections missing from
+            ``parsed`` keep its values (it is not modified)
+
+    Returns:
+        ResumeData object
+    """
+    data = base.model_copy(deep=True) if base is not None else ResumeData()
+    header = parsed.get("header")
+    if header is not None:
+        data.contact_information = header.contact_information
+        data.professional_summary = header.professional_summary
+    if "experience" in parsed:
+        data.work_experience = parsed["experience"].items
+    if "education" in parsed:
+        data.education = parsed["education"].items
+    if "projects" in parsed:
+        data.projects = parsed["projects"].items
+    if "skills" in parsed:
+        data.skills = parsed["skills"]
+    if "certifications" in parsed:
+        data.certifications = parsed["certifications"].items
+    return data
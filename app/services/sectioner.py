@@ -0,0 +1,159 @@
+"""
+Local heading detector that splits resume text into sections.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Heading phrases per section, compared after lower-casing and stripping punctuation
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "summary": [
+        "summary",
+        "professional summary",
+        "career summary",
+        "profile",
+        "professional profile",
+        "objective",
+        "career objective",
+        "about me",
+        "about",
+    ],
+    "experience": [
+        "experience",
+        "work experience",
+        "professional experience",
+        "relevant experience",
+        "employment",
+        "employment history",
+        "work history",
+        "career history",
+        "internships",
+        "internship experience",
+    ],
+    "education": [
+        "education",
+        "academic background",
+        "academic qualifications",
+        "educational qualifications",
+        "qualifications",
+        "academics",
+    ],
+    "projects": [
+        "projects",
+        "personal projects",
+        "academic projects",
+        "key projects",
+        "selected projects",
+    ],
+    "skills": [
+        "skills",
+        "technical skills",
+        "key skills",
+        "core competencies",
+        "competencies",
+        "technologies",
+        "tech stack",
+        "skills and tools",
+    ],
+    "certifications": [
+        "certifications",
+        "certificates",
+        "licenses and certifications",
+        "courses and certifications",
+        "certifications and courses",
+        "courses",
+    ],
+}
+
+_HEADING_LOOKUP = {
+    phrase: section
+    for section, phrases in SECTION_HEADINGS.items()
+    for phrase in phrases
+}
+_CLEAN_RE = re.compile(r"[^a-z& ]+")
+_UNKNOWN_HEADING_RE = re.compile(r"^[A-Z][A-Z &/-]{2,39}$")
+
+# Sections whose presence makes a segmentation trustworthy
+CORE_SECTIONS = ("experience", "education", "skills", "projects")
+
+
+@dataclass
+class SegmentedResume:
+    """Resume text split at detected headings."""
+
+    header: str
+    sections: Dict[str, str] = field(default_factory=dict)
+    unknown: str = ""
+    confidence: float = 0.0
+
+
+def detect_heading(line: str) -> Optional[str]:
+    """
+    Classify a line as a section heading.
+
+    Args:
+        line: A single line of resume text
+
+    Returns:
+        Section name, "unknown" for an unrecognized heading, or None
+    """
+    stripped = line.strip().rstrip(":").strip()
+    if not stripped or len(stripped) > 40 or len(stripped.split()) > 5:
+        return None
+
+    cleaned = _CLEAN_RE.sub("", stripped.lower().replace("&", " and ")).strip()
+    cleaned = " ".join(cleaned.split())
+    if cleaned in _HEADING_LOOKUP:
+        return _HEADING_LOOKUP[cleaned]
+    if _UNKNOWN_HEADING_RE.match(stripped):
+        return "unknown"
+    return None
+
+
+def segment_resume(text: str) -> SegmentedResume:
+    """
+    Split resume text into known sections.
+
+    Text before the first heading becomes the header (contact details and,
+    often, a summary). Content under unrecognized headings lowers the
+    confidence, since a section-wise parse would drop it.
+
+    Args:
+        text: Extracted resume text
+
+    Returns:
+        SegmentedResume with a confidence score between 0 and 1
+    """
+    buckets: Dict[str, List[str]] = {"header": []}
+    current = "header"
+    for line in text.splitlines():
+        heading = detect_heading(line)
+        # An all-caps line in the header is more likely the name than a heading
+        if heading == "unknown" and current == "header":
+            heading = None
+        if heading is not None:
+            current = heading
+            buckets.setdefault(current, [])
+            continue
+        buckets[current].append(line)
+
+    def _join(lines: List[str]) -> str:
+        return "\n".join(lines).strip()
+
+    header = _join(buckets.pop("header"))
+    unknown = _join(buckets.pop("unknown", []))
+    sections = {name: _join(lines) for name, lines in buckets.items()}
+    sections = {name: body for name, body in sections.items() if body}
+
+    core_found = sum(1 for name in CORE_SECTIONS if name in sections)
+    total_chars = max(len(text.strip()), 1)
+    unknown_fraction = len(unknown) / total_chars
+    confidence = min(1.0, core_found / 2) * (1.0 - unknown_fraction)
+
+    return SegmentedResume(
+        header=header,
+        sections=sections,
+        unknown=unknown,
+        confidence=round(confidence, 3),
+    )
@@ -0,0 +1,735 @@
+"""
+Semantic vector index over parsed resumes.
+
+Each resume's summary, experience and skills are embedded once and stored as
+a row of an L2-normalized float32 matrix, so a search is a matrix-vector
+product followed by a partial sort. Rows added since the last flush live in
+an in-memory buffer; a flush appends them to disk as a new ``.npy`` segment
+(with a JSON file of its document IDs and content hashes) and memory-maps
+it, without holding the lock searches take. The newest segments are merged
+while they are of similar size, so there are O(log n) segments and each row
+is rewritten O(log n) times. A re-indexed document leaves its old row behind
+as a dead row; dead rows are dropped when the segments are compacted on
+startup.
+
+Several processes (e.g. uvicorn workers) may share the directory. Segment
+names include the process ID and a random suffix, each row records when it
+was indexed so the newest row of a document wins across processes, and a
+process only merges segments it wrote itself. Running processes hold a
+shared lock on the directory; compaction and other cleanup of files a
+process did not write only happen under an exclusive lock, i.e. when no
+other process has the index open.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from dotenv import load_dotenv
+from langchain_core.embeddings import Embeddings
+from app.models import ResumeData, ResumeResponse
+from app.services.llm_service import client_manager, get_embeddings
+from app.services.local_embeddings import HashingEmbeddings
+from app.utils.logger import logger
+from app.utils.tokenizer import count_tokens
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
+
+load_dotenv()
+
+# Configuration from environment variables
+VECTOR_INDEX_ENABLED = os.getenv("VECTOR_INDEX_ENABLED", "true").lower() == "true"
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR", "data/vectors")
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+# Rows buffered in memory before they are written out as a segment
+VECTOR_INDEX_FLUSH_ROWS = int(os.getenv("VECTOR_INDEX_FLUSH_ROWS", "256"))
+
+SEGMENT_PREFIX = "segment-"
+LOCK_FILE = "index.lock"
+# Single-matrix layout written before segments; removed and rebuilt by reindex
+_LEGACY_FILES = ("vectors.npy", "index.json")
+# Rewrite the segments on startup when this share of their rows is dead
+_COMPACT_DEAD_FRACTION = 0.25
+
+# Receives (document_id, row) pairs whenever documents get a new row
+RowListener = Callable[[List[Tuple[str, int]]], None]
+# Wait this long for more queued resumes to share an embedding call
+_BATCH_WAIT_SECONDS = 0.05
+
+
+def resume_embedding_text(data: ResumeData) -> str:
+    """
+    Build the text that represents a resume in the vector index.
+
+    Args:
+        data: Parsed resume data
+
+    Returns:
+        Summary, experience and skills as plain text (empty if none)
+    """
+    parts: List[Optional[str]] = [data.professional_summary]
+    for job in data.work_experience or []:
+        parts.append(f"{job.role} at {job.company}")
+        parts.extend(job.responsibilities or [])
+    if data.skills:
+        skills = (data.skills.technical or []) + (data.skills.soft or [])
+        if skills:
+            parts.append("Skills: " + ", ".join(skills))
+    return "\n".join(part.strip() for part in parts if part and part.strip())
+
+
+def content_hash(text: str, model: str) -> str:
+    """Returns the embedding cache key for a text under a given model."""
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """Memory-mapped embedding matrix with cosine top-k search."""
+
+    def __init__(
+        self,
+        index_dir: str = VECTOR_INDEX_DIR,
+        embeddings: Optional[Embeddings] = None,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        flush_rows: int = VECTOR_INDEX_FLUSH_ROWS,
+        enabled: bool = VECTOR_INDEX_ENABLED,
+    ):
+        self.enabled = enabled
+        self.index_dir = index_dir
+        self.batch_size = batch_size
+        self.flush_rows = flush_rows
+        self._embeddings = embeddings
+        if embeddings is None:
+            # The shared client is replaced after the LLM clients are closed
+            client_manager.on_close(self._drop_embeddings)
+        self._lock = threading.RLock()
+        # Serializes flushes, which write files without holding _lock
+        self._flush_lock = threading.Lock()
+        # Rows [0, base_rows) are in memory-mapped segments, the rest in the
+        # buffer; the first ``flushing`` buffered rows are being written out
+        self._segments: List[np.ndarray] = []
+        self._segment_names: List[str] = []
+        self._offsets: List[int] = []
+        self._base_rows = 0
+        self._buffer = np.zeros((0, 0), dtype=np.float32)
+        self._buffered = 0
+        self._flushing = 0
+        # Segments this process wrote, the only ones it merges and deletes
+        self._owned: Set[str] = set()
+        self._lock_file = None
+        self._ids: List[str] = []
+        self._hashes: List[str] = []
+        self._indexed_at: List[float] = []
+        self._rows: Dict[str, int] = {}
+        self._by_hash: Dict[str, int] = {}
+        # Rows superseded by a re-indexed document, dropped on compaction
+        self._dead: Set[int] = set()
+        self._queue: "queue.Queue[Optional[ResumeResponse]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._loader: Optional[threading.Thread] = None
+        self._row_listeners: List[RowListener] = []
+        self._stats: Dict[str, int] = {
+            "indexed": 0,
+            "embedded": 0,
+            "cache_hits": 0,
+            "failures": 0,
+            "searches": 0,
+            "reindexed": 0,
+        }
+
+    @property
+    def embeddings(self) -> Embeddings:
+        if self._embeddings is None:
+            self._embeddings = get_embeddings()
+        return self._embeddings
+
+    def _drop_embeddings(self) -> None:
+        self._embeddings = None
+
+    @property
+    def model(self) -> str:
+        return getattr(self.embeddings, "model", type(self.embeddings).__name__)
+
+    def start(self, resumes: Optional[Iterable[ResumeResponse]] = None) -> None:
+        """
+        Load the persisted segments and start the background indexer.
+
+        Args:
+            resumes: Stored resumes; those missing from the index (stored
+                before it existed, or lost from the buffer in a crash) are
+                queued for indexing in the background
+        """
+        if not self.enabled or self._worker is not None:
+            return
+        self._load()
+        self._worker = threading.Thread(
+            target=self._run, name="vector-indexer", daemon=True
+        )
+        self._worker.start()
+        if resumes is not None:
+            self._loader = threading.Thread(
+                target=self.reindex, args=(resumes,), name="vector-reindex", daemon=True
+            )
+            self._loader.start()
+
+    def _path(self, name: str, ext: str) -> str:
+        return os.path.join(self.index_dir, f"{name}{ext}")
+
+    def _lock_directory(self) -> bool:
+        """
+        Hold a shared lock on the index directory while this process runs.
+
+        Returns:
+            True if no other process has the index open, so files this
+            process did not write may be rewritten or deleted
+        """
+        os.makedirs(self.index_dir, exist_ok=True)
+        if fcntl is None:
+            return True
+        self._lock_file = open(os.path.join(self.index_dir, LOCK_FILE), "a")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            # Waits for a process that is compacting to finish
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+            return False
+
+    def _load(self) -> None:
+        exclusive = self._lock_directory()
+        try:
+            self._load_segments(exclusive)
+        finally:
+            if exclusive and self._lock_file is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+
+    def _load_segments(self, exclusive: bool) -> None:
+        if exclusive:
+            for name in _LEGACY_FILES:
+                path = os.path.join(self.index_dir, name)
+                if os.path.exists(path):
+                    logger.info(f"Removing old vector index file {path}")
+                    os.remove(path)
+        # A segment counts once its JSON, written last, exists
+        names = sorted(
+            entry[: -len(".json")]
+            for entry in os.listdir(self.index_dir)
+            if entry.startswith(SEGMENT_PREFIX) and entry.endswith(".json")
+        )
+
+        segments: List[np.ndarray] = []
+        kept: List[str] = []
+        ids: List[str] = []
+        hashes: List[str] = []
+        indexed_at: List[float] = []
+        stale: List[str] = []
+        for name in names:
+            try:
+                with open(self._path(name, ".json"), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                # Merged away by another process while listing
+                continue
+            if meta.get("model") != self.model:
+                stale.append(name)
+                continue
+            try:
+                matrix = np.load(self._path(name, ".npy"), mmap_mode="r")
+            except (OSError, ValueError):
+                matrix = None
+            if matrix is None or matrix.shape[0] != len(meta["ids"]):
+                logger.warning(f"Skipping inconsistent vector index segment {name}")
+                continue
+            segments.append(matrix)
+            kept.append(name)
+            ids.extend(meta["ids"])
+            hashes.extend(meta["hashes"])
+            indexed_at.extend(meta.get("indexed_at") or [0.0] * len(meta["ids"]))
+        if stale:
+            logger.info(
+                f"Ignoring {len(stale)} vector index segments built with another "
+                f"model, now using {self.model}"
+            )
+            if exclusive:
+                self._remove_segments(stale)
+
+        with self._lock:
+            self._set_segments(segments, kept)
+            self._ids = ids
+            self._hashes = hashes
+            self._indexed_at = indexed_at
+            self._reset_maps()
+            dead = len(self._dead)
+        if exclusive and ids and dead > _COMPACT_DEAD_FRACTION * len(ids):
+            self._compact()
+        logger.info(
+            f"Loaded vector index with {len(self._ids) - len(self._dead)} resumes "
+            f"in {len(self._segments)} segments"
+        )
+
+    def _set_segments(self, segments: List[np.ndarray], names: List[str]) -> None:
+        """Replace the segment list. Caller must hold the lock."""
+        self._segments = segments
+        self._segment_names = names
+        self._offsets = []
+        total = 0
+        for segment in segments:
+            self._offsets.append(total)
+            total += len(segment)
+        self._base_rows = total
+
+    def _reset_maps(self) -> None:
+        """Rebuild the ID and hash lookups. Caller must hold the lock."""
+        # The most recently indexed row of a document wins (the last one on a
+        # tie); other processes' segments may load in any order
+        self._rows = {}
+        for row, document_id in enumerate(self._ids):
+            current = self._rows.get(document_id)
+            if current is None or self._indexed_at[row] >= self._indexed_at[current]:
+                self._rows[document_id] = row
+        self._by_hash = {digest: row for row, digest in enumerate(self._hashes)}
+        self._dead = {
+            row
+            for row, document_id in enumerate(self._ids)
+            if self._rows[document_id] != row
+        }
+
+    def _write_segment(
+        self,
+        matrix: np.ndarray,
+        ids: List[str],
+        hashes: List[str],
+        indexed_at: List[float],
+    ) -> Tuple[str, np.ndarray]:
+        """Write a segment and return its name and memory map."""
+        # Unique across processes sharing the directory
+        name = f"{SEGMENT_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:12]}"
+        os.makedirs(self.index_dir, exist_ok=True)
+        matrix_path = self._path(name, ".npy")
+        meta_path = self._path(name, ".json")
+        with open(f"{matrix_path}.tmp", "wb") as f:
+            np.save(f, matrix)
+        os.replace(f"{matrix_path}.tmp", matrix_path)
+        with open(f"{meta_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "model": self.model,
+                    "ids": ids,
+                    "hashes": hashes,
+                    "indexed_at": indexed_at,
+                },
+                f,
+            )
+        os.replace(f"{meta_path}.tmp", meta_path)
+        with self._lock:
+            self._owned.add(name)
+        return name, np.load(matrix_path, mmap_mode="r")
+
+    def _remove_segments(self, names: List[str]) -> None:
+        for name in names:
+            self._owned.discard(name)
+            # The JSON goes first so a half-removed segment is never loaded
+            for ext in (".json", ".npy"):
+                try:
+                    os.remove(self._path(name, ext))
+                except OSError:
+                    pass
+
+    def _compact(self) -> None:
+        """
+        Rewrite all segments as one without dead rows.
+
+        Only runs on startup, before indexing starts, while this process
+        holds the directory lock exclusively.
+        """
+        with self._lock:
+            keep = [row for row in range(self._base_rows) if row not in self._dead]
+            matrix = np.concatenate(self._segments)[keep]
+            ids = [self._ids[row] for row in keep]
+            hashes = [self._hashes[row] for row in keep]
+            indexed_at = [self._indexed_at[row] for row in keep]
+            old = list(self._segment_names)
+        name, segment = self._write_segment(matrix, ids, hashes, indexed_at)
+        with self._lock:
+            self._set_segments([segment], [name])
+            self._ids, self._hashes = ids, hashes
+            self._indexed_at = indexed_at
+            self._reset_maps()
+            moved = list(self._rows.items())
+        self._remove_segments(old)
+        self._notify(moved)
+        logger.info(f"Compacted vector index to {len(ids)} rows")
+
+    def reindex(self, resumes: Iterable[ResumeResponse]) -> int:
+        """
+        Queue stored resumes whose current text is not in the index.
+
+        Resumes whose row already holds the same content hash are skipped
+        without an embedding call; queued ones whose text is indexed under
+        another document reuse that vector.
+
+        Args:
+            resumes: Stored resumes
+
+        Returns:
+            Number of resumes queued
+        """
+        model = self.model
+        queued = 0
+        try:
+            for resume in resumes:
+                text = resume_embedding_text(resume.data)
+                if not text:
+                    continue
+                digest = content_hash(text, model)
+                with self._lock:
+                    row = self._rows.get(resume.document_id)
+                    current = row is not None and self._hashes[row] == digest
+                if not current:
+                    self.add(resume)
+                    queued += 1
+        except Exception as e:
+            logger.error(f"Failed to reindex stored resumes: {str(e)}")
+        with self._lock:
+            self._stats["reindexed"] += queued
+        if queued:
+            logger.info(f"Queued {queued} stored resumes missing from the vector index")
+        return queued
+
+    def on_rows(self, listener: RowListener) -> None:
+        """
+        Register a callback told which row each newly indexed document got.
+
+        Lets callers keep their own row-to-row mapping for ``similarities``
+        up to date. Listeners run outside the index lock.
+
+        Args:
+            listener: Called with (document_id, row) pairs
+        """
+        self._row_listeners.append(listener)
+
+    def _notify(self, assigned: List[Tuple[str, int]]) -> None:
+        if not assigned:
+            return
+        for listener in self._row_listeners:
+            try:
+                listener(assigned)
+            except Exception as e:
+                logger.error(f"Vector index row listener failed: {str(e)}")
+
+    def rows(self, document_ids: List[str]) -> List[int]:
+        """
+        Look up the current rows of documents.
+
+        Args:
+            document_ids: Document IDs
+
+        Returns:
+            Row of each document in ``similarities`` scores, -1 if not indexed
+        """
+        with self._lock:
+            return [self._rows.get(document_id, -1) for document_id in document_ids]
+
+    def add(self, resume_response: ResumeResponse) -> None:
+        """Queue a stored resume for embedding."""
+        if self.enabled:
+            self._queue.put(resume_response)
+
+    def add_many(self, resume_responses: List[ResumeResponse]) -> None:
+        """Queue several stored resumes for embedding."""
+        for resume_response in resume_responses:
+            self.add(resume_response)
+
+    def _run(self) -> None:
+        """Drain the queue, embedding concurrent arrivals in one call."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=_BATCH_WAIT_SECONDS)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                self.index_many(batch)
+            except Exception as e:
+                logger.error(f"Failed to index {len(batch)} resumes: {str(e)}")
+                with self._lock:
+                    self._stats["failures"] += len(batch)
+
+    def index_many(self, resume_responses: List[ResumeResponse]) -> int:
+        """
+        Embed and add resumes to the index right away.
+
+        Texts already in the index (by content hash) reuse the stored vector;
+        the rest are embedded in batches of ``batch_size``.
+
+        Args:
+            resume_responses: Resumes to index
+
+        Returns:
+            Number of resumes added or updated
+        """
+        model = self.model
+        pending: Dict[str, str] = {}
+        vectors: Dict[str, np.ndarray] = {}
+        documents: List[Tuple[str, str]] = []
+        with self._lock:
+            for resume_response in resume_responses:
+                text = resume_embedding_text(resume_response.data)
+                if not text:
+                    continue
+                digest = content_hash(text, model)
+                documents.append((resume_response.document_id, digest))
+                row = self._by_hash.get(digest)
+                if row is not None:
+                    vectors[digest] = self._vector(row)
+                    self._stats["cache_hits"] += 1
+                else:
+                    pending[digest] = text
+
+        digests = list(pending)
+        for start in range(0, len(digests), self.batch_size):
+            chunk = digests[start : start + self.batch_size]
+            embedded = self._embed([pending[digest] for digest in chunk])
+            vectors.update(zip(chunk, embedded))
+
+        with self._lock:
+            assigned = []
+            for document_id, digest in documents:
+                assigned.append(
+                    (document_id, self._append(document_id, digest, vectors[digest]))
+                )
+            self._stats["indexed"] += len(documents)
+            self._stats["embedded"] += len(pending)
+            should_flush = self._buffered >= self.flush_rows
+
+        self._notify(assigned)
+        if should_flush:
+            self.flush()
+        return len(documents)
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        if not isinstance(self.embeddings, HashingEmbeddings):
+            # Share the LLM request and token budgets with parsing calls
+            client_manager.reserve(
+                sum(count_tokens(text, self.model) for text in texts)
+            )
+        vectors = np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+        return _normalize(vectors)
+
+    def _vector(self, row: int) -> np.ndarray:
+        if row < self._base_rows:
+            segment = bisect.bisect_right(self._offsets, row) - 1
+            return np.array(self._segments[segment][row - self._offsets[segment]])
+        return self._buffer[row - self._base_rows].copy()
+
+    def _append(self, document_id: str, digest: str, vector: np.ndarray) -> int:
+        """Add or replace a document's row and return it. Caller must hold the lock."""
+        row = self._rows.get(document_id)
+        # Buffered rows not being written out are replaced in place
+        if row is not None and row >= self._base_rows + self._flushing:
+            previous = self._hashes[row]
+            if self._by_hash.get(previous) == row:
+                del self._by_hash[previous]
+            self._buffer[row - self._base_rows] = vector
+            self._hashes[row] = digest
+            self._indexed_at[row] = time.time()
+            self._by_hash[digest] = row
+            return row
+        if row is not None:
+            self._dead.add(row)
+
+        if self._buffered == len(self._buffer):
+            grown = np.zeros(
+                (max(64, 2 * len(self._buffer)), vector.shape[0]), dtype=np.float32
+            )
+            if self._buffered:
+                grown[: self._buffered] = self._buffer[: self._buffered]
+            self._buffer = grown
+        self._buffer[self._buffered] = vector
+        self._buffered += 1
+
+        row = len(self._ids)
+        self._ids.append(document_id)
+        self._hashes.append(digest)
+        self._indexed_at.append(time.time())
+        self._rows[document_id] = row
+        self._by_hash[digest] = row
+        return row
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        vector = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+        return _normalize(vector)
+
+    def _scores(self, vector: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row to a vector. Caller must hold the lock."""
+        scores = np.empty(len(self._ids), dtype=np.float32)
+        for offset, segment in zip(self._offsets, self._segments):
+            np.dot(segment, vector, out=scores[offset : offset + len(segment)])
+        if self._buffered:
+            np.dot(
+                self._buffer[: self._buffered], vector, out=scores[self._base_rows :]
+            )
+        if self._dead:
+            scores[list(self._dead)] = -np.inf
+        return scores
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the resumes most similar to a query.
+
+        Args:
+            query: Free-text query
+            top_k: Maximum number of results
+
+        Returns:
+            (document_id, cosine similarity) pairs, best first
+        """
+        vector = self._embed_query(query)
+        with self._lock:
+            self._stats["searches"] += 1
+            scores = self._scores(vector)
+            k = min(top_k, len(scores) - len(self._dead))
+            if k <= 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self._ids[row], float(scores[row])) for row in top]
+
+    def similarities(self, query: str) -> np.ndarray:
+        """
+        Score every indexed resume against a query in one pass.
+
+        Args:
+            query: Free-text query
+
+        Returns:
+            Cosine similarity per row (-inf for superseded rows); map documents
+            to rows with ``rows`` and ``on_rows``
+        """
+        vector = self._embed_query(query)
+        with self._lock:
+            self._stats["searches"] += 1
+            return self._scores(vector)
+
+    def flush(self) -> None:
+        """Write buffered rows as a new segment, then merge the newest segments."""
+        with self._flush_lock:
+            with self._lock:
+                count = self._buffered
+                if not count:
+                    return
+                start = self._base_rows
+                matrix = self._buffer[:count].copy()
+                ids = self._ids[start : start + count]
+                hashes = self._hashes[start : start + count]
+                indexed_at = self._indexed_at[start : start + count]
+                # These rows are now immutable; replacements append instead
+                self._flushing = count
+            try:
+                name, segment = self._write_segment(matrix, ids, hashes, indexed_at)
+            except Exception:
+                with self._lock:
+                    self._flushing = 0
+                raise
+
+            with self._lock:
+                self._set_segments(
+                    self._segments + [segment], self._segment_names + [name]
+                )
+                self._buffer = self._buffer[count:].copy()
+                self._buffered -= count
+                self._flushing = 0
+            self._merge_tail()
+        logger.info(f"Vector index flushed {count} rows")
+
+    def _merge_tail(self) -> None:
+        """
+        Merge the newest segment into the one before while that is no larger.
+
+        Segments loaded from other processes are never merged; they may still
+        be memory-mapped there.
+        """
+        while True:
+            with self._lock:
+                if len(self._segments) < 2:
+                    return
+                old = self._segment_names[-2:]
+                if not self._owned.issuperset(old):
+                    return
+                older, newer = self._segments[-2], self._segments[-1]
+                if len(older) > len(newer):
+                    return
+                start = self._offsets[-2]
+                stop = self._base_rows
+                ids = self._ids[start:stop]
+                hashes = self._hashes[start:stop]
+                indexed_at = self._indexed_at[start:stop]
+            # Segment files never change, so they are read without the lock;
+            # dead rows are kept so row numbers stay valid
+            name, segment = self._write_segment(
+                np.concatenate([older, newer]), ids, hashes, indexed_at
+            )
+            with self._lock:
+                self._set_segments(
+                    self._segments[:-2] + [segment], self._segment_names[:-2] + [name]
+                )
+            self._remove_segments(old)
+
+    def stats(self) -> Dict[str, float]:
+        """Returns index size, queue depth and embedding counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["resumes"] = len(self._ids) - len(self._dead)
+            stats["dimensions"] = (
+                self._segments[0].shape[1] if self._segments else self._buffer.shape[1]
+            )
+            stats["buffered_rows"] = self._buffered
+            stats["segments"] = len(self._segments)
+            stats["dead_rows"] = len(self._dead)
+        stats["queued"] = self._queue.qsize()
+        stats["enabled"] = self.enabled
+        return stats
+
+    def shutdown(self) -> None:
+        """Finish queued work and write the buffered rows out."""
+        if self._worker is None:
+            return
+        if self._loader is not None:
+            self._loader.join()
+            self._loader = None
+        self._queue.put(None)
+        self._worker.join()
+        self._worker = None
+        self.flush()
+        if self._lock_file is not None:
+            # Closing the file releases the directory lock
+            self._lock_file.close()
+            self._lock_file = None
+
+
+# Global vector index instance
+vector_index = VectorIndex()
@@ -0,0 +1,257 @@
+"""
+Resume versions per candidate, with incremental re-parsing of revisions.
+
+An upload joins a candidate's history through an explicit candidate ID or,
+when VERSIONING_ENABLED is set, the email address rules find in its text.
+Every version
+records a digest of each section's text. The next upload of the same
+candidate is segmented the same way, and only the sections whose digest
+changed are sent to the LLM, each with its own small prompt; the other
+fields are copied from the previous version's stored ResumeData. Without
+a usable previous version (first upload, segmentation below the confidence
+threshold, text under unrecognized headings changed, previous document
+gone, or every section changed) the resume is parsed in full.
+"""
+
+import asyncio
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from app.models import ContactInformation, ResumeData, ResumeVersion
+from app.services.contact_extractor import extract_contact_info, merge_contact_info
+from app.services.parser import (
+    SECTION_CONFIDENCE_THRESHOLD,
+    aparse_resume_sections,
+    aparse_resume_text,
+    parse_resume_sections,
+    parse_resume_text,
+)
+from app.services.section_parser import SECTION_SCHEMAS, merge_sections, section_inputs
+from app.services.sectioner import segment_resume
+from app.storage import resume_storage
+from app.utils.logger import logger
+from app.utils.tracing import current_span
+
+load_dotenv()
+
+# Configuration from environment variables
+# Also key uploads without a candidate ID by their email. Off by default:
+# with it on, uploads sharing an email join one history
+VERSIONING_ENABLED = os.getenv("VERSIONING_ENABLED", "false").lower() == "true"
+
+# Digest key of the text under unrecognized headings; no section prompt
+# covers it, so a change there needs a full parse
+UNKNOWN_SECTION = "unknown"
+
+
+def normalize_candidate_id(candidate_id: str) -> str:
+    """Candidate IDs (and emails used as IDs) match case-insensitively."""
+    return candidate_id.strip().lower()
+
+
+def _digest(text: str) -> str:
+    # Whitespace is collapsed so a re-exported file with new line breaks matches
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def section_texts(resume_text: str) -> Dict[str, str]:
+    """
+    Split resume text into the sections that can be re-parsed on their own.
+
+    Args:
+        resume_text: Extracted resume text
+
+    Returns:
+        Section name to text, plus the text under unrecognized headings;
+        empty when segmentation is not confident enough to diff
+    """
+    segmented = segment_resume(resume_text)
+    if segmented.confidence < SECTION_CONFIDENCE_THRESHOLD:
+        return {}
+    texts = section_inputs(segmented)
+    if segmented.unknown:
+        texts[UNKNOWN_SECTION] = segmented.unknown
+    return texts
+
+
+@dataclass
+class Revision:
+    """What to parse for an upload, and its result once parsed."""
+
+    candidate_id: Optional[str]
+    prefilled: ContactInformation
+    texts: Dict[str, str] = field(default_factory=dict)
+    parse: str = "full"
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    base: Optional[ResumeData] = None
+    data: Optional[ResumeData] = None
+
+    @property
+    def section_hashes(self) -> Dict[str, str]:
+        return {name: _digest(text) for name, text in self.texts.items()}
+
+    @property
+    def reparsed_sections(self) -> List[str]:
+        if self.parse == "full":
+            return [name for name in self.texts if name != UNKNOWN_SECTION]
+        return list(self.changed)
+
+    def merge(self, parsed: Dict[str, BaseModel]) -> ResumeData:
+        """Update the previous result with re-parsed and removed sections."""
+        sections = dict(parsed)
+        for name in self.removed:
+            sections[name] = SECTION_SCHEMAS[name][0]()
+        data = merge_sections(sections, base=self.base)
+        data.contact_information = merge_contact_info(
+            data.contact_information, self.prefilled
+        )
+        return data
+
+
+def plan_revision(
+    resume_text: str, links: List[str], candidate_id: Optional[str] = None
+) -> Revision:
+    """
+    Diff an upload against the candidate's latest version.
+
+    Args:
+        resume_text: Extracted resume text
+        links: Hyperlink targets found in the document
+        candidate_id: Explicit candidate ID; defaults to the email in the text
+            when VERSIONING_ENABLED is set
+
+    Returns:
+        Revision whose ``parse`` is "full", "incremental" (only ``changed``
+        needs the LLM) or "unchanged"
+    """
+    prefilled = extract_contact_info(resume_text, links)
+    key = candidate_id or (prefilled.email if VERSIONING_ENABLED else None)
+    if not key:
+        return Revision(candidate_id=None, prefilled=prefilled)
+
+    revision = Revision(
+        candidate_id=normalize_candidate_id(key),
+        prefilled=prefilled,
+        texts=section_texts(resume_text),
+    )
+    history = resume_storage.list_versions(revision.candidate_id)
+    previous = history[-1] if history else None
+    if previous is None or not previous.section_hashes or not revision.texts:
+        return revision
+    stored = resume_storage.get(previous.document_id)
+    if stored is None:
+        return revision
+
+    hashes = revision.section_hashes
+    changed = [
+        name
+        for name, digest in hashes.items()
+        if previous.section_hashes.get(name) != digest
+    ]
+    removed = [name for name in previous.section_hashes if name not in hashes]
+    if UNKNOWN_SECTION in changed + removed or len(changed) == len(hashes):
+        logger.info(
+            f"Revision of {revision.candidate_id} changed too much, parsing in full"
+        )
+        return revision
+
+    revision.parse = "incremental" if changed else "unchanged"
+    revision.changed = changed
+    revision.removed = removed
+    revision.base = stored.data
+    logger.info(
+        f"Revision of {revision.candidate_id} against version {previous.version}: "
+        f"re-parsing {changed or 'nothing'}, removed {removed or 'nothing'}"
+    )
+    return revision
+
+
+def parse_revision(
+    resume_text: str, links: List[str], candidate_id: Optional[str] = None
+) -> Revision:
+    """
+    Parse an upload, re-parsing only the sections that changed since the
+    candidate's latest version.
+
+    Args:
+        resume_text: Extracted resume text
+        links: Hyperlink targets found in the document
+        candidate_id: Explicit candidate ID; defaults to the email in the text
+            when VERSIONING_ENABLED is set
+
+    Returns:
+        Revision with ``data`` set
+    """
+    revision = plan_revision(resume_text, links, candidate_id)
+    if revision.parse == "full":
+        revision.data = parse_resume_text(resume_text, prefilled=revision.prefilled)
+    else:
+        texts = {name: revision.texts[name] for name in revision.changed}
+        parsed = parse_resume_sections(texts, revision.prefilled) if texts else {}
+        revision.data = revision.merge(parsed)
+    current_span().set_attributes(revision=revision.parse)
+    return revision
+
+
+async def aparse_revision(
+    resume_text: str, links: List[str], candidate_id: Optional[str] = None
+) -> Revision:
+    """
+    Parse an upload like parse_revision, without blocking the event loop.
+
+    Args:
+        resume_text: Extracted resume text
+        links: Hyperlink targets found in the document
+        candidate_id: Explicit candidate ID; defaults to the email in the text
+            when VERSIONING_ENABLED is set
+
+    Returns:
+        Revision with ``data`` set
+    """
+    # Planning reads the history from storage
+    revision = await asyncio.to_thread(plan_revision, resume_text, links, candidate_id)
+    if revision.parse == "full":
+        revision.data = await aparse_resume_text(
+            resume_text, prefilled=revision.prefilled
+        )
+    else:
+        texts = {name: revision.texts[name] for name in revision.changed}
+        parsed = (
+            await aparse_resume_sections(texts, revision.prefilled) if texts else {}
+        )
+        revision.data = revision.merge(parsed)
+    current_span().set_attributes(revision=revision.parse)
+    return revision
+
+
+def record_version(
+    revision: Revision, document_id: str, file_name: str
+) -> Optional[ResumeVersion]:
+    """
+    Append a parsed upload to its candidate's history.
+
+    Args:
+        revision: Parsed revision
+        document_id: Document the result is stored under
+        file_name: Original filename
+
+    Returns:
+        The stored version, or None when the upload has no candidate
+    """
+    if revision.candidate_id is None:
+        return None
+    return resume_storage.add_version(
+        ResumeVersion(
+            candidate_id=revision.candidate_id,
+            document_id=document_id,
+            file_name=file_name,
+            parse=revision.parse,
+            reparsed_sections=revision.reparsed_sections,
+            section_hashes=revision.section_hashes,
+        )
+    )
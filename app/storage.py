@@ -1,17 +1,99 @@
 """
-Simple in-memory storage for parsed resumes.
+Storage backends for parsed resumes.
+
+The in-memory backend keeps everything in a dict (lost on restart). The
+SQLite backend persists to a WAL-mode database that several uvicorn workers
+can share. Select one with STORAGE_BACKEND ("memory" or "sqlite").
+
+Both backends maintain inverted indexes from normalized skills, companies,
+roles, institutions and locations to document IDs, updated on every save,
+so filtered queries only touch the matching resumes. They also keep each
+candidate's version history, numbered by the backend as versions are added.
 """
 
-from typing import Dict, Optional
-from app.models import ResumeResponse
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from dotenv import load_dotenv
+from app.models import ResumeResponse, ResumeVersion
 from app.utils.logger import logger
+from app.utils.metrics import STORAGE_SECONDS
 
+load_dotenv()
 
-class ResumeStorage:
-    """In-memory storage for resume data."""
+# Configuration from environment variables
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "memory").lower()
+STORAGE_PATH = os.getenv("STORAGE_PATH", "data/resumes.db")
 
-    def __init__(self):
-        self._storage: Dict[str, ResumeResponse] = {}
+# Stay well below SQLite's limit on bound parameters per statement
+_SQLITE_BATCH = 500
+
+# Resume fields kept in the inverted index, by query parameter name
+INDEXED_FIELDS = ("skill", "company", "role", "institution", "location")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TERM_PUNCTUATION = " ,;:()[]\"'"
+
+
+def normalize_term(value: str) -> str:
+    """Lowercase and collapse whitespace so "Python " and "python" match."""
+    return _WHITESPACE_RE.sub(" ", value).strip(_TERM_PUNCTUATION).lower()
+
+
+def index_terms(resume_response: ResumeResponse) -> Dict[str, Set[str]]:
+    """
+    Collect the normalized index terms of a resume.
+
+    Args:
+        resume_response: Stored resume
+
+    Returns:
+        Terms per indexed field
+    """
+    data = resume_response.data
+    values: Dict[str, List[Optional[str]]] = {field: [] for field in INDEXED_FIELDS}
+    if data.skills:
+        values["skill"].extend(data.skills.technical or [])
+    for job in data.work_experience or []:
+        values["company"].append(job.company)
+        values["role"].append(job.role)
+    for education in data.education or []:
+        values["institution"].append(education.institution)
+    if data.contact_information:
+        values["location"].append(data.contact_information.location)
+
+    terms = {}
+    for field, raw in values.items():
+        normalized = (normalize_term(value) for value in raw if value)
+        terms[field] = {term for term in normalized if term}
+    return terms
+
+
+def query_criteria(filters: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+    """
+    Turn query filters into distinct (field, term) pairs.
+
+    Args:
+        filters: Values to match per indexed field
+
+    Returns:
+        Normalized criteria
+    """
+    criteria = []
+    for field, raw in filters.items():
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"Field '{field}' is not indexed")
+        for value in raw or []:
+            term = normalize_term(value)
+            if term and (field, term) not in criteria:
+                criteria.append((field, term))
+    return criteria
+
+
+class BaseResumeStorage:
+    """Interface shared by all resume storage backends."""
 
     def save(self, document_id: str, resume_response: ResumeResponse) -> None:
         """
@@ -21,8 +103,16 @@ class ResumeStorage:
             document_id: Unique document identifier
             resume_response: Resume response object
         """
-        self._storage[document_id] = resume_response
-        logger.info(f"Saved resume with ID: {document_id}")
+        raise NotImplementedError
+
+    def save_many(self, resume_responses: List[ResumeResponse]) -> None:
+        """
+        Save several resumes in one batch.
+
+        Args:
+            resume_responses: Resume response objects, keyed by their document_id
+        """
+        raise NotImplementedError
 
     def get(self, document_id: str) -> Optional[ResumeResponse]:
         """
@@ -34,7 +124,47 @@ class ResumeStorage:
         Returns:
             ResumeResponse if found, None otherwise
         """
-        return self._storage.get(document_id)
+        found = self.get_many([document_id])
+        return found[0] if found else None
+
+    def get_many(self, document_ids: List[str]) -> List[ResumeResponse]:
+        """
+        Retrieve several resumes at once.
+
+        Args:
+            document_ids: Unique document identifiers
+
+        Returns:
+            The resumes that exist, in the order requested
+        """
+        raise NotImplementedError
+
+    def get_json(self, document_id: str) -> Optional[bytes]:
+        """
+        Retrieve a resume as the JSON it was serialized to when saved.
+
+        Args:
+            document_id: Unique document identifier
+
+        Returns:
+            UTF-8 encoded ResumeResponse JSON if found, None otherwise
+        """
+        for _, payload in self.iter_json([document_id]):
+            return payload
+        return None
+
+    def iter_json(self, document_ids: List[str]) -> Iterator[Tuple[str, bytes]]:
+        """
+        Stream stored resumes as JSON without re-validating them.
+
+        Args:
+            document_ids: Unique document identifiers
+
+        Yields:
+            Document ID and UTF-8 encoded ResumeResponse JSON of each resume
+            that exists, in the order requested
+        """
+        raise NotImplementedError
 
     def exists(self, document_id: str) -> bool:
         """
@@ -46,8 +176,519 @@ class ResumeStorage:
         Returns:
             True if exists, False otherwise
         """
+        raise NotImplementedError
+
+    def list(
+        self, offset: int = 0, limit: int = 20
+    ) -> Tuple[int, List[ResumeResponse]]:
+        """
+        Page through stored resumes, newest first.
+
+        Args:
+            offset: Number of resumes to skip
+            limit: Maximum number of resumes to return
+
+        Returns:
+            Total number of stored resumes and the requested page
+        """
+        raise NotImplementedError
+
+    def query(
+        self,
+        filters: Dict[str, List[str]],
+        match: str = "all",
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Tuple[int, List[ResumeResponse]]:
+        """
+        Find resumes through the inverted indexes, newest first.
+
+        Args:
+            filters: Values to match per indexed field, e.g. {"skill": ["python"]}
+            match: "all" to require every value, "any" to accept one
+            offset: Number of matches to skip
+            limit: Maximum number of resumes to return
+
+        Returns:
+            Total number of matches and the requested page
+        """
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """Returns the number of stored resumes."""
+        raise NotImplementedError
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[ResumeResponse]:
+        """
+        Iterate over every stored resume in no particular order.
+
+        Args:
+            batch_size: Resumes loaded per round trip
+
+        Returns:
+            Iterator of stored resumes
+        """
+        raise NotImplementedError
+
+    def add_version(self, version: ResumeVersion) -> ResumeVersion:
+        """
+        Append a version to its candidate's history.
+
+        Args:
+            version: Version to add; its version number is ignored
+
+        Returns:
+            The stored version, numbered one past the candidate's latest
+        """
+        raise NotImplementedError
+
+    def list_versions(self, candidate_id: str) -> List[ResumeVersion]:
+        """
+        Retrieve a candidate's version history.
+
+        Args:
+            candidate_id: Candidate identifier
+
+        Returns:
+            Versions, oldest first (empty for an unknown candidate)
+        """
+        raise NotImplementedError
+
+
+class ResumeStorage(BaseResumeStorage):
+    """In-memory storage for resume data."""
+
+    def __init__(self):
+        self._storage: Dict[str, ResumeResponse] = {}
+        # Serialized once at save time so reads skip pydantic entirely
+        self._json: Dict[str, bytes] = {}
+        # field -> term -> document IDs, and each document's terms for updates
+        self._index: Dict[str, Dict[str, Set[str]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self._terms: Dict[str, Dict[str, Set[str]]] = {}
+        self._versions: Dict[str, List[ResumeVersion]] = {}
+        self._lock = threading.Lock()
+
+    @STORAGE_SECONDS.time(operation="save")
+    def save(self, document_id: str, resume_response: ResumeResponse) -> None:
+        payload = resume_response.model_dump_json().encode("utf-8")
+        with self._lock:
+            self._storage[document_id] = resume_response
+            self._json[document_id] = payload
+            self._reindex(document_id, resume_response)
+        logger.info(f"Saved resume with ID: {document_id}")
+
+    @STORAGE_SECONDS.time(operation="save_many")
+    def save_many(self, resume_responses: List[ResumeResponse]) -> None:
+        payloads = [
+            resume_response.model_dump_json().encode("utf-8")
+            for resume_response in resume_responses
+        ]
+        with self._lock:
+            for resume_response, payload in zip(resume_responses, payloads):
+                self._storage[resume_response.document_id] = resume_response
+                self._json[resume_response.document_id] = payload
+                self._reindex(resume_response.document_id, resume_response)
+        logger.info(f"Saved {len(resume_responses)} resumes")
+
+    def _reindex(self, document_id: str, resume_response: ResumeResponse) -> None:
+        """Replace a document's postings. Caller must hold the lock."""
+        for field, terms in self._terms.pop(document_id, {}).items():
+            postings = self._index[field]
+            for term in terms:
+                postings[term].discard(document_id)
+                if not postings[term]:
+                    del postings[term]
+
+        terms = index_terms(resume_response)
+        self._terms[document_id] = terms
+        for field, values in terms.items():
+            for term in values:
+                self._index[field].setdefault(term, set()).add(document_id)
+
+    @STORAGE_SECONDS.time(operation="get")
+    def get(self, document_id: str) -> Optional[ResumeResponse]:
+        return self._storage.get(document_id)
+
+    @STORAGE_SECONDS.time(operation="get_many")
+    def get_many(self, document_ids: List[str]) -> List[ResumeResponse]:
+        found = (self._storage.get(document_id) for document_id in document_ids)
+        return [resume for resume in found if resume is not None]
+
+    @STORAGE_SECONDS.time(operation="get_json")
+    def get_json(self, document_id: str) -> Optional[bytes]:
+        return self._json.get(document_id)
+
+    def iter_json(self, document_ids: List[str]) -> Iterator[Tuple[str, bytes]]:
+        for document_id in document_ids:
+            payload = self._json.get(document_id)
+            if payload is not None:
+                yield document_id, payload
+
+    def exists(self, document_id: str) -> bool:
         return document_id in self._storage
 
+    @STORAGE_SECONDS.time(operation="list")
+    def list(
+        self, offset: int = 0, limit: int = 20
+    ) -> Tuple[int, List[ResumeResponse]]:
+        with self._lock:
+            resumes = sorted(
+                self._storage.values(), key=lambda r: r.extracted_at, reverse=True
+            )
+        return len(resumes), resumes[offset : offset + limit]
+
+    @STORAGE_SECONDS.time(operation="query")
+    def query(
+        self,
+        filters: Dict[str, List[str]],
+        match: str = "all",
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Tuple[int, List[ResumeResponse]]:
+        criteria = query_criteria(filters)
+        if not criteria:
+            return self.list(offset=offset, limit=limit)
+
+        with self._lock:
+            postings = [self._index[field].get(term, set()) for field, term in criteria]
+            if match == "any":
+                document_ids = set().union(*postings)
+            else:
+                # Start from the rarest term so the intersection stays small
+                postings.sort(key=len)
+                document_ids = postings[0].intersection(*postings[1:])
+            resumes = [self._storage[document_id] for document_id in document_ids]
+
+        resumes.sort(key=lambda r: r.extracted_at, reverse=True)
+        return len(resumes), resumes[offset : offset + limit]
+
+    def count(self) -> int:
+        return len(self._storage)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[ResumeResponse]:
+        with self._lock:
+            resumes = list(self._storage.values())
+        return iter(resumes)
+
+    def add_version(self, version: ResumeVersion) -> ResumeVersion:
+        with self._lock:
+            history = self._versions.setdefault(version.candidate_id, [])
+            version = version.model_copy(update={"version": len(history) + 1})
+            history.append(version)
+        logger.info(f"Saved version {version.version} of {version.candidate_id}")
+        return version
+
+    def list_versions(self, candidate_id: str) -> List[ResumeVersion]:
+        with self._lock:
+            return list(self._versions.get(candidate_id, []))
+
+
+class SQLiteResumeStorage(BaseResumeStorage):
+    """
+    SQLite-backed storage for resume data.
+
+    Runs in WAL mode so readers never block the writer and several
+    processes can share the file. Each thread reuses its own connection.
+    """
+
+    def __init__(self, path: str = STORAGE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._create_schema()
+        logger.info(f"Using SQLite resume storage at {path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS resumes (
+                    document_id TEXT PRIMARY KEY,
+                    file_name TEXT NOT NULL,
+                    extracted_at TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                )
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_resumes_extracted_at "
+                "ON resumes (extracted_at)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS resume_terms (
+                    field TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    document_id TEXT NOT NULL,
+                    PRIMARY KEY (field, term, document_id)
+                ) WITHOUT ROWID
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_resume_terms_document_id "
+                "ON resume_terms (document_id)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS resume_versions (
+                    candidate_id TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    document_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (candidate_id, version)
+                ) WITHOUT ROWID
+                """)
+
+        # Databases created before the term index existed need a backfill
+        if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+            self._backfill_terms()
+            conn.execute("PRAGMA user_version = 1")
+
+    def _backfill_terms(self) -> None:
+        conn = self._connection()
+        rows = conn.execute("SELECT payload FROM resumes").fetchall()
+        resumes = [ResumeResponse.model_validate_json(payload) for (payload,) in rows]
+        if resumes:
+            logger.info(f"Indexing {len(resumes)} stored resumes")
+            with conn:
+                self._write_terms(conn, resumes)
+
+    @STORAGE_SECONDS.time(operation="save")
+    def save(self, document_id: str, resume_response: ResumeResponse) -> None:
+        self._write([resume_response])
+        logger.info(f"Saved resume with ID: {document_id}")
+
+    @STORAGE_SECONDS.time(operation="save_many")
+    def save_many(self, resume_responses: List[ResumeResponse]) -> None:
+        self._write(resume_responses)
+        logger.info(f"Saved {len(resume_responses)} resumes")
+
+    def _write(self, resume_responses: List[ResumeResponse]) -> None:
+        rows = [
+            (
+                resume.document_id,
+                resume.file_name,
+                resume.extracted_at.isoformat(),
+                resume.model_dump_json(),
+            )
+            for resume in resume_responses
+        ]
+        conn = self._connection()
+        # One transaction for the whole batch, documents and postings together
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO resumes "
+                "(document_id, file_name, extracted_at, payload) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._write_terms(conn, resume_responses)
+
+    def _write_terms(
+        self, conn: sqlite3.Connection, resume_responses: List[ResumeResponse]
+    ) -> None:
+        """Replace the postings of the given resumes inside the open transaction."""
+        conn.executemany(
+            "DELETE FROM resume_terms WHERE document_id = ?",
+            [(resume.document_id,) for resume in resume_responses],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO resume_terms (field, term, document_id) "
+            "VALUES (?, ?, ?)",
+            [
+                (field, term, resume.document_id)
+                for resume in resume_responses
+                for field, terms in index_terms(resume).items()
+                for term in terms
+            ],
+        )
+
+    @STORAGE_SECONDS.time(operation="get_many")
+    def get_many(self, document_ids: List[str]) -> List[ResumeResponse]:
+        found: Dict[str, ResumeResponse] = {}
+        conn = self._connection()
+        for start in range(0, len(document_ids), _SQLITE_BATCH):
+            chunk = document_ids[start : start + _SQLITE_BATCH]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT document_id, payload FROM resumes "
+                f"WHERE document_id IN ({placeholders})",
+                chunk,
+            )
+            for document_id, payload in rows:
+                found[document_id] = ResumeResponse.model_validate_json(payload)
+        return [found[doc_id] for doc_id in document_ids if doc_id in found]
+
+    @STORAGE_SECONDS.time(operation="get_json")
+    def get_json(self, document_id: str) -> Optional[bytes]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT payload FROM resumes WHERE document_id = ?", (document_id,)
+            )
+            .fetchone()
+        )
+        return row[0].encode("utf-8") if row is not None else None
+
+    def iter_json(self, document_ids: List[str]) -> Iterator[Tuple[str, bytes]]:
+        # The payload column already holds the serialized response. Resuming
+        # the generator may happen on another thread, so each chunk looks up
+        # that thread's connection.
+        for start in range(0, len(document_ids), _SQLITE_BATCH):
+            chunk = document_ids[start : start + _SQLITE_BATCH]
+            placeholders = ",".join("?" * len(chunk))
+            found = dict(
+                self._connection().execute(
+                    f"SELECT document_id, payload FROM resumes "
+                    f"WHERE document_id IN ({placeholders})",
+                    chunk,
+                )
+            )
+            for document_id in chunk:
+                if document_id in found:
+                    yield document_id, found[document_id].encode("utf-8")
+
+    def exists(self, document_id: str) -> bool:
+        row = (
+            self._connection()
+            .execute("SELECT 1 FROM resumes WHERE document_id = ?", (document_id,))
+            .fetchone()
+        )
+        return row is not None
+
+    @STORAGE_SECONDS.time(operation="list")
+    def list(
+        self, offset: int = 0, limit: int = 20
+    ) -> Tuple[int, List[ResumeResponse]]:
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT payload FROM resumes "
+                "ORDER BY extracted_at DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            )
+            .fetchall()
+        )
+        return self.count(), [
+            ResumeResponse.model_validate_json(payload) for (payload,) in rows
+        ]
+
+    @STORAGE_SECONDS.time(operation="query")
+    def query(
+        self,
+        filters: Dict[str, List[str]],
+        match: str = "all",
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Tuple[int, List[ResumeResponse]]:
+        criteria = query_criteria(filters)
+        if not criteria:
+            return self.list(offset=offset, limit=limit)
+
+        # Each criterion is a primary-key range scan over its postings
+        operator = " UNION " if match == "any" else " INTERSECT "
+        matches = operator.join(
+            ["SELECT document_id FROM resume_terms WHERE field = ? AND term = ?"]
+            * len(criteria)
+        )
+        params = [value for criterion in criteria for value in criterion]
+
+        conn = self._connection()
+        total = conn.execute(f"SELECT COUNT(*) FROM ({matches})", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT payload FROM resumes WHERE document_id IN ({matches}) "
+            f"ORDER BY extracted_at DESC LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+        return total, [
+            ResumeResponse.model_validate_json(payload) for (payload,) in rows
+        ]
+
+    def count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[ResumeResponse]:
+        # A dedicated connection keeps the read snapshot independent of writes
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            cursor = conn.execute("SELECT payload FROM resumes")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for (payload,) in rows:
+                    yield ResumeResponse.model_validate_json(payload)
+        finally:
+            conn.close()
+
+    @STORAGE_SECONDS.time(operation="add_version")
+    def add_version(self, version: ResumeVersion) -> ResumeVersion:
+        conn = self._connection()
+        with conn:
+            # Numbering inside the INSERT keeps concurrent writers, possibly in
+            # other processes, from taking the same number
+            conn.execute(
+                "INSERT INTO resume_versions "
+                "(candidate_id, version, document_id, payload) "
+                "SELECT ?, COALESCE(MAX(version), 0) + 1, ?, ? "
+                "FROM resume_versions WHERE candidate_id = ?",
+                (
+                    version.candidate_id,
+                    version.document_id,
+                    version.model_dump_json(exclude={"version"}),
+                    version.candidate_id,
+                ),
+            )
+            number = conn.execute(
+                "SELECT MAX(version) FROM resume_versions WHERE candidate_id = ?",
+                (version.candidate_id,),
+            ).fetchone()[0]
+        logger.info(f"Saved version {number} of {version.candidate_id}")
+        return version.model_copy(update={"version": number})
+
+    @STORAGE_SECONDS.time(operation="list_versions")
+    def list_versions(self, candidate_id: str) -> List[ResumeVersion]:
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT version, payload FROM resume_versions "
+                "WHERE candidate_id = ? ORDER BY version",
+                (candidate_id,),
+            )
+            .fetchall()
+        )
+        return [
+            ResumeVersion.model_validate_json(payload).model_copy(
+                update={"version": number}
+            )
+            for number, payload in rows
+        ]
+
+
+def create_storage(backend: str = STORAGE_BACKEND) -> BaseResumeStorage:
+    """
+    Build the configured storage backend.
+
+    Args:
+        backend: "memory" or "sqlite"
+
+    Returns:
+        Storage instance
+    """
+    if backend == "sqlite":
+        return SQLiteResumeStorage()
+    if backend != "memory":
+        logger.warning(f"Unknown storage backend '{backend}', using memory")
+    return ResumeStorage()
+
 
 # Global storage instance
-resume_storage = ResumeStorage()
+resume_storage = create_storage()
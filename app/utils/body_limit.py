@@ -0,0 +1,102 @@
+"""
+ASGI middleware that rejects request bodies over a size limit.
+"""
+
+import json
+from typing import Dict, Optional
+
+
+class BodySizeLimitError(Exception):
+    """Raised inside the app when a streamed body exceeds the limit."""
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject oversize request bodies before they are buffered.
+
+    Requests declaring a Content-Length over the limit get a 413 without the
+    body being read. Chunked requests are counted as they stream in and cut
+    off as soon as they cross the limit.
+    """
+
+    def __init__(
+        self,
+        app,
+        max_body_bytes: int,
+        path_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.path_limits = path_limits or {}
+
+    def _limit_for(self, path: str) -> int:
+        return self.path_limits.get(path, self.max_body_bytes)
+
+    async def _reject(self, send, limit: int) -> None:
+        await self._respond(
+            send, 413, f"Request body exceeds the maximum of {limit} bytes"
+        )
+
+    async def _respond(self, send, status: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = self._limit_for(scope["path"])
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length is not None:
+            try:
+                declared = int(content_length)
+            except ValueError:
+                await self._respond(send, 400, "Invalid Content-Length header")
+                return
+            if declared > limit:
+                await self._reject(send, limit)
+                return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise BodySizeLimitError(limit)
+            return message
+
+        async def limited_send(message):
+            nonlocal response_started
+            if exceeded:
+                # The app turned our error into its own response; replace it
+                if message["type"] == "http.response.start" and not response_started:
+                    response_started = True
+                    await self._reject(send, limit)
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, limited_send)
+        except BodySizeLimitError:
+            if not response_started:
+                await self._reject(send, limit)
@@ -0,0 +1,110 @@
+"""
+Date and duration parsing for work experience entries.
+
+Kept free of service imports so both the ranker and the parse quality checks
+can use it without loading each other's dependencies.
+"""
+
+import re
+from datetime import date
+from typing import List, Optional, Tuple
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        [
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+# A month after the year ("2016.08") must not be the month of the next date
+# in the range ("06/2019 - 08/2022")
+_DATE_RE = re.compile(
+    r"(?:(?P<month_name>[a-z]{3,9})\.?\s+|(?P<month>\d{1,2})\s*[/.-]\s*)?"
+    r"(?P<year>(?:19|20)\d{2})"
+    r"(?:\s*[/.-]\s*(?P<month_after>\d{1,2})\b(?![/.-](?:19|20)\d{2}))?"
+)
+_PRESENT_RE = re.compile(r"\b(?:present|current|now|today|ongoing|date|since)\b")
+_AMOUNT_RE = re.compile(
+    r"(\d+(?:\.\d+)?)\s*\+?\s*(years?|yrs?|months?|mos?)\b", re.IGNORECASE
+)
+
+
+def _fractional_year(year: int, month: Optional[int]) -> float:
+    return year + ((month or 1) - 1) / 12
+
+
+def _dates(text: str) -> List[Tuple[float, bool]]:
+    """Dates in a duration string as (fractional year, month given)."""
+    found = []
+    for match in _DATE_RE.finditer(text):
+        month = None
+        if match.group("month_name"):
+            month = _MONTHS.get(match.group("month_name"))
+        elif match.group("month") or match.group("month_after"):
+            month = int(match.group("month") or match.group("month_after"))
+            month = month if 1 <= month <= 12 else None
+        found.append((_fractional_year(int(match.group("year")), month), bool(month)))
+    return found
+
+
+def parse_duration_interval(duration: str) -> Optional[Tuple[float, float]]:
+    """
+    Parse a date range such as "Jan 2019 - Present" or "2018 - 2021".
+
+    Args:
+        duration: Duration text from a work experience entry
+
+    Returns:
+        (start, end) in fractional years, or None if no range was found
+    """
+    text = duration.lower()
+    dates = _dates(text)
+    if not dates:
+        return None
+    start, _ = dates[0]
+    if len(dates) >= 2:
+        end, has_month = dates[1]
+        # "Jan 2019 - Dec 2019" covers the whole of December
+        end += 1 / 12 if has_month else 0
+    elif _PRESENT_RE.search(text):
+        today = date.today()
+        end = _fractional_year(today.year, today.month) + 1 / 12
+    else:
+        return None
+    return (start, end) if end > start else None
+
+
+def parse_duration_years(duration: str) -> float:
+    """
+    Convert a duration string into years.
+
+    Handles date ranges ("Mar 2020 - Present", "2018-2021", "06/2019 to
+    08/2022") and explicit amounts ("3 years", "18 months").
+
+    Args:
+        duration: Duration text from a work experience entry
+
+    Returns:
+        Years of experience, 0.0 if the text cannot be interpreted
+    """
+    interval = parse_duration_interval(duration)
+    if interval:
+        return interval[1] - interval[0]
+    years = 0.0
+    for amount, unit in _AMOUNT_RE.findall(duration):
+        years += float(amount) / (12 if unit.lower().startswith("mo") else 1)
+    return years
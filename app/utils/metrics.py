@@ -0,0 +1,310 @@
+"""
+Minimal in-process metrics rendered in the Prometheus text format.
+
+Counters, gauges and histograms keep their values in plain dicts keyed by
+label values and guard updates with a per-metric lock, so recording a value
+costs a dict lookup and a few additions. Values are per process: metrics
+recorded inside extraction worker processes are not exported, so the
+pipeline records extraction in the parent.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import ContextDecorator
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond storage calls to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, e.g. requests or tokens."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in values
+        ]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. requests in flight."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        if not self.labelnames:
+            self._values[()] = 0.0
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def track_inprogress(self, **labels: str) -> "_InProgress":
+        """Context manager/decorator that counts the calls currently inside it."""
+        return _InProgress(self, labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in values
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def time(self, **labels: str) -> "_Timer":
+        """Context manager/decorator that observes the elapsed seconds."""
+        return _Timer(self, labels)
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            snapshot = [
+                (key, list(counts), self._sums[key])
+                for key, counts in self._counts.items()
+            ]
+        names = self.labelnames + ("le",)
+        lines = []
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer(ContextDecorator):
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def _recreate_cm(self):
+        # Fresh start time per call when used as a decorator across threads
+        return _Timer(self._histogram, self._labels)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+class _InProgress(ContextDecorator):
+    def __init__(self, gauge: Gauge, labels: Dict[str, str]):
+        self._gauge = gauge
+        self._labels = labels
+
+    def __enter__(self):
+        self._gauge.inc(**self._labels)
+        return self
+
+    def __exit__(self, *exc):
+        self._gauge.dec(**self._labels)
+        return False
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for the /metrics endpoint."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# Global registry instance
+registry = MetricsRegistry()
+
+# Application metrics
+UPLOADS_IN_FLIGHT = Gauge(
+    "resume_uploads_in_flight", "Upload requests currently being processed"
+)
+UPLOADS = Counter(
+    "resume_uploads_total", "Completed upload requests by outcome", ("outcome",)
+)
+STAGE_SECONDS = Histogram(
+    "resume_stage_duration_seconds",
+    "Time spent in each processing stage",
+    ("stage",),
+)
+DOCUMENT_PAGES = Histogram(
+    "resume_document_pages",
+    "Pages per extracted PDF",
+    ("format",),
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+DOCUMENT_CHARACTERS = Histogram(
+    "resume_document_characters",
+    "Characters of text extracted per document",
+    ("format",),
+    buckets=(500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000),
+)
+LLM_TOKENS = Counter(
+    "resume_llm_tokens_total", "Provider-reported LLM tokens", ("kind",)
+)
+PARSE_FAILURES = Counter(
+    "resume_parse_failures_total",
+    "Failed resume parses by path and error type",
+    ("mode", "error"),
+)
+PARSE_TIER_SECONDS = Histogram(
+    "resume_parse_tier_duration_seconds",
+    "Time spent per model tier of the parse cascade",
+    ("tier",),
+)
+CASCADE_ESCALATIONS = Counter(
+    "resume_cascade_escalations_total",
+    "Fast-model parses escalated to the strong model, by failed check",
+    ("reason",),
+)
+STORAGE_SECONDS = Histogram(
+    "resume_storage_duration_seconds",
+    "Time spent in storage operations",
+    ("operation",),
+)
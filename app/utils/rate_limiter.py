@@ -0,0 +1,82 @@
+"""
+Token-bucket rate limiter usable from both threads and asyncio tasks.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket refilled continuously at ``limit_per_minute / 60`` per second.
+
+    A limit of 0 disables limiting. Requests larger than the bucket are
+    clamped to its capacity so they wait for a full bucket instead of
+    blocking forever.
+    """
+
+    def __init__(self, limit_per_minute: int):
+        self.limit_per_minute = limit_per_minute
+        self.capacity = float(limit_per_minute)
+        self._rate = limit_per_minute / 60.0
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_per_minute > 0
+
+    def _reserve(self, amount: float) -> float:
+        """Take ``amount`` from the bucket and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._available = min(
+                self.capacity, self._available + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._available -= min(amount, self.capacity)
+            if self._available >= 0:
+                return 0.0
+            return -self._available / self._rate
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Block the calling thread until ``amount`` is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, amount: float = 1.0) -> float:
+        """
+        Wait without blocking the event loop until ``amount`` is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def adjust(self, amount: float) -> None:
+        """
+        Correct an earlier reservation once the real cost is known.
+
+        Args:
+            amount: Extra amount consumed (negative to give some back)
+        """
+        if not self.enabled or not amount:
+            return
+        with self._lock:
+            self._available = min(self.capacity, self._available - amount)
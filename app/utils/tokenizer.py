@@ -0,0 +1,77 @@
+"""
+Local token counting for prompt budgeting.
+
+Uses tiktoken (installed with langchain-openai) when its encoding files are
+available and falls back to a character-based estimate otherwise, e.g. on
+machines without network access to download the encodings.
+"""
+
+from functools import lru_cache
+from typing import Optional
+from app.utils.logger import logger
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken ships with langchain-openai
+    tiktoken = None
+
+# Average characters per token for English text with the GPT-4 family encodings
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _encoding(model_name: str):
+    """Load (once) the tiktoken encoding for a model, or None if unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(
+            f"Tokenizer for {model_name} unavailable, estimating tokens: {str(e)}"
+        )
+        return None
+
+
+def count_tokens(text: str, model_name: Optional[str] = None) -> int:
+    """
+    Count the tokens of a text for a chat model.
+
+    Args:
+        text: Text to count
+        model_name: Chat model whose encoding to use (defaults to gpt-4o)
+
+    Returns:
+        Number of tokens (estimated if no tokenizer is available)
+    """
+    encoding = _encoding(model_name or "gpt-4o")
+    if encoding is None:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(
+    text: str, max_tokens: int, model_name: Optional[str] = None
+) -> str:
+    """
+    Cut a text to at most ``max_tokens`` tokens, preferring a line boundary.
+
+    Args:
+        text: Text to cut
+        max_tokens: Token budget
+        model_name: Chat model whose encoding to use
+
+    Returns:
+        Truncated text
+    """
+    encoding = _encoding(model_name or "gpt-4o")
+    if encoding is None:
+        cut = text[: max_tokens * CHARS_PER_TOKEN]
+    else:
+        cut = encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+
+    if len(cut) < len(text) and "\n" in cut:
+        cut = cut[: cut.rindex("\n")]
+    return cut.rstrip()
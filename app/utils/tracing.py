@@ -0,0 +1,391 @@
+"""
+Per-request span trees for explaining individual slow uploads.
+
+The active span lives in a context variable, so it follows the request
+through awaits and ``run_in_threadpool`` and child spans attach to it
+without being passed around. Timings use the monotonic clock; the root
+also records the wall clock once so exported spans carry absolute times.
+Finished traces are kept in a bounded ring buffer keyed by document ID and
+can be appended to a JSONL file in the OTLP/JSON shape read by the
+OpenTelemetry collector's file receiver. Without an active trace, spans
+are a shared no-op object and cost a context variable lookup.
+"""
+
+import functools
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Union
+from dotenv import load_dotenv
+from app.utils.logger import logger
+
+load_dotenv()
+
+# Configuration from environment variables
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+# Number of most recent traces kept for GET /api/resume/{id}/trace
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "500"))
+# Append finished spans to this JSONL file (empty disables the export)
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "")
+
+SERVICE_NAME = "resume-parser"
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """A timed operation with attributes, events and child spans."""
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, **attributes: Any):
+        self.name = name
+        self.parent = parent
+        self.root: Span = parent.root if parent is not None else self
+        self.trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.attributes: Dict[str, Any] = attributes
+        self.events: List[Dict[str, Any]] = []
+        self.children: List[Span] = []
+        self.error: Optional[str] = None
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.exported = False
+        if parent is None:
+            self.start_unix_ns = time.time_ns()
+
+    def child(self, name: str, **attributes: Any) -> "Span":
+        """Start a child span without making it the active one."""
+        span = Span(name, self, **attributes)
+        self.children.append(span)
+        return span
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        self.events.append(
+            {"name": name, "time_ns": time.perf_counter_ns(), "attributes": attributes}
+        )
+
+    def record_error(self, error: Union[BaseException, str]) -> None:
+        if isinstance(error, BaseException):
+            error = f"{type(error).__name__}: {error}"
+        self.error = error
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if error is not None:
+            self.record_error(error)
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+
+    def unix_ns(self, perf_ns: int) -> int:
+        """Convert a monotonic timestamp of this trace to Unix nanoseconds."""
+        return self.root.start_unix_ns + perf_ns - self.root.start_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Nested representation with milliseconds relative to the root start."""
+        origin = self.root.start_ns
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "start_ms": round((self.start_ns - origin) / 1e6, 3),
+            "duration_ms": (
+                round((self.end_ns - self.start_ns) / 1e6, 3)
+                if self.end_ns is not None
+                else None
+            ),
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": dict(self.attributes),
+            "events": [
+                {
+                    "name": event["name"],
+                    "time_ms": round((event["time_ns"] - origin) / 1e6, 3),
+                    "attributes": event["attributes"],
+                }
+                for event in list(self.events)
+            ],
+            "children": [child.to_dict() for child in list(self.children)],
+        }
+
+    def walk(self) -> Iterator["Span"]:
+        yield self
+        for child in list(self.children):
+            yield from child.walk()
+
+
+class _NoopSpan(Span):
+    """Stand-in used when no trace is active; records nothing."""
+
+    def __init__(self):
+        self.name = ""
+        self.parent = None
+        self.root = self
+        self.attributes = {}
+
+    def child(self, name: str, **attributes: Any) -> Span:
+        return self
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, error: Union[BaseException, str]) -> None:
+        pass
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def current_span() -> Span:
+    """Returns the active span, or the no-op span outside a trace."""
+    return _current.get() or NOOP_SPAN
+
+
+@contextmanager
+def use_span(span: Optional[Span]) -> Iterator[Span]:
+    """Make ``span`` the active span for the block without ending it."""
+    token = _current.set(None if span is NOOP_SPAN else span)
+    try:
+        yield span or NOOP_SPAN
+    finally:
+        try:
+            _current.reset(token)
+        except ValueError:
+            # An abandoned async generator is closed from another context
+            pass
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a block as a child of the active span.
+
+    Args:
+        name: Span name, e.g. "extract" or "llm"
+        **attributes: Initial span attributes
+
+    Yields:
+        The new span (the no-op span outside a trace)
+    """
+    parent = _current.get()
+    if parent is None:
+        yield NOOP_SPAN
+        return
+    child = parent.child(name, **attributes)
+    token = _current.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.record_error(e)
+        raise
+    finally:
+        _current.reset(token)
+        child.end()
+
+
+def traced(name: str):
+    """Decorator running a sync or async function inside ``span(name)``."""
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    return {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "parentSpanId": span.parent.span_id if span.parent is not None else "",
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.unix_ns(span.start_ns)),
+        "endTimeUnixNano": str(span.unix_ns(span.end_ns)),
+        "attributes": _otlp_attributes(span.attributes),
+        "events": [
+            {
+                "timeUnixNano": str(span.unix_ns(event["time_ns"])),
+                "name": event["name"],
+                "attributes": _otlp_attributes(event["attributes"]),
+            }
+            for event in span.events
+        ],
+        # STATUS_CODE_OK / STATUS_CODE_ERROR
+        "status": ({"code": 2, "message": span.error} if span.error else {"code": 1}),
+    }
+
+
+class Tracer:
+    """Keeps recent traces by document ID and exports finished spans."""
+
+    def __init__(
+        self,
+        enabled: bool = TRACING_ENABLED,
+        capacity: int = TRACE_BUFFER_SIZE,
+        export_path: str = TRACE_EXPORT_PATH,
+    ):
+        self.enabled = enabled
+        self.capacity = capacity
+        self.export_path = export_path
+        self._traces: "OrderedDict[str, Span]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        if export_path:
+            os.makedirs(os.path.dirname(export_path) or ".", exist_ok=True)
+
+    def start(self, name: str, **attributes: Any) -> Span:
+        """
+        Start a new trace; activate it with ``use_span`` or ``activate``.
+
+        Args:
+            name: Root span name
+            **attributes: Root attributes; set ``document_id`` (now or
+                later) for the trace to be kept
+
+        Returns:
+            Root span (the no-op span when tracing is disabled)
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(name, **attributes)
+
+    def finish(self, span: Optional[Span], error: Optional[BaseException] = None):
+        """End a span, keep its trace by document ID and export what finished."""
+        if span is None or span is NOOP_SPAN:
+            return
+        span.end(error)
+        document_id = span.root.attributes.get("document_id")
+        if document_id:
+            with self._lock:
+                self._traces[document_id] = span.root
+                self._traces.move_to_end(document_id)
+                while len(self._traces) > self.capacity:
+                    self._traces.popitem(last=False)
+        if self.export_path:
+            self._export(span)
+
+    @contextmanager
+    def activate(self, span: Optional[Span]) -> Iterator[Span]:
+        """Make ``span`` active for the block and finish it on exit."""
+        error = None
+        try:
+            with use_span(span) as active:
+                yield active
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.finish(span, error)
+
+    def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the span tree recorded for a document.
+
+        Args:
+            document_id: Document identifier
+
+        Returns:
+            Trace with per-stage totals and the nested spans, or None
+        """
+        with self._lock:
+            root = self._traces.get(document_id)
+        if root is None:
+            return None
+
+        # Total time per span name, slowest first, to spot the dominant stage
+        stages: Dict[str, float] = {}
+        for span in root.walk():
+            if span is not root and span.end_ns is not None:
+                stages[span.name] = (
+                    stages.get(span.name, 0.0) + (span.end_ns - span.start_ns) / 1e6
+                )
+        tree = root.to_dict()
+        return {
+            "document_id": document_id,
+            "trace_id": root.trace_id,
+            "duration_ms": tree["duration_ms"],
+            "stages": {
+                name: round(ms, 3)
+                for name, ms in sorted(stages.items(), key=lambda item: -item[1])
+            },
+            "root": tree,
+        }
+
+    def _export(self, span: Span) -> None:
+        """Append the finished, not yet exported spans under ``span``."""
+        spans = [s for s in span.walk() if s.end_ns is not None and not s.exported]
+        if not spans:
+            return
+        for s in spans:
+            s.exported = True
+        line = json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": _otlp_attributes(
+                                {"service.name": SERVICE_NAME}
+                            )
+                        },
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": __name__},
+                                "spans": [_otlp_span(s) for s in spans],
+                            }
+                        ],
+                    }
+                ]
+            }
+        )
+        try:
+            with self._export_lock, open(self.export_path, "a") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to export trace: {str(e)}")
+
+
+# Global tracer instance
+tracer = Tracer()
@@ -0,0 +1,121 @@
+"""
+Throughput benchmark for DocumentExtractor.
+
+Extracts every document of a synthetic corpus several times, from bytes
+(the upload path), and reports per-document latency, documents and pages
+per second and peak RSS, per format and page count. With --workers > 1 the
+documents are spread over a process pool the way the extraction pipeline
+does.
+
+Usage:
+    python -m benchmarks.bench_extractor --pages 1,5,20,50 --repeat 3 --output data/bench/extractor.json
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+from benchmarks.common import emit_results, latency_summary, self_peak_rss_mb
+from benchmarks.corpus import generate_corpus, parse_page_counts
+from app.services.document_extractor import extract_text_worker
+from app.utils.logger import logger
+
+
+def _timed_extract(task: Tuple[bytes, str]) -> Tuple[float, int]:
+    content, ext = task
+    start = time.perf_counter()
+    text, _ = extract_text_worker(content, ext)
+    return time.perf_counter() - start, len(text)
+
+
+def run(manifest: List[Dict], repeat: int, workers: int) -> Dict:
+    """
+    Extract every document ``repeat`` times.
+
+    Args:
+        manifest: Corpus entries from generate_corpus
+        repeat: Passes over the corpus
+        workers: Extraction processes (1 runs in this process)
+
+    Returns:
+        Overall and per-group measurements
+    """
+    entries = []
+    for entry in manifest:
+        with open(entry["path"], "rb") as f:
+            entries.append((entry, f.read()))
+    tasks = [(content, entry["format"]) for entry, content in entries] * repeat
+    keys = [
+        f"{entry['format'][1:]}_{entry['pages']:02d}p" for entry, _ in entries
+    ] * repeat
+    pages = [entry["pages"] for entry, _ in entries] * repeat
+
+    start = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            timings = list(pool.map(_timed_extract, tasks, chunksize=1))
+    else:
+        timings = [_timed_extract(task) for task in tasks]
+    elapsed = time.perf_counter() - start
+
+    groups: Dict[str, Dict] = defaultdict(
+        lambda: {"latencies": [], "pages": 0, "chars": 0}
+    )
+    for key, page_count, (latency, chars) in zip(keys, pages, timings):
+        groups[key]["latencies"].append(latency)
+        groups[key]["pages"] += page_count
+        groups[key]["chars"] += chars
+
+    per_group = {}
+    for key in sorted(groups):
+        group = groups[key]
+        busy = sum(group["latencies"])
+        per_group[key] = {
+            **latency_summary(group["latencies"]),
+            "pages_per_second": round(group["pages"] / busy, 1) if busy else None,
+            "chars_per_document": group["chars"] // len(group["latencies"]),
+        }
+
+    total_bytes = sum(len(content) for content, _ in tasks)
+    return {
+        "documents": len(tasks),
+        "pages": sum(pages),
+        "elapsed_seconds": round(elapsed, 3),
+        "documents_per_second": round(len(tasks) / elapsed, 2),
+        "pages_per_second": round(sum(pages) / elapsed, 1),
+        "megabytes_per_second": round(total_bytes / 1e6 / elapsed, 2),
+        "latency": latency_summary([latency for latency, _ in timings]),
+        "peak_rss_mb": self_peak_rss_mb(include_children=workers > 1),
+        "by_document": per_group,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--corpus", default="data/bench/corpus", help="Corpus directory"
+    )
+    parser.add_argument(
+        "--pages",
+        default="1,5,20,50",
+        type=parse_page_counts,
+        help="Comma-separated page counts",
+    )
+    parser.add_argument("--per-size", type=int, default=3, help="Documents per size")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the corpus")
+    parser.add_argument("--workers", type=int, default=1, help="Extraction processes")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus random seed")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    # Per-document log lines would dominate the measurement
+    logger.remove()
+
+    manifest = generate_corpus(args.corpus, args.pages, args.per_size, args.seed)
+    results = run(manifest, args.repeat, args.workers)
+    emit_results("extractor", vars(args), results, args.output)
+
+
+if __name__ == "__main__":
+    main()
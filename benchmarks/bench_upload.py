@@ -0,0 +1,299 @@
+"""
+End-to-end load test for the upload endpoint.
+
+Starts the fake LLM server and the API (uvicorn) as subprocesses, then
+uploads resumes from the synthetic corpus with a fixed number of concurrent
+clients. Reports latency percentiles, requests per second, errors and the
+API's peak RSS (including its extraction worker processes).
+
+Usage:
+    python -m benchmarks.bench_upload --requests 200 --concurrency 16 --latency 0.5 --output data/bench/upload.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+import httpx
+from benchmarks.common import (
+    emit_results,
+    latency_summary,
+    process_peak_rss_mb,
+    self_peak_rss_mb,
+)
+from benchmarks.corpus import generate_corpus, parse_page_counts
+
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+def start_process(args: List[str], env: Dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", *args],
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(
+    url: str, process: Optional[subprocess.Popen], timeout: float = 60
+) -> None:
+    """Poll a URL until it answers, failing early if the process exits."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(
+                f"Process serving {url} exited with {process.returncode}"
+            )
+        try:
+            if httpx.get(url, timeout=1).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{url} did not become ready in {timeout}s")
+
+
+async def load(
+    api_url: str,
+    endpoint: str,
+    files: List[Tuple[str, str, bytes]],
+    total: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict:
+    """
+    Send ``total`` uploads from ``concurrency`` concurrent clients.
+
+    Args:
+        api_url: Base URL of the API
+        endpoint: Upload path, e.g. /api/upload
+        files: (group, file name, content) tuples used round-robin
+        total: Number of measured requests
+        concurrency: Concurrent clients
+        warmup: Requests sent before measuring
+
+    Returns:
+        Latencies, times to the first streamed field, status counts and
+        elapsed time
+    """
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=api_url, limits=limits, timeout=600
+    ) as client:
+
+        async def upload(
+            group: str, name: str, content: bytes
+        ) -> Tuple[float, Optional[float], int]:
+            ext = os.path.splitext(name)[1]
+            start = time.perf_counter()
+            first_field = None
+            try:
+                async with client.stream(
+                    "POST",
+                    endpoint,
+                    files={"file": (name, content, CONTENT_TYPES[ext])},
+                ) as response:
+                    # Read everything so streaming endpoints are timed to the end
+                    async for line in response.aiter_lines():
+                        if first_field is None and line.startswith("event: field"):
+                            first_field = time.perf_counter() - start
+                    status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            return time.perf_counter() - start, first_field, status
+
+        for group, name, content in itertools.islice(itertools.cycle(files), warmup):
+            await upload(group, name, content)
+
+        queue = itertools.islice(itertools.cycle(files), total)
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        first_fields: List[float] = []
+        statuses: Counter = Counter()
+
+        async def client_loop() -> None:
+            for group, name, content in queue:
+                latency, first_field, status = await upload(group, name, content)
+                statuses[status] += 1
+                if 200 <= status < 300:
+                    latencies[group].append(latency)
+                    if first_field is not None:
+                        first_fields.append(first_field)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "latencies": latencies,
+        "first_fields": first_fields,
+        "statuses": statuses,
+        "elapsed": elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=100, help="Measured uploads")
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Concurrent clients"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=4, help="Unmeasured uploads first"
+    )
+    parser.add_argument("--endpoint", default="/api/upload", help="Upload path")
+    parser.add_argument(
+        "--corpus", default="data/bench/corpus", help="Corpus directory"
+    )
+    parser.add_argument(
+        "--pages",
+        default="1,5,20",
+        type=parse_page_counts,
+        help="Comma-separated page counts",
+    )
+    parser.add_argument("--per-size", type=int, default=2, help="Documents per size")
+    parser.add_argument(
+        "--latency", type=float, default=0.5, help="Fake LLM latency (s)"
+    )
+    parser.add_argument("--jitter", type=float, default=0.1, help="Fake LLM jitter (s)")
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=0.0,
+        help="Fake LLM completion pace (0 sends everything at once)",
+    )
+    parser.add_argument(
+        "--api-url", help="Benchmark a running API instead of starting one"
+    )
+    parser.add_argument("--api-port", type=int, default=8100)
+    parser.add_argument("--llm-port", type=int, default=9100)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Extra environment for the API process (repeatable)",
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    manifest = generate_corpus(args.corpus, args.pages, args.per_size)
+    files = []
+    for entry in manifest:
+        with open(entry["path"], "rb") as f:
+            group = f"{entry['format'][1:]}_{entry['pages']:02d}p"
+            files.append((group, os.path.basename(entry["path"]), f.read()))
+
+    processes: List[subprocess.Popen] = []
+    api = None
+    api_url = args.api_url
+    try:
+        if api_url is None:
+            llm = start_process(
+                [
+                    "benchmarks.fake_llm_server",
+                    "--port",
+                    str(args.llm_port),
+                    "--latency",
+                    str(args.latency),
+                    "--jitter",
+                    str(args.jitter),
+                    "--tokens-per-second",
+                    str(args.tokens_per_second),
+                ],
+                {},
+            )
+            processes.append(llm)
+            wait_ready(f"http://127.0.0.1:{args.llm_port}/stats", llm)
+
+            scratch = tempfile.mkdtemp(prefix="resume-bench-")
+            env = {
+                "OPENAI_BASE_URL": f"http://127.0.0.1:{args.llm_port}/v1",
+                "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "bench"),
+                # Every upload must reach the (fake) model
+                "PARSE_CACHE_ENABLED": "false",
+                "PERSIST_UPLOADS": "false",
+                "EMBEDDINGS_PROVIDER": "local",
+                "VECTOR_INDEX_DIR": os.path.join(scratch, "vectors"),
+                "STORAGE_BACKEND": "memory",
+            }
+            env.update(item.split("=", 1) for item in args.env)
+            api = start_process(
+                [
+                    "uvicorn",
+                    "app.main:app",
+                    "--port",
+                    str(args.api_port),
+                    "--workers",
+                    str(args.workers),
+                    "--log-level",
+                    "warning",
+                ],
+                env,
+            )
+            processes.append(api)
+            api_url = f"http://127.0.0.1:{args.api_port}"
+            wait_ready(f"{api_url}/", api)
+
+        measured = asyncio.run(
+            load(
+                api_url,
+                args.endpoint,
+                files,
+                args.requests,
+                args.concurrency,
+                args.warmup,
+            )
+        )
+        api_rss = process_peak_rss_mb(api.pid) if api is not None else None
+        llm_stats = None
+        if args.api_url is None:
+            llm_stats = httpx.get(f"http://127.0.0.1:{args.llm_port}/stats").json()
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    latencies = measured["latencies"]
+    succeeded = sum(len(values) for values in latencies.values())
+    results = {
+        "requests": args.requests,
+        "succeeded": succeeded,
+        "status_counts": {
+            str(code): count for code, count in measured["statuses"].items()
+        },
+        "elapsed_seconds": round(measured["elapsed"], 3),
+        "requests_per_second": round(succeeded / measured["elapsed"], 2),
+        "latency": latency_summary(
+            [v for values in latencies.values() for v in values]
+        ),
+        # Only set for /api/upload/stream: when the first parsed field arrived
+        "time_to_first_field": latency_summary(measured["first_fields"]),
+        "latency_by_document": {
+            group: latency_summary(latencies[group]) for group in sorted(latencies)
+        },
+        "api_peak_rss_mb": api_rss,
+        "client_peak_rss_mb": self_peak_rss_mb(),
+        "llm_server_calls": llm_stats,
+    }
+    emit_results("upload", vars(args), results, args.output)
+
+
+if __name__ == "__main__":
+    main()
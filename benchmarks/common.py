@@ -0,0 +1,156 @@
+"""
+Shared helpers for the benchmark scripts: percentiles, peak memory and
+machine-readable result files.
+"""
+
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, Optional[float]]:
+    """
+    Summarize latencies in seconds as milliseconds.
+
+    Args:
+        latencies: Per-request latencies in seconds
+
+    Returns:
+        Count, mean, p50, p95, p99 and max in milliseconds
+    """
+    if not latencies:
+        return {
+            "count": 0,
+            "mean_ms": None,
+            "p50_ms": None,
+            "p95_ms": None,
+            "p99_ms": None,
+            "max_ms": None,
+        }
+    values = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "count": len(latencies),
+        "mean_ms": round(float(values.mean()), 2),
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "max_ms": round(float(values.max()), 2),
+    }
+
+
+def _children(pid: int) -> List[int]:
+    pids = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                pids.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return pids
+
+
+def _peak_rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_peak_rss_mb(pid: int, include_children: bool = True) -> Optional[float]:
+    """
+    Peak resident memory of a running process (Linux only).
+
+    Args:
+        pid: Process ID
+        include_children: Add the peaks of child processes (e.g. worker pools)
+
+    Returns:
+        Peak RSS in MB, or None where /proc is unavailable
+    """
+    if not os.path.exists(f"/proc/{pid}/status"):
+        return None
+    total = _peak_rss_kb(pid)
+    if include_children:
+        pending = _children(pid)
+        while pending:
+            child = pending.pop()
+            total += _peak_rss_kb(child)
+            pending.extend(_children(child))
+    return round(total / 1024, 1)
+
+
+def self_peak_rss_mb(include_children: bool = False) -> float:
+    """
+    Peak resident memory of this process in MB.
+
+    Args:
+        include_children: Add the largest peak among finished child processes
+
+    Returns:
+        Peak RSS in MB
+    """
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        usage += resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(usage / scale, 1)
+
+
+def run_metadata() -> Dict[str, Any]:
+    """Describe the code and machine a benchmark ran on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def emit_results(
+    name: str, config: Dict[str, Any], results: Any, output: Optional[str]
+) -> None:
+    """
+    Print benchmark results as JSON and optionally write them to a file.
+
+    Args:
+        name: Benchmark name
+        config: Parameters the benchmark ran with
+        results: Measurements
+        output: Path of a JSON file to write, if any
+    """
+    report = {
+        "benchmark": name,
+        "meta": run_metadata(),
+        "config": config,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if output:
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Results written to {output}", file=sys.stderr)
@@ -0,0 +1,258 @@
+"""
+OpenAI-compatible stand-in for the chat and embeddings APIs.
+
+Returns a fixed, schema-valid resume JSON after a configurable delay, so
+load tests measure this service rather than the provider. Streaming
+requests receive the same content as server-sent event chunks paced at a
+configurable token rate. Requests with tools get it back as the arguments
+of a call to the first tool, streamed or not. Point the API at it with
+OPENAI_BASE_URL.
+
+Usage:
+    python -m benchmarks.fake_llm_server --port 9000 --latency 0.5 --tokens-per-second 200
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+from typing import Dict, List
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+RESUME_JSON = {
+    "contact_information": {
+        "name": "Jane Doe",
+        "email": "jane.doe@example.com",
+        "phone": "+1 555 123 4567",
+        "location": "Berlin, Germany",
+    },
+    "professional_summary": "Backend engineer with eight years of experience.",
+    "work_experience": [
+        {
+            "company": "Acme Corp",
+            "role": "Senior Software Engineer",
+            "duration": "Jan 2019 - Present",
+            "responsibilities": [
+                "Built a billing service serving 3M requests per day",
+                "Migrated the data pipeline to Spark",
+            ],
+        },
+        {
+            "company": "Globex",
+            "role": "Software Engineer",
+            "duration": "2016 - 2018",
+            "responsibilities": ["Automated CI/CD workflows"],
+        },
+    ],
+    "education": [
+        {
+            "degree": "B.Sc. Computer Science",
+            "institution": "State University",
+            "year": "2016",
+        }
+    ],
+    "skills": {"technical": ["Python", "SQL", "AWS", "Docker"], "soft": ["Leadership"]},
+    "certifications": [],
+    "projects": [],
+}
+# Characters per streamed chunk, roughly one token
+CHUNK_CHARS = 4
+
+
+def create_app(
+    latency: float, jitter: float, tokens_per_second: float, embedding_dimensions: int
+) -> FastAPI:
+    """
+    Build the stand-in server.
+
+    Args:
+        latency: Seconds before the response (or first chunk) is sent
+        jitter: Random extra latency, uniform in [0, jitter] seconds
+        tokens_per_second: Streaming pace, 0 for as fast as possible
+        embedding_dimensions: Size of returned embedding vectors
+
+    Returns:
+        FastAPI application
+    """
+    api = FastAPI()
+    content = json.dumps(RESUME_JSON)
+    completion_tokens = len(content) // CHUNK_CHARS + 1
+    stats = {"chat": 0, "stream": 0, "tool_calls": 0, "embeddings": 0}
+
+    async def delay() -> None:
+        await asyncio.sleep(latency + random.uniform(0, jitter))
+
+    def usage(messages: List[Dict], tools: List[Dict]) -> Dict:
+        # Tool definitions count as prompt tokens, as with the real API
+        characters = sum(len(str(m.get("content", ""))) for m in messages)
+        prompt_tokens = (characters + len(json.dumps(tools))) // 4 + 1
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def chunk(model: str, delta: Dict, finish_reason=None) -> str:
+        body = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(body)}\n\n"
+
+    def tool_call(name: str, arguments: str, first: bool) -> Dict:
+        call = {"index": 0, "function": {"arguments": arguments}}
+        if first:
+            call.update(id="call_bench", type="function")
+            call["function"]["name"] = name
+        return {"tool_calls": [call]}
+
+    async def stream(
+        model: str, messages: List[Dict], tools: List[Dict], include_usage: bool
+    ):
+        await delay()
+        tool = tools[0]["function"]["name"] if tools else None
+        if tool:
+            yield chunk(model, {"role": "assistant", **tool_call(tool, "", True)})
+        else:
+            yield chunk(model, {"role": "assistant", "content": ""})
+        pause = 1 / tokens_per_second if tokens_per_second > 0 else 0
+        for start in range(0, len(content), CHUNK_CHARS):
+            piece = content[start : start + CHUNK_CHARS]
+            if tool:
+                yield chunk(model, tool_call(tool, piece, False))
+            else:
+                yield chunk(model, {"content": piece})
+            if pause:
+                await asyncio.sleep(pause)
+        yield chunk(model, {}, "tool_calls" if tool else "stop")
+        if include_usage:
+            body = {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [],
+                "usage": usage(messages, tools),
+            }
+            yield f"data: {json.dumps(body)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    @api.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake")
+        messages = body.get("messages", [])
+        if body.get("stream"):
+            stats["stream"] += 1
+            include_usage = (body.get("stream_options") or {}).get(
+                "include_usage", False
+            )
+            return StreamingResponse(
+                stream(model, messages, body.get("tools") or [], include_usage),
+                media_type="text/event-stream",
+            )
+
+        stats["chat"] += 1
+        await delay()
+        if tokens_per_second > 0:
+            await asyncio.sleep(completion_tokens / tokens_per_second)
+        message = {"role": "assistant", "content": content}
+        finish_reason = "stop"
+        if body.get("tools"):
+            stats["tool_calls"] += 1
+            message = {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "call_bench",
+                        "type": "function",
+                        "function": {
+                            "name": body["tools"][0]["function"]["name"],
+                            "arguments": content,
+                        },
+                    }
+                ],
+            }
+            finish_reason = "tool_calls"
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": finish_reason,
+                }
+            ],
+            "usage": usage(messages, body.get("tools") or []),
+        }
+
+    @api.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body.get("input", [])
+        inputs = inputs if isinstance(inputs, list) else [inputs]
+        stats["embeddings"] += 1
+        await delay()
+        data = []
+        for index, value in enumerate(inputs):
+            seed = int.from_bytes(
+                hashlib.sha256(str(value).encode()).digest()[:4], "little"
+            )
+            vector = np.random.default_rng(seed).standard_normal(embedding_dimensions)
+            vector /= np.linalg.norm(vector)
+            data.append(
+                {"object": "embedding", "index": index, "embedding": vector.tolist()}
+            )
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "fake"),
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+        }
+
+    @api.get("/stats")
+    def get_stats():
+        return stats
+
+    return api
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument(
+        "--latency", type=float, default=0.5, help="Seconds per response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Extra random seconds"
+    )
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=0.0,
+        help="Completion pace (0 sends everything at once)",
+    )
+    parser.add_argument("--embedding-dimensions", type=int, default=1536)
+    args = parser.parse_args()
+
+    api = create_app(
+        args.latency, args.jitter, args.tokens_per_second, args.embedding_dimensions
+    )
+    uvicorn.run(api, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
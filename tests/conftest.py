@@ -0,0 +1,19 @@
+"""
+Shared test setup.
+
+Modules build their global service instances at import time from the
+environment, so it is set here first: no disk-backed cache, upload store or
+storage, and a placeholder API key (tests never call the LLM).
+"""
+
+import os
+
+os.environ.update(
+    {
+        "OPENAI_API_KEY": "test-key",
+        "PARSE_CACHE_ENABLED": "false",
+        "PERSIST_UPLOADS": "false",
+        "STORAGE_BACKEND": "memory",
+        "VERSIONING_ENABLED": "false",
+    }
+)
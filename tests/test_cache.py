@@ -0,0 +1,104 @@
+import os
+import time
+from app.models import ContactInformation, ResumeData
+from app.services.cache import ParseCache
+
+
+def _resume(name: str) -> ResumeData:
+    return ResumeData(contact_information=ContactInformation(name=name))
+
+
+def _cache(tmp_path, **kwargs) -> ParseCache:
+    return ParseCache(cache_dir=str(tmp_path), enabled=True, **kwargs)
+
+
+def test_key_ignores_whitespace_but_not_model(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.make_key("Jane  Doe\nPython", "gpt-4o", "v1")
+    assert key == cache.make_key(" Jane Doe Python ", "gpt-4o", "v1")
+    assert key != cache.make_key("Jane Doe Python", "gpt-4o-mini", "v1")
+    assert key != cache.make_key("Jane Doe Python", "gpt-4o", "v2")
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = _cache(tmp_path, max_items=2)
+    cache.set("a", _resume("A"))
+    cache.set("b", _resume("B"))
+    cache.get("a")
+    cache.set("c", _resume("C"))
+
+    stats = cache.stats()
+    assert stats["memory_items"] == 2
+    assert stats["evictions"] == 1
+    # "b" left memory but is still on disk
+    assert cache.get("b").contact_information.name == "B"
+    assert cache.stats()["disk_hits"] == 1
+    # Reading "b" back pushed out "a", the least recently used entry
+    assert cache.get("c").contact_information.name == "C"
+    assert cache.stats()["memory_hits"] == 2
+    cache.get("a")
+    assert cache.stats()["disk_hits"] == 2
+
+
+def test_returned_results_are_copies(tmp_path):
+    cache = _cache(tmp_path)
+    cache.set("a", _resume("A"))
+    cache.get("a").contact_information.name = "changed"
+    assert cache.get("a").contact_information.name == "A"
+
+
+def test_expired_disk_entry_is_a_miss_and_removed(tmp_path):
+    cache = _cache(tmp_path, ttl_seconds=60)
+    cache.set("a", _resume("A"))
+    path = cache._path("a")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    # A fresh instance has nothing in memory, so the lookup reaches the disk
+    cache = _cache(tmp_path, ttl_seconds=60)
+    assert cache.get("a") is None
+    assert not os.path.exists(path)
+    assert cache.stats()["disk_bytes"] == 0
+
+
+def test_rewriting_a_key_does_not_count_its_bytes_twice(tmp_path):
+    cache = _cache(tmp_path)
+    cache.set("a", _resume("A"))
+    cache.set("a", _resume("A"))
+    cache.set("a", _resume("Another name"))
+
+    size = os.path.getsize(cache._path("a"))
+    assert cache.stats()["disk_bytes"] == size
+    assert _cache(tmp_path).stats()["disk_bytes"] == size
+
+
+def test_disk_tier_evicts_oldest_entries_over_budget(tmp_path):
+    cache = _cache(tmp_path)
+    cache.set("probe", _resume("A"))
+    entry_size = cache.stats()["disk_bytes"]
+    cache.clear()
+
+    cache = _cache(tmp_path, max_disk_bytes=entry_size * 3)
+    for i, key in enumerate("abcd"):
+        cache.set(key, _resume("A"))
+        mtime = time.time() - 100 + i
+        os.utime(cache._path(key), (mtime, mtime))
+
+    assert not os.path.exists(cache._path("a"))
+    assert os.path.exists(cache._path("d"))
+    assert cache.stats()["disk_bytes"] <= entry_size * 3
+
+
+def test_stale_schema_namespaces_are_purged(tmp_path):
+    stale = tmp_path / "0123456789abcdef"
+    stale.mkdir()
+    (stale / "entry.json").write_text("{}")
+    _cache(tmp_path)
+    assert not stale.exists()
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = ParseCache(cache_dir=str(tmp_path / "cache"), enabled=False)
+    cache.set("a", _resume("A"))
+    assert cache.get("a") is None
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,90 @@
+from app.services.compactor import compact_text
+from app.services.document_extractor import PAGE_BREAK, TABLE_CELL_SEPARATOR
+
+
+def _document(*pages: str) -> str:
+    return PAGE_BREAK.join(pages)
+
+
+def _lines(text: str):
+    return text.split("\n")
+
+
+def test_page_numbers_are_removed_at_page_edges():
+    text = _document(
+        "Jane Doe\nExperience\nAcme\n1",
+        "Page 2 of 3\nEducation\nMIT",
+        "Skills\nPython\n3 / 3",
+    )
+    lines = _lines(compact_text(text, token_budget=0).text)
+    assert "1" not in lines
+    assert "Page 2 of 3" not in lines
+    assert "3 / 3" not in lines
+    assert "Acme" in lines and "MIT" in lines and "Python" in lines
+
+
+def test_bare_numbers_inside_a_page_are_kept():
+    body = "Scores\nA\nB\nC\n42\nD\nE\nF"
+    text = _document(f"Jane Doe\n{body}\n1", f"Summary\n{body}\n2")
+    lines = _lines(compact_text(text, token_budget=0).text)
+    assert lines.count("42") == 2
+    assert "1" not in lines and "2" not in lines
+
+
+def test_single_page_numbers_are_content():
+    assert _lines(compact_text("Awards\n1\nFirst place", token_budget=0).text) == [
+        "Awards",
+        "1",
+        "First place",
+    ]
+
+
+def test_running_headers_are_removed_after_the_first_page():
+    header = "Jane Doe - Resume"
+    text = _document(
+        f"{header}\nExperience\nAcme",
+        f"{header}\nEducation\nMIT",
+        f"{header}\nSkills\nPython",
+    )
+    lines = _lines(compact_text(text, token_budget=0).text)
+    assert lines.count(header) == 1
+    assert lines[0] == header
+
+
+def test_repeated_lines_in_the_page_body_are_kept():
+    heading = "Projects"
+    filler = "\n".join(f"Line {i}" for i in range(5))
+    text = _document(
+        f"{heading}\nA\nB\n{filler}",
+        f"{heading}\nC\nD\n{heading}\n{filler}",
+        f"{heading}\nE\nF\n{filler}",
+    )
+    lines = _lines(compact_text(text, token_budget=0).text)
+    # Only the page-top copies on later pages are furniture
+    assert lines.count(heading) == 2
+
+
+def test_whitespace_and_table_cells_are_compacted():
+    text = (
+        "Python   developer\n\n\n\nSkills\n"
+        + TABLE_CELL_SEPARATOR.join(["Python", "Python", "SQL", "", "Skills"])
+        + "\n\n"
+    )
+    assert compact_text(text, token_budget=0).text == (
+        "Python developer\n\nSkills\nPython | SQL"
+    )
+
+
+def test_token_budget_truncates_at_a_line_boundary():
+    text = "\n".join(f"Responsibility number {i}" for i in range(200))
+    result = compact_text(text, token_budget=50)
+    assert result.truncated
+    assert result.compacted_tokens <= 50
+    assert result.saved_tokens > 0
+    assert all(line.startswith("Responsibility") for line in _lines(result.text))
+
+
+def test_short_text_is_not_truncated():
+    result = compact_text("Jane Doe\nPython", token_budget=50)
+    assert not result.truncated
+    assert result.text == "Jane Doe\nPython"
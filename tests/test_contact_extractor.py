@@ -0,0 +1,98 @@
+import pytest
+from app.models import ContactInformation
+from app.services.contact_extractor import (
+    extract_contact_info,
+    guess_name,
+    merge_contact_info,
+    prefilled_fields,
+)
+
+RESUME_HEADER = """Jane Doe
+Email: Jane.Doe@Example.com | Phone: +1 (415) 555-0100
+linkedin.com/in/janedoe/ github.com/janedoe
+www.janedoe.dev
+"""
+
+
+def test_extracts_contact_fields_from_text():
+    contact = extract_contact_info(RESUME_HEADER, include_name=True)
+    assert contact.name == "Jane Doe"
+    assert contact.email == "jane.doe@example.com"
+    assert contact.phone == "+1 (415) 555-0100"
+    assert contact.linkedin == "https://linkedin.com/in/janedoe"
+    assert contact.github == "https://github.com/janedoe"
+    assert contact.portfolio == "https://www.janedoe.dev"
+
+
+def test_name_is_only_guessed_on_request():
+    assert extract_contact_info(RESUME_HEADER).name is None
+
+
+def test_hyperlinks_take_precedence():
+    contact = extract_contact_info(
+        "Call me", ["tel:+44 20 7946 0958", "https://www.linkedin.com/in/jd"]
+    )
+    assert contact.phone == "+44 20 7946 0958"
+    assert contact.linkedin == "https://www.linkedin.com/in/jd"
+    assert contact.portfolio is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Acme Corp (2015 - 2019)",
+        "Worked 2016.08 - 2020.05 at Acme",
+        "Joined 2020-05-01",
+        "Employee ID 1234567890",
+        "Call 12345",
+    ],
+)
+def test_dates_and_bare_numbers_are_not_phones(text):
+    assert extract_contact_info(text).phone is None
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("RESUME\nJohn Smith\nEngineer", "John Smith"),
+        ("john smith", None),
+        ("Jane Doe jane@example.com", None),
+    ],
+)
+def test_guess_name(text, expected):
+    assert guess_name(text) == expected
+
+
+def test_prefillable_fields_override_the_llm():
+    generated = ContactInformation(email="llm@example.com", github=None)
+    prefilled = ContactInformation(
+        email="rules@example.com", github="https://github.com/jd"
+    )
+    merged = merge_contact_info(generated, prefilled)
+    assert merged.email == "rules@example.com"
+    assert merged.github == "https://github.com/jd"
+    assert prefilled_fields(prefilled) == ["email", "github"]
+
+
+def test_phone_and_portfolio_only_fill_blanks():
+    prefilled = ContactInformation(
+        phone="999 888 7777", portfolio="https://rules.example.com"
+    )
+    generated = ContactInformation(
+        phone="111 222 3333", portfolio="https://llm.example.com"
+    )
+    merged = merge_contact_info(generated, prefilled)
+    assert merged.phone == "111 222 3333"
+    assert merged.portfolio == "https://llm.example.com"
+    assert prefilled_fields(prefilled) == []
+
+    merged = merge_contact_info(ContactInformation(), prefilled)
+    assert merged.phone == "999 888 7777"
+    assert merged.portfolio == "https://rules.example.com"
+
+
+def test_merge_leaves_the_llm_result_untouched():
+    generated = ContactInformation(email="llm@example.com")
+    merged = merge_contact_info(generated, ContactInformation(email="r@example.com"))
+    assert generated.email == "llm@example.com"
+    assert merge_contact_info(generated, None) is generated
@@ -0,0 +1,43 @@
+from datetime import date
+import pytest
+from app.utils.dates import parse_duration_interval, parse_duration_years
+
+
+@pytest.mark.parametrize(
+    "duration,years",
+    [
+        ("2018 - 2021", 3.0),
+        ("Jan 2019 - Dec 2019", 1.0),
+        ("Sept. 2019 to March 2020", 7 / 12),
+        ("06/2019 - 08/2022", 3 + 3 / 12),
+        ("2016.08 - 2020.05", 3 + 10 / 12),
+        ("05-2019 - 06-2020", 1 + 2 / 12),
+        ("3 years", 3.0),
+        ("18 months", 1.5),
+        ("2 yrs 6 mos", 2.5),
+        ("5+ years", 5.0),
+    ],
+)
+def test_parse_duration_years(duration, years):
+    assert parse_duration_years(duration) == pytest.approx(years)
+
+
+@pytest.mark.parametrize("duration", ["", "Full time", "2021", "2021 - 2019"])
+def test_uninterpretable_durations_are_zero(duration):
+    assert parse_duration_years(duration) == 0.0
+
+
+def test_open_ended_range_runs_to_the_current_month():
+    today = date.today()
+    start, end = parse_duration_interval(f"Jan {today.year - 2} - Present")
+    assert start == today.year - 2
+    assert end == pytest.approx(today.year + today.month / 12)
+
+
+def test_interval_months_and_reversed_ranges():
+    assert parse_duration_interval("Mar 2020 - Feb 2021") == pytest.approx(
+        (2020 + 2 / 12, 2021 + 2 / 12)
+    )
+    assert parse_duration_interval("2021 - 2019") is None
+    assert parse_duration_interval("13/2019 - 2020") == pytest.approx((2019, 2020))
+    assert parse_duration_interval("3 years") is None
@@ -0,0 +1,119 @@
+import json
+import os
+from app.ingest import (
+    ResultWriter,
+    _pending,
+    checkpointed_output_bytes,
+    document_id_for,
+    find_documents,
+    read_checkpoint,
+    truncate_output,
+)
+
+
+def _run(output_path, checkpoint_path, batches, batch_size=2):
+    """Write dry-run records through a ResultWriter, flushing at the end."""
+    with open(output_path, "a", encoding="utf-8") as output, open(
+        checkpoint_path, "a", encoding="utf-8"
+    ) as checkpoint:
+        writer = ResultWriter(output, checkpoint, False, batch_size)
+        for path in batches:
+            writer.add(path, record={"file_name": path, "characters": 1, "text": "x"})
+        writer.flush()
+        return output.name
+
+
+def test_find_documents_is_sorted_and_filtered(tmp_path):
+    for name in ["b/2.pdf", "b/1.DOCX", "a.pdf", "notes.txt", "c/skip.png"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    assert find_documents(str(tmp_path)) == [
+        "a.pdf",
+        os.path.join("b", "1.DOCX"),
+        os.path.join("b", "2.pdf"),
+    ]
+
+
+def test_document_ids_are_stable_per_path():
+    assert document_id_for("b/1.pdf") == document_id_for("b/1.pdf")
+    assert document_id_for("b/1.pdf") != document_id_for("b/2.pdf")
+
+
+def test_checkpoint_records_finished_files_and_output_size(tmp_path):
+    output = str(tmp_path / "out.jsonl")
+    checkpoint = str(tmp_path / "checkpoint.jsonl")
+    name = _run(output, checkpoint, ["a.pdf", "b.pdf", "c.pdf"])
+
+    assert read_checkpoint(checkpoint) == {
+        "a.pdf": "done",
+        "b.pdf": "done",
+        "c.pdf": "done",
+    }
+    assert checkpointed_output_bytes(checkpoint, name) == os.path.getsize(output)
+    assert checkpointed_output_bytes(checkpoint, "other.jsonl") is None
+    with open(output, encoding="utf-8") as f:
+        assert [json.loads(line)["file_name"] for line in f] == [
+            "a.pdf",
+            "b.pdf",
+            "c.pdf",
+        ]
+
+
+def test_partial_checkpoint_line_is_ignored(tmp_path):
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    checkpoint.write_text(
+        json.dumps({"path": "a.pdf", "status": "done"})
+        + "\n"
+        + json.dumps({"path": "b.pdf", "status": "failed"})
+        + "\n"
+        + '{"path": "c.pd'
+    )
+    assert read_checkpoint(str(checkpoint)) == {"a.pdf": "done", "b.pdf": "failed"}
+    assert read_checkpoint(str(tmp_path / "missing.jsonl")) == {}
+
+
+def test_resume_truncates_output_written_after_the_last_checkpoint(tmp_path):
+    output = str(tmp_path / "out.jsonl")
+    checkpoint = str(tmp_path / "checkpoint.jsonl")
+    name = _run(output, checkpoint, ["a.pdf", "b.pdf"])
+    size = os.path.getsize(output)
+    # A crash after writing a batch but before checkpointing it
+    with open(output, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"file_name": "c.pdf"}) + "\n")
+
+    truncate_output(output, checkpointed_output_bytes(checkpoint, name))
+    assert os.path.getsize(output) == size
+    assert list(
+        _pending(["a.pdf", "b.pdf", "c.pdf"], read_checkpoint(checkpoint), False)
+    ) == ["c.pdf"]
+
+    # The resumed run appends after the truncated output
+    _run(output, checkpoint, ["c.pdf"])
+    with open(output, encoding="utf-8") as f:
+        assert [json.loads(line)["file_name"] for line in f] == [
+            "a.pdf",
+            "b.pdf",
+            "c.pdf",
+        ]
+
+
+def test_checkpoint_before_any_batch_restores_the_original_size(tmp_path):
+    output = tmp_path / "out.jsonl"
+    output.write_text('{"file_name": "earlier.pdf"}\n')
+    checkpoint = str(tmp_path / "checkpoint.jsonl")
+    with open(output, "a", encoding="utf-8") as out, open(
+        checkpoint, "a", encoding="utf-8"
+    ) as ckpt:
+        ResultWriter(out, ckpt, False, 10)
+        out.write('{"file_name": "lost.pdf"}\n')
+
+    truncate_output(str(output), checkpointed_output_bytes(checkpoint, str(output)))
+    assert output.read_text() == '{"file_name": "earlier.pdf"}\n'
+
+
+def test_failed_files_are_retried_on_request():
+    finished = {"a.pdf": "done", "b.pdf": "failed"}
+    paths = ["a.pdf", "b.pdf", "c.pdf"]
+    assert list(_pending(paths, finished, retry_failed=False)) == ["c.pdf"]
+    assert list(_pending(paths, finished, retry_failed=True)) == ["b.pdf", "c.pdf"]
@@ -0,0 +1,62 @@
+from app.models import (
+    Certification,
+    ContactInformation,
+    ResumeData,
+    Skills,
+    WorkExperience,
+)
+from app.services.contact_extractor import extract_contact_info
+from app.services.quality import check_resume
+
+RESUME_TEXT = """Jane Doe
+jane@example.com | +1 415 555 0100 | github.com/janedoe
+
+SKILLS
+Python, SQL
+"""
+
+
+def _result(**contact) -> ResumeData:
+    return ResumeData(
+        contact_information=ContactInformation(name="Jane Doe", **contact),
+        skills=Skills(technical=["Python", "SQL"]),
+    )
+
+
+def test_complete_result_passes():
+    result = _result(
+        email="jane@example.com",
+        phone="+1 415 555 0100",
+        github="https://github.com/janedoe",
+    )
+    assert check_resume(result, RESUME_TEXT) == []
+
+
+def test_contact_fields_are_checked_against_the_llm_output():
+    assert check_resume(_result(), RESUME_TEXT) == [
+        "missing_email",
+        "missing_phone",
+        "missing_github",
+    ]
+
+
+def test_fields_the_prefill_overrides_are_not_checked():
+    prefilled = extract_contact_info(RESUME_TEXT)
+    # The regex phone only fills a blank, so the LLM must still find it
+    assert check_resume(_result(), RESUME_TEXT, prefilled) == ["missing_phone"]
+
+
+def test_missing_sections_and_malformed_entries():
+    result = ResumeData(
+        contact_information=ContactInformation(name="Jane Doe"),
+        work_experience=[
+            WorkExperience(company="Acme", role="Engineer", duration="2021 - 2019")
+        ],
+        certifications=[Certification(name=" ")],
+    )
+    issues = check_resume(result, "Jane Doe\n\nSKILLS\nPython\n")
+    assert issues == [
+        "missing_skills",
+        "malformed_work_experience",
+        "malformed_certifications",
+    ]
@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from app.utils import rate_limiter
+from app.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+def test_disabled_limiter_never_waits(clock):
+    limiter = RateLimiter(0)
+    assert not limiter.enabled
+    assert limiter.acquire(10**6) == 0.0
+    assert clock.slept == []
+
+
+def test_full_bucket_then_waits_for_refill(clock):
+    limiter = RateLimiter(60)  # one token per second
+    assert limiter.acquire(60) == 0.0
+    assert limiter.acquire(30) == pytest.approx(30.0)
+    assert clock.slept == [pytest.approx(30.0)]
+
+
+def test_bucket_refills_over_time_up_to_capacity(clock):
+    limiter = RateLimiter(60)
+    limiter.acquire(60)
+    clock.now += 10
+    assert limiter.acquire(10) == 0.0
+    assert limiter.acquire(1) == pytest.approx(1.0)
+
+    # Idle time beyond a full bucket is not banked
+    clock.now += 3600
+    assert limiter.acquire(60) == 0.0
+    assert limiter.acquire(1) == pytest.approx(1.0)
+
+
+def test_oversized_requests_are_clamped_to_capacity(clock):
+    limiter = RateLimiter(60)
+    assert limiter.acquire(1000) == 0.0
+    assert limiter.acquire(1000) == pytest.approx(60.0)
+
+
+def test_adjust_returns_and_charges_tokens(clock):
+    limiter = RateLimiter(60)
+    limiter.acquire(60)
+    limiter.adjust(-30)
+    assert limiter.acquire(30) == 0.0
+    limiter.adjust(15)
+    assert limiter.acquire(5) == pytest.approx(20.0)
+
+
+def test_async_acquire_waits_for_the_same_bucket(clock):
+    limiter = RateLimiter(6000)  # 100 tokens per second
+    assert asyncio.run(limiter.aacquire(6000)) == 0.0
+    assert asyncio.run(limiter.aacquire(5)) == pytest.approx(0.05)
+    assert clock.slept == []
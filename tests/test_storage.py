@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+import pytest
+from app.models import (
+    ContactInformation,
+    Education,
+    ResumeData,
+    ResumeResponse,
+    Skills,
+    WorkExperience,
+)
+from app.storage import ResumeStorage, SQLiteResumeStorage, query_criteria
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteResumeStorage(path=str(tmp_path / "resumes.db"))
+    return ResumeStorage()
+
+
+def _resume(
+    number: int,
+    skills: Optional[List[str]] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+) -> ResumeResponse:
+    data = ResumeData(
+        contact_information=ContactInformation(
+            name=f"Candidate {number}", location=location
+        ),
+        skills=Skills(technical=skills or []),
+        work_experience=(
+            [WorkExperience(company=company, role="Engineer", duration="2020 - 2022")]
+            if company
+            else None
+        ),
+        education=[Education(degree="BSc", institution="MIT")],
+    )
+    return ResumeResponse(
+        document_id=f"doc-{number}",
+        data=data,
+        extracted_at=START + timedelta(minutes=number),
+        file_name=f"resume-{number}.pdf",
+    )
+
+
+def _ids(resumes: List[ResumeResponse]) -> List[str]:
+    return [resume.document_id for resume in resumes]
+
+
+def test_save_and_get(storage):
+    resume = _resume(1)
+    storage.save(resume.document_id, resume)
+    assert storage.exists("doc-1")
+    assert not storage.exists("doc-2")
+    assert storage.get("doc-1") == resume
+    assert storage.get("doc-2") is None
+    assert ResumeResponse.model_validate_json(storage.get_json("doc-1")) == resume
+
+
+def test_get_many_skips_unknown_ids(storage):
+    storage.save_many([_resume(i) for i in range(3)])
+    assert sorted(_ids(storage.get_many(["doc-2", "missing", "doc-0"]))) == [
+        "doc-0",
+        "doc-2",
+    ]
+    assert sorted(
+        document_id for document_id, _ in storage.iter_json(["doc-1", "x"])
+    ) == ["doc-1"]
+
+
+def test_list_pages_newest_first(storage):
+    storage.save_many([_resume(i) for i in range(5)])
+    total, page = storage.list(offset=0, limit=2)
+    assert total == 5
+    assert _ids(page) == ["doc-4", "doc-3"]
+    total, page = storage.list(offset=4, limit=2)
+    assert total == 5
+    assert _ids(page) == ["doc-0"]
+    assert storage.list(offset=10, limit=2) == (5, [])
+
+
+def test_saving_again_replaces_the_document(storage):
+    storage.save("doc-1", _resume(1))
+    storage.save_many([_resume(1, skills=["Go"])])
+    assert storage.count() == 1
+    assert storage.get("doc-1").data.skills.technical == ["Go"]
+
+
+def test_iter_all_returns_every_resume(storage):
+    storage.save_many([_resume(i) for i in range(7)])
+    assert sorted(_ids(storage.iter_all(batch_size=3))) == [
+        f"doc-{i}" for i in range(7)
+    ]
+
+
+def test_sqlite_storage_persists_across_instances(tmp_path):
+    path = str(tmp_path / "resumes.db")
+    SQLiteResumeStorage(path=path).save_many([_resume(i) for i in range(3)])
+    reopened = SQLiteResumeStorage(path=path)
+    assert reopened.count() == 3
+    assert reopened.get("doc-2").file_name == "resume-2.pdf"
+
+
+def _indexed(storage):
+    storage.save_many(
+        [
+            _resume(1, skills=["Python", "SQL"], company="Acme", location="Berlin"),
+            _resume(2, skills=["python "], company="Globex", location="Paris"),
+            _resume(3, skills=["Go"], company="Acme"),
+            _resume(4, skills=["Python", "Go"], company="Initech"),
+        ]
+    )
+
+
+def test_query_matches_all_terms_case_insensitively(storage):
+    _indexed(storage)
+    total, page = storage.query({"skill": ["PYTHON"]})
+    assert total == 3
+    assert _ids(page) == ["doc-4", "doc-2", "doc-1"]
+    total, page = storage.query({"skill": ["python", "go"]})
+    assert (total, _ids(page)) == (1, ["doc-4"])
+    total, page = storage.query({"skill": ["python"], "company": ["acme"]})
+    assert (total, _ids(page)) == (1, ["doc-1"])
+
+
+def test_query_any_and_pagination(storage):
+    _indexed(storage)
+    total, page = storage.query(
+        {"company": ["Acme"], "location": ["Paris"]}, match="any", limit=2
+    )
+    assert total == 3
+    assert _ids(page) == ["doc-3", "doc-2"]
+    total, page = storage.query(
+        {"company": ["Acme"], "location": ["Paris"]}, match="any", offset=2
+    )
+    assert (total, _ids(page)) == (3, ["doc-1"])
+
+
+def test_query_without_matches_or_filters(storage):
+    _indexed(storage)
+    assert storage.query({"skill": ["cobol"]}) == (0, [])
+    total, page = storage.query({"skill": [" "]}, limit=1)
+    assert (total, _ids(page)) == (4, ["doc-4"])
+
+
+def test_replacing_a_document_updates_its_postings(storage):
+    _indexed(storage)
+    storage.save("doc-3", _resume(3, skills=["Rust"], company="Acme"))
+    assert storage.query({"skill": ["go"]})[0] == 1
+    assert _ids(storage.query({"skill": ["rust"]})[1]) == ["doc-3"]
+
+
+def test_query_criteria_rejects_unindexed_fields():
+    assert query_criteria({"skill": ["Python", "python", " "]}) == [("skill", "python")]
+    with pytest.raises(ValueError):
+        query_criteria({"email": ["jane@example.com"]})
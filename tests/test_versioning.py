@@ -0,0 +1,154 @@
+from datetime import datetime
+import pytest
+from app.models import (
+    ContactInformation,
+    Education,
+    ResumeData,
+    ResumeResponse,
+    Skills,
+    WorkExperience,
+)
+from app.services import versioning
+from app.services.versioning import UNKNOWN_SECTION, plan_revision, record_version
+from app.storage import ResumeStorage, SQLiteResumeStorage
+
+HEADER = "Jane Doe\njane@example.com\n"
+EXPERIENCE = "EXPERIENCE\nEngineer, Acme, 2019 - 2022\nBuilt things\n"
+EDUCATION = "EDUCATION\nBSc, MIT, 2018\n"
+SKILLS = "SKILLS\nPython, SQL\n"
+RESUME = "\n".join([HEADER, EXPERIENCE, EDUCATION, SKILLS])
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = ResumeStorage()
+    monkeypatch.setattr(versioning, "resume_storage", storage)
+    return storage
+
+
+def _store(storage, text: str, document_id: str, candidate_id: str = "Cand-1"):
+    """Plan, "parse" and record an upload the way the upload endpoint does."""
+    revision = plan_revision(text, [], candidate_id)
+    data = ResumeData(
+        contact_information=ContactInformation(name="Jane Doe"),
+        work_experience=[
+            WorkExperience(company="Acme", role="Engineer", duration="2019 - 2022")
+        ],
+        education=[Education(degree="BSc", institution="MIT")],
+        skills=Skills(technical=["Python", "SQL"]),
+    )
+    storage.save(
+        document_id,
+        ResumeResponse(
+            document_id=document_id,
+            data=data,
+            extracted_at=datetime.now(),
+            file_name=f"{document_id}.pdf",
+        ),
+    )
+    return revision, record_version(revision, document_id, f"{document_id}.pdf")
+
+
+def test_without_candidate_id_uploads_are_not_versioned(storage):
+    revision = plan_revision(RESUME, [])
+    assert revision.candidate_id is None
+    assert revision.parse == "full"
+    assert record_version(revision, "doc-1", "doc-1.pdf") is None
+
+
+def test_email_keys_uploads_only_when_enabled(storage, monkeypatch):
+    monkeypatch.setattr(versioning, "VERSIONING_ENABLED", True)
+    assert plan_revision(RESUME, []).candidate_id == "jane@example.com"
+    # An explicit candidate ID always wins over the email
+    assert plan_revision(RESUME, [], " Cand-2 ").candidate_id == "cand-2"
+
+
+def test_first_upload_is_parsed_in_full(storage):
+    revision, version = _store(storage, RESUME, "doc-1")
+    assert revision.candidate_id == "cand-1"
+    assert revision.parse == "full"
+    assert version.version == 1
+    assert version.reparsed_sections == ["header", "experience", "education", "skills"]
+    assert set(version.section_hashes) == set(revision.texts)
+
+
+def test_unchanged_upload_reparses_nothing(storage):
+    _store(storage, RESUME, "doc-1")
+    # Whitespace differences do not count as changes
+    revision = plan_revision(RESUME.replace("\n", "\n\n"), [], "CAND-1")
+    assert revision.parse == "unchanged"
+    assert revision.reparsed_sections == []
+    assert revision.base.skills.technical == ["Python", "SQL"]
+
+
+def test_changed_section_is_reparsed_alone(storage):
+    _store(storage, RESUME, "doc-1")
+    text = RESUME.replace("Python, SQL", "Python, SQL, Rust")
+    revision, version = _store(storage, text, "doc-2")
+    assert revision.parse == "incremental"
+    assert revision.changed == ["skills"]
+    assert version.version == 2
+    assert version.reparsed_sections == ["skills"]
+
+
+def test_removed_section_is_cleared_on_merge(storage):
+    _store(storage, RESUME, "doc-1")
+    revision = plan_revision(
+        "\n".join([HEADER, EXPERIENCE, SKILLS.replace("SQL", "Go")]), [], "cand-1"
+    )
+    assert revision.parse == "incremental"
+    assert revision.changed == ["skills"]
+    assert revision.removed == ["education"]
+
+    data = revision.merge({"skills": Skills(technical=["Python", "Go"])})
+    assert data.skills.technical == ["Python", "Go"]
+    assert not data.education
+    assert data.work_experience[0].company == "Acme"
+    assert data.contact_information.email == "jane@example.com"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Every section changed
+        "\n".join(
+            [
+                "John Roe\njohn@example.com\n",
+                EXPERIENCE.replace("Acme", "Globex"),
+                EDUCATION.replace("MIT", "CMU"),
+                SKILLS.replace("SQL", "Go"),
+            ]
+        ),
+        # Text under a heading no section prompt covers
+        RESUME + "\nHOBBIES\nChess\n",
+    ],
+)
+def test_large_or_uncovered_changes_are_parsed_in_full(storage, text):
+    _store(storage, RESUME, "doc-1")
+    revision = plan_revision(text, [], "cand-1")
+    assert revision.parse == "full"
+    assert revision.base is None
+
+
+def test_missing_previous_document_forces_a_full_parse(storage):
+    _store(storage, RESUME, "doc-1")
+    storage._storage.pop("doc-1")
+    assert plan_revision(RESUME, [], "cand-1").parse == "full"
+
+
+def test_unknown_section_is_never_reparsed_on_its_own(storage):
+    revision = plan_revision(RESUME + "\nHOBBIES\nChess\n", [], "cand-1")
+    assert UNKNOWN_SECTION in revision.texts
+    assert UNKNOWN_SECTION not in revision.reparsed_sections
+
+
+def test_sqlite_versions_are_numbered_per_candidate(tmp_path, monkeypatch):
+    storage = SQLiteResumeStorage(path=str(tmp_path / "resumes.db"))
+    monkeypatch.setattr(versioning, "resume_storage", storage)
+    _store(storage, RESUME, "doc-1")
+    _store(storage, RESUME, "doc-2", candidate_id="other")
+    _, version = _store(storage, RESUME, "doc-3")
+    assert version.version == 2
+    history = storage.list_versions("cand-1")
+    assert [v.document_id for v in history] == ["doc-1", "doc-3"]
+    assert [v.parse for v in history] == ["full", "unchanged"]
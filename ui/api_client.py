@@ -0,0 +1,115 @@
+"""HTTP helpers for the UI pages, sharing one pooled session per server process."""
+
+import os
+import time
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+
+# Configuration
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+# Parallel uploads and status polls per batch
+UPLOAD_CONCURRENCY = int(os.getenv("UI_UPLOAD_CONCURRENCY", "8"))
+# Attempts per file while the API's job queue is full (503)
+UPLOAD_ATTEMPTS = 5
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Returns a session whose connection pool fits the upload concurrency."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=UPLOAD_CONCURRENCY, pool_maxsize=UPLOAD_CONCURRENCY
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def api_online() -> bool:
+    """Check the API root, at most every 10 seconds."""
+    try:
+        return get_session().get(f"{API_BASE_URL}/", timeout=2).status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+
+@st.cache_data(max_entries=1000, show_spinner=False)
+def fetch_resume(document_id: str) -> dict:
+    """
+    Fetch a stored resume once; reruns read it from the cache.
+
+    Args:
+        document_id: Unique document identifier
+
+    Returns:
+        ResumeResponse as a dict
+    """
+    response = get_session().get(f"{API_BASE_URL}/api/resume/{document_id}")
+    response.raise_for_status()
+    return response.json()
+
+
+def error_detail(response: requests.Response) -> str:
+    """Returns the API's error detail, or the status line."""
+    try:
+        return response.json().get("detail", response.reason)
+    except ValueError:
+        return f"{response.status_code} {response.reason}"
+
+
+def submit_upload(file_name: str, content: bytes) -> dict:
+    """
+    Queue a file for background parsing.
+
+    Safe to call from worker threads: it does not touch Streamlit state.
+
+    Args:
+        file_name: Original filename
+        content: Raw file content
+
+    Returns:
+        JobStatus as a dict, or {"status": "failed", "error": ...}
+    """
+    for attempt in range(UPLOAD_ATTEMPTS):
+        try:
+            response = get_session().post(
+                f"{API_BASE_URL}/api/upload",
+                params={"background": "true"},
+                files={"file": (file_name, content)},
+                timeout=60,
+            )
+        except requests.exceptions.RequestException as e:
+            return {"status": "failed", "error": str(e)}
+        if response.status_code == 202:
+            return response.json()
+        if response.status_code != 503 or attempt == UPLOAD_ATTEMPTS - 1:
+            return {"status": "failed", "error": error_detail(response)}
+        # The job queue is full; wait for workers to drain it
+        time.sleep(2**attempt)
+
+
+def get_job(job_id: str) -> dict:
+    """
+    Fetch a job's status.
+
+    The embedded result is dropped; finished resumes are read through
+    fetch_resume so that reruns are served from its cache.
+
+    Args:
+        job_id: Job identifier returned by submit_upload
+
+    Returns:
+        JobStatus as a dict, or {"status": "failed", "error": ...}
+    """
+    try:
+        response = get_session().get(f"{API_BASE_URL}/api/jobs/{job_id}", timeout=10)
+    except requests.exceptions.RequestException as e:
+        # Treat network hiccups as still pending; the next poll retries
+        return {"status": "running", "error": str(e)}
+    if response.status_code != 200:
+        return {"status": "failed", "error": error_detail(response)}
+    job = response.json()
+    job.pop("result", None)
+    return job
@@ -0,0 +1,137 @@
+"""Renderers for parsed resume sections, shared by the UI pages."""
+
+import streamlit as st
+
+# Display order of the streamed ResumeData fields
+SECTION_ORDER = [
+    "contact_information",
+    "professional_summary",
+    "work_experience",
+    "projects",
+    "education",
+    "skills",
+    "certifications",
+]
+
+
+def render_contact(contact):
+    if not contact:
+        return
+    st.subheader("👤 Contact Information")
+    col1, col2 = st.columns(2)
+    with col1:
+        if contact.get("name"):
+            st.markdown(f"**Name:** {contact['name']}")
+        if contact.get("email"):
+            st.markdown(f"**Email:** {contact['email']}")
+        if contact.get("phone"):
+            st.markdown(f"**Phone:** {contact['phone']}")
+    with col2:
+        if contact.get("location"):
+            st.markdown(f"**Location:** {contact['location']}")
+        if contact.get("linkedin"):
+            st.markdown(f"**LinkedIn:** {contact['linkedin']}")
+        if contact.get("github"):
+            st.markdown(f"**GitHub:** {contact['github']}")
+
+
+def render_summary(summary):
+    if not summary:
+        return
+    st.subheader("📝 Professional Summary")
+    st.markdown(summary)
+
+
+def render_experience(exp):
+    with st.expander(f"{exp['role']} at {exp['company']}", expanded=True):
+        st.markdown(f"**Duration:** {exp['duration']}")
+        if exp.get("location"):
+            st.markdown(f"**Location:** {exp['location']}")
+        if exp.get("responsibilities"):
+            st.markdown("**Responsibilities:**")
+            for resp in exp["responsibilities"]:
+                st.markdown(f"- {resp}")
+
+
+def render_projects(projects):
+    if not projects:
+        return
+    st.subheader("🚀 Projects")
+    for proj in projects:
+        with st.expander(f"{proj.get('name', 'Project')}", expanded=False):
+            if proj.get("description"):
+                st.markdown(f"**Description:** {proj['description']}")
+            if proj.get("aim"):
+                st.markdown(f"**Aim:** {proj['aim']}")
+            if proj.get("skills_used"):
+                st.markdown(f"**Skills:** {', '.join(proj['skills_used'])}")
+
+
+def render_education(education):
+    if not education:
+        return
+    st.subheader("🎓 Education")
+    for edu in education:
+        with st.expander(
+            f"{edu.get('degree', 'Degree')} - {edu.get('institution', 'Institution')}",
+            expanded=True,
+        ):
+            if edu.get("year"):
+                st.markdown(f"**Year:** {edu['year']}")
+            if edu.get("location"):
+                st.markdown(f"**Location:** {edu['location']}")
+
+
+def render_skills(skills):
+    if not skills:
+        return
+    st.subheader("🛠️ Skills")
+    col1, col2 = st.columns(2)
+    with col1:
+        if skills.get("technical"):
+            st.markdown("**Technical Skills:**")
+            st.markdown(", ".join(skills["technical"]))
+    with col2:
+        if skills.get("soft"):
+            st.markdown("**Soft Skills:**")
+            st.markdown(", ".join(skills["soft"]))
+
+
+def render_certifications(certifications):
+    if not certifications:
+        return
+    st.subheader("🏆 Certifications")
+    for cert in certifications:
+        cert_text = cert["name"]
+        if cert.get("issuer"):
+            cert_text += f" - {cert['issuer']}"
+        if cert.get("date"):
+            cert_text += f" ({cert['date']})"
+        st.markdown(f"- {cert_text}")
+
+
+SECTION_RENDERERS = {
+    "contact_information": render_contact,
+    "professional_summary": render_summary,
+    "projects": render_projects,
+    "education": render_education,
+    "skills": render_skills,
+    "certifications": render_certifications,
+}
+
+
+def render_work_experience(experience):
+    if not experience:
+        return
+    st.subheader("💼 Work Experience")
+    for exp in experience:
+        render_experience(exp)
+
+
+def render_resume(data):
+    """Render every section of a parsed ResumeData dict in display order."""
+    for name in SECTION_ORDER:
+        if name == "work_experience":
+            render_work_experience(data.get(name))
+        else:
+            SECTION_RENDERERS[name](data.get(name))
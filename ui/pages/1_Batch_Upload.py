@@ -0,0 +1,132 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import streamlit as st
+from api_client import (
+    UPLOAD_CONCURRENCY,
+    api_online,
+    fetch_resume,
+    get_job,
+    submit_upload,
+)
+from components import render_resume
+
+# Seconds between job status polls
+POLL_INTERVAL = 1.0
+PENDING = ("queued", "running")
+
+
+def summary_row(job):
+    """One table row per file, filled in from the cached resume once done."""
+    row = {
+        "File": job["file_name"],
+        "Status": job["status"],
+        "Name": "",
+        "Email": "",
+        "Jobs": None,
+        "Error": job.get("error") or "",
+    }
+    if job["status"] == "done":
+        data = fetch_resume(job["document_id"])["data"]
+        contact = data.get("contact_information") or {}
+        row["Name"] = contact.get("name") or ""
+        row["Email"] = contact.get("email") or ""
+        row["Jobs"] = len(data.get("work_experience") or [])
+    return row
+
+
+st.set_page_config(page_title="Batch Upload", page_icon="📦", layout="wide")
+
+st.title("📦 Batch Upload")
+st.markdown(
+    "Upload many resumes at once; each row fills in as soon as its resume is parsed"
+)
+
+# Jobs of this session survive reruns; results come from the fetch cache
+jobs = st.session_state.setdefault("batch_jobs", [])
+
+uploaded_files = st.file_uploader(
+    "Choose resume files",
+    type=["pdf", "docx", "doc"],
+    accept_multiple_files=True,
+    help="Upload PDF or DOCX resume files",
+)
+
+if uploaded_files and st.button(
+    f"🚀 Parse {len(uploaded_files)} Resumes", type="primary"
+):
+    # Queue every file as a background job, several uploads at a time
+    progress = st.progress(0.0, text="Uploading...")
+    with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as pool:
+        futures = {
+            pool.submit(submit_upload, file.name, file.getvalue()): file.name
+            for file in uploaded_files
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = future.result()
+            job.setdefault("file_name", futures[future])
+            jobs.append(job)
+            progress.progress(
+                done / len(futures), text=f"Uploaded {done}/{len(futures)} files"
+            )
+    progress.empty()
+
+if jobs:
+    st.header("Progress")
+    progress = st.empty()
+    table = st.empty()
+
+    def refresh():
+        finished = sum(job["status"] not in PENDING for job in jobs)
+        progress.progress(
+            finished / len(jobs), text=f"{finished}/{len(jobs)} resumes processed"
+        )
+        table.dataframe(
+            [summary_row(job) for job in jobs], width="stretch", hide_index=True
+        )
+
+    refresh()
+    # Poll the unfinished jobs concurrently until all are done or failed
+    with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as pool:
+        while any(job["status"] in PENDING for job in jobs):
+            time.sleep(POLL_INTERVAL)
+            pending = [job for job in jobs if job["status"] in PENDING]
+            statuses = pool.map(get_job, [job["job_id"] for job in pending])
+            for job, status in zip(pending, statuses):
+                job["status"] = status["status"]
+                job["error"] = status.get("error")
+            refresh()
+
+    done = [job for job in jobs if job["status"] == "done"]
+    if done:
+        st.header("Extracted Information")
+        labels = {f"{job['file_name']} ({job['document_id'][:8]})": job for job in done}
+        choice = st.selectbox("Resume", list(labels))
+        resume = fetch_resume(labels[choice]["document_id"])
+        st.markdown(
+            f"**Document ID:** `{resume['document_id']}`  \n"
+            f"**Extracted At:** {resume['extracted_at']}"
+        )
+        render_resume(resume["data"])
+
+        st.divider()
+        st.download_button(
+            label="📥 Download All JSON",
+            data=json.dumps(
+                [fetch_resume(job["document_id"]) for job in done], indent=2
+            ),
+            file_name="resumes.json",
+            mime="application/json",
+        )
+
+    if st.button("🗑️ Clear Batch"):
+        st.session_state["batch_jobs"] = []
+        st.rerun()
+
+# Sidebar
+with st.sidebar:
+    st.header("🔧 API Status")
+    if api_online():
+        st.success("✅ API Connected")
+    else:
+        st.error("❌ API Offline")
@@ -1,9 +1,20 @@
 import streamlit as st
 import requests
 import json
+from api_client import API_BASE_URL, api_online, get_session
+from components import SECTION_ORDER, SECTION_RENDERERS, render_experience
+
+
+def iter_events(response):
+    """Yield (event, data) pairs from a server-sent events response."""
+    event = "message"
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith("event:"):
+            event = line[len("event:") :].strip()
+        elif line.startswith("data:"):
+            yield event, json.loads(line[len("data:") :])
+            event = "message"
 
-# Configuration
-API_BASE_URL = "http://localhost:8000"
 
 st.set_page_config(page_title="Resume Parser", page_icon="📄", layout="wide")
 
@@ -28,143 +39,75 @@ if uploaded_file is not None:
 
     # Parse button
     if st.button("🚀 Parse Resume", type="primary"):
-        with st.spinner("Parsing resume... This may take a few seconds"):
-            try:
-                # Send file to API
-                files = {"file": (uploaded_file.name, uploaded_file.getvalue())}
-                response = requests.post(f"{API_BASE_URL}/api/upload", files=files)
-
-                if response.status_code == 201:
-                    data = response.json()
-
-                    # Display success message
-                    st.success("✅ Resume parsed successfully!")
-
-                    # Document ID
-                    st.markdown(f"**Document ID:** `{data['document_id']}`")
-                    st.markdown(f"**Extracted At:** {data['extracted_at']}")
-
-                    # Display extracted data
-                    st.header("Extracted Information")
-
-                    resume_data = data["data"]
-
-                    # Contact Information
-                    if resume_data.get("contact_information"):
-                        st.subheader("👤 Contact Information")
-                        contact = resume_data["contact_information"]
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            if contact.get("name"):
-                                st.markdown(f"**Name:** {contact['name']}")
-                            if contact.get("email"):
-                                st.markdown(f"**Email:** {contact['email']}")
-                            if contact.get("phone"):
-                                st.markdown(f"**Phone:** {contact['phone']}")
-                        with col2:
-                            if contact.get("location"):
-                                st.markdown(f"**Location:** {contact['location']}")
-                            if contact.get("linkedin"):
-                                st.markdown(f"**LinkedIn:** {contact['linkedin']}")
-                            if contact.get("github"):
-                                st.markdown(f"**GitHub:** {contact['github']}")
-
-                    # Professional Summary
-                    if resume_data.get("professional_summary"):
-                        st.subheader("📝 Professional Summary")
-                        st.markdown(resume_data["professional_summary"])
-
-                    # Work Experience
-                    if resume_data.get("work_experience"):
-                        st.subheader("💼 Work Experience")
-                        for exp in resume_data["work_experience"]:
-                            with st.expander(
-                                f"{exp['role']} at {exp['company']}", expanded=True
-                            ):
-                                st.markdown(f"**Duration:** {exp['duration']}")
-                                if exp.get("location"):
-                                    st.markdown(f"**Location:** {exp['location']}")
-                                if exp.get("responsibilities"):
-                                    st.markdown("**Responsibilities:**")
-                                    for resp in exp["responsibilities"]:
-                                        st.markdown(f"- {resp}")
-
-                    # Projects
-                    if resume_data.get("projects"):
-                        st.subheader("🚀 Projects")
-                        for proj in resume_data["projects"]:
-                            with st.expander(
-                                f"{proj.get('name', 'Project')}", expanded=False
-                            ):
-                                if proj.get("description"):
-                                    st.markdown(
-                                        f"**Description:** {proj['description']}"
-                                    )
-                                if proj.get("aim"):
-                                    st.markdown(f"**Aim:** {proj['aim']}")
-                                if proj.get("skills_used"):
-                                    st.markdown(
-                                        f"**Skills:** {', '.join(proj['skills_used'])}"
-                                    )
-
-                    # Education
-                    if resume_data.get("education"):
-                        st.subheader("🎓 Education")
-                        for edu in resume_data["education"]:
-                            with st.expander(
-                                f"{edu.get('degree', 'Degree')} - {edu.get('institution', 'Institution')}",
-                                expanded=True,
-                            ):
-                                if edu.get("year"):
-                                    st.markdown(f"**Year:** {edu['year']}")
-                                if edu.get("location"):
-                                    st.markdown(f"**Location:** {edu['location']}")
-
-                    # Skills
-                    if resume_data.get("skills"):
-                        st.subheader("🛠️ Skills")
-                        skills = resume_data["skills"]
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            if skills.get("technical"):
-                                st.markdown("**Technical Skills:**")
-                                st.markdown(", ".join(skills["technical"]))
-                        with col2:
-                            if skills.get("soft"):
-                                st.markdown("**Soft Skills:**")
-                                st.markdown(", ".join(skills["soft"]))
-
-                    # Certifications
-                    if resume_data.get("certifications"):
-                        st.subheader("🏆 Certifications")
-                        for cert in resume_data["certifications"]:
-                            cert_text = cert["name"]
-                            if cert.get("issuer"):
-                                cert_text += f" - {cert['issuer']}"
-                            if cert.get("date"):
-                                cert_text += f" ({cert['date']})"
-                            st.markdown(f"- {cert_text}")
-
-                    # Download JSON
-                    st.divider()
-                    st.download_button(
-                        label="📥 Download JSON",
-                        data=json.dumps(data, indent=2),
-                        file_name=f"resume_{data['document_id']}.json",
-                        mime="application/json",
-                    )
-
-                else:
-                    st.error(
-                        f"❌ Error: {response.json().get('detail', 'Unknown error')}"
-                    )
-
-            except requests.exceptions.ConnectionError:
-                st.error(
-                    "❌ Cannot connect to API. Please ensure the FastAPI server is running at http://localhost:8000"
+        status_box = st.empty()
+        status_box.info("⏳ Parsing resume... sections appear as they are extracted")
+        try:
+            # Stream the parse so each section shows up as soon as it is ready
+            files = {"file": (uploaded_file.name, uploaded_file.getvalue())}
+            response = get_session().post(
+                f"{API_BASE_URL}/api/upload/stream", files=files, stream=True
+            )
+
+            if response.status_code == 200:
+                header = st.empty()
+                st.header("Extracted Information")
+                # One placeholder per section keeps the display order fixed
+                sections = {name: st.empty() for name in SECTION_ORDER}
+                jobs = 0
+                experience = None
+
+                for event, payload in iter_events(response):
+                    if event == "document":
+                        header.markdown(f"**Document ID:** `{payload['document_id']}`")
+                    elif event == "work_experience":
+                        if experience is None:
+                            experience = sections["work_experience"].container()
+                            experience.subheader("💼 Work Experience")
+                        with experience:
+                            render_experience(payload["value"])
+                        jobs += 1
+                    elif event == "field":
+                        name = payload["field"]
+                        if name == "work_experience":
+                            # Entries were rendered as they arrived
+                            if jobs == 0 and payload["value"]:
+                                with sections[name].container():
+                                    st.subheader("💼 Work Experience")
+                                    for exp in payload["value"]:
+                                        render_experience(exp)
+                        elif name in SECTION_RENDERERS:
+                            with sections[name].container():
+                                SECTION_RENDERERS[name](payload["value"])
+                    elif event == "result":
+                        data = payload
+                        status_box.success("✅ Resume parsed successfully!")
+                        header.markdown(
+                            f"**Document ID:** `{data['document_id']}`  \n"
+                            f"**Extracted At:** {data['extracted_at']}"
+                        )
+
+                        # Download JSON
+                        st.divider()
+                        st.download_button(
+                            label="📥 Download JSON",
+                            data=json.dumps(data, indent=2),
+                            file_name=f"resume_{data['document_id']}.json",
+                            mime="application/json",
+                        )
+                    elif event == "error":
+                        status_box.error(f"❌ Error: {payload['detail']}")
+
+            else:
+                status_box.error(
+                    f"❌ Error: {response.json().get('detail', 'Unknown error')}"
                 )
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+
+        except requests.exceptions.ConnectionError:
+            status_box.error(
+                "❌ Cannot connect to API. Please ensure the FastAPI server is running at http://localhost:8000"
+            )
+        except Exception as e:
+            status_box.error(f"❌ Error: {str(e)}")
 
 # Sidebar
 with st.sidebar:
@@ -175,16 +118,14 @@ with st.sidebar:
     **How to use:**
     1. Upload your resume
     2. Click "Parse Resume"
-    3. View extracted data
+    3. View extracted data as it streams in
     4. Download JSON if needed
+
+    Use the **Batch Upload** page to parse many resumes at once.
     """)
 
     st.header("🔧 API Status")
-    try:
-        response = requests.get(f"{API_BASE_URL}/", timeout=2)
-        if response.status_code == 200:
-            st.success("✅ API Connected")
-        else:
-            st.error("❌ API Error")
-    except Exception:
+    if api_online():
+        st.success("✅ API Connected")
+    else:
         st.error("❌ API Offline")